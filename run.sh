@@ -11,6 +11,11 @@ function run() {
     uvicorn src.api.main:app --reload
 }
 
+# 부하 테스트용 가짜 OpenAI 서버 실행 (API 서버는 OPENAI_BASE_URL=http://localhost:8001/v1 로 실행)
+function run_fake_openai() {
+    uvicorn src.api.utils.fake_openai_server:app --port 8001 --workers 4
+}
+
 # 프로젝트 종료
 function stop() {
     exit 0
@@ -21,9 +26,9 @@ function stop() {
 #    docker build -t my_fastapi_app .
 #}
 
-# 테스트 실행
+# 테스트 실행 (assistant_test.py 는 실행 중인 서버에 요청하는 스크립트이므로 tests 만 실행)
 function test() {
-    pytest
+    pytest tests
 }
 
 # 의존성 설치
@@ -76,6 +81,21 @@ function update_db_legal_dong() {
      python3 -m src.preprocessing.ministry_of_land.ministry_legal_dong_pipeline
 }
 
+# 국토교통부 아파트 실거래가 지역 x 월 일괄 조회 (예: fetch_ministry_trades 202401 202403 11 > trades.ndjson)
+function fetch_ministry_trades() {
+    python3 -m src.preprocessing.ministry_of_land.ministry_trade_pipeline --start "$1" --end "$2" --lawd-cd "${@:3}"
+}
+
+# 국토교통부 아파트 실거래가를 apartment_trade 테이블에 저장 (예: update_db_apartment_trade 202401 202403 11)
+function update_db_apartment_trade() {
+    python3 -m src.preprocessing.ministry_of_land.ministry_trade_pipeline --save --quiet --start "$1" --end "$2" --lawd-cd "${@:3}"
+}
+
+# 한국부동산원 가격지수/평균가격 데이터셋 동기화 (추가된 페이지만 조회, --full 이면 전체)
+function sync_korea_land() {
+    python3 -m src.preprocessing.korea_land.korea_land_sync_pipeline "$@"
+}
+
 # 네이버 부동산 뉴스 크롤링
 function crawl_naver_news() {
     python3 -m src.preprocessing.naver_real_estate_news.crawler
@@ -124,6 +144,7 @@ function project_menu() {
     echo "2) 의존성 설치"
     echo "3) 데이터베이스 스키마 업데이트"
     echo "4) 테스트 실행"
+    echo "5) 가짜 OpenAI 서버 실행 (부하 테스트용)"
     read -p "번호를 선택하세요: " choice
 
     case $choice in
@@ -131,6 +152,7 @@ function project_menu() {
         2) install ;;
         3) update_db_schema ;;
         4) test ;;
+        5) run_fake_openai ;;
         *) echo "잘못된 선택입니다."; project_menu ;;
     esac
 }
@@ -159,12 +181,14 @@ function crawl_menu() {
     echo "1) 네이버 부동산 뉴스 크롤링"
     echo "2) 국토교통부 데이터 업데이트"
     echo "3) 크롤링한 데이터 전처리"
+    echo "4) 한국부동산원 데이터셋 동기화"
     read -p "번호를 선택하세요: " choice
 
     case $choice in
         1) crawl_naver_news ;;
         2) update_db_legal_dong ;;
         3) preprocess_crawled_data ;;
+        4) sync_korea_land ;;
         *) echo "잘못된 선택입니다."; crawl_menu ;;
     esac
 }
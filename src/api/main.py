@@ -1,19 +1,67 @@
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-import logging
 
-from src.api.routes import real_estate, healthcheck, assistant_api, openai_api
-from src.database.database import Base, engine
+from src.api.routes import real_estate, healthcheck, assistant_api, openai_api, metrics
+from src.database.database import AsyncSessionLocal, Base, async_engine, engine
+from src.database.migrations import DB_STARTUP_MODE, check_schema_revision
+from src.database.notifications import kb_data_listener
+from src.api.services.region_resolver import region_resolver
+from src.api.services.price_series_store import PRICE_STORE_ENABLED, price_series_store
+from src.api.services.response_cache import chat_response_cache
+from src.api.services.openai_client import close_client
+from src.api.services.public_data_client import public_data_client
+from src.api.utils.logging_config import configure_logging, shutdown_logging
+from src.api.services.request_metrics import RequestMetricsMiddleware, instrument_engine, register_pool_collector
+
+# 로깅 설정 (LOG_LEVEL, LOG_FORMAT, LOG_SQL_LEVEL, LOG_SQL_SAMPLE_RATE, LOG_LEVELS - 큐 기반 비동기 출력)
+configure_logging()
+logger = logging.getLogger(__name__)
+
+
+# 앱 수명 주기: 스키마 확인, 인메모리 저장소 적재, 알림 LISTEN, 공유 HTTP 클라이언트 생성/정리
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if DB_STARTUP_MODE == "create_all":
+        logger.info("테이블 생성 시작")
+        async with async_engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)  # 테이블 생성 명령
+        logger.info("테이블 생성 완료")
+    elif DB_STARTUP_MODE == "alembic":
+        # 스키마는 alembic 으로만 관리 - 리비전 확인 쿼리 1회로 기동
+        await check_schema_revision(async_engine)
 
-# 로깅 레벨 설정
-logging.basicConfig(level=logging.INFO)
-# 외부 라이브러리 로깅 레벨 조정
-logging.getLogger("httpx").setLevel(logging.WARNING)
-logging.getLogger("httpcore").setLevel(logging.WARNING)
-logging.getLogger("openai").setLevel(logging.DEBUG)
-logging.getLogger("sqlalchemy.engine").setLevel(logging.INFO)
+    # KB 시세/예측 데이터를 메모리에 적재
+    if PRICE_STORE_ENABLED:
+        async with AsyncSessionLocal() as db:
+            try:
+                await price_series_store.refresh(db)
+            except Exception as e:
+                logger.warning("가격 시계열 저장소 적재 실패 (DB 조회로 대체): %s", e)
 
-app = FastAPI()
+    # KB 데이터 적재 알림 수신 시 인메모리 인덱스 갱신
+    kb_data_listener.subscribe(region_resolver.invalidate)
+    kb_data_listener.subscribe(price_series_store.on_notification)
+    kb_data_listener.subscribe(chat_response_cache.invalidate)
+    try:
+        await kb_data_listener.start()
+    except Exception as e:
+        logger.warning("KB 데이터 알림 LISTEN 실패 (TTL 기반 갱신만 사용): %s", e)
+
+    # 공공데이터 API 공유 클라이언트 (keep-alive 커넥션 풀)
+    public_data_client.start()
+
+    yield
+
+    await kb_data_listener.stop()
+    await public_data_client.close()
+    await close_client()
+    shutdown_logging()
+
+
+app = FastAPI(lifespan=lifespan)
 
 origins = [
     "http://localhost",
@@ -28,13 +76,13 @@ app.add_middleware(
     allow_methods=["*"],  # 모든 HTTP 메소드 허용
     allow_headers=["*"],  # 모든 헤더 허용
 )
+# 라우트별 지연 / 요청별 DB·LLM·파싱 시간 측정 (X-Profile 헤더로 요청 단위 프로파일링 - PROFILER_ENABLED)
+app.add_middleware(RequestMetricsMiddleware)
 
-
-@app.on_event("startup")
-def on_startup():
-    print("========Table Creating Start========")
-    Base.metadata.create_all(bind=engine)  # 테이블 생성 명령
-    print("========Table Creating Donee========")
+# SQL 실행 시간과 커넥션 풀 상태를 /metrics 로 노출
+instrument_engine(engine, "sync")
+instrument_engine(async_engine.sync_engine, "async")
+register_pool_collector({"sync": engine, "async": async_engine.sync_engine})
 
 
 @app.get("/")
@@ -46,3 +94,4 @@ app.include_router(real_estate.router, prefix="/real-estate")
 app.include_router(healthcheck.router, prefix="/health-check")
 app.include_router(openai_api.router, prefix="/model")
 app.include_router(assistant_api.router, prefix="/assistant")
+app.include_router(metrics.router)
@@ -1,11 +1,21 @@
+import logging
 import os
 from fastapi import APIRouter, Request, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from dotenv import load_dotenv
 
-from src.database.database import get_db
-from src.api.services.assistants_service import AssistantService
+from src.database.database import get_async_db, AsyncSessionLocal
+from src.api.services.assistants_service import AssistantService, assistant_run_metrics
+from src.api.services.thread_registry import thread_registry
+from src.api.services.property_service import get_price_payload
+from src.api.services.region_resolver import region_resolver
+from src.api.services.request_metrics import STAGE_PARSE, timed_stage
+from src.api.utils.parsers import extract_intent
+from src.api.utils.sse import sse_event, SSE_HEADERS, SSE_MEDIA_TYPE
+
+logger = logging.getLogger(__name__)
 
 # 환경 변수 로드
 load_dotenv()
@@ -17,6 +27,7 @@ router = APIRouter()
 class AssistantChatRequest(BaseModel):
     message: str
     thread_id: str = None
+    stream: bool = False  # True 이면 SSE 로 토큰 단위 스트리밍
 
 # 스레드 ID를 저장하기 위한 세션 캐시
 thread_cache = {}
@@ -25,9 +36,9 @@ thread_cache = {}
 try:
     assistant_service = AssistantService()
     assistant_info = assistant_service.get_assistant_info()
-    print(f"OpenAI Assistant 연결 성공: {assistant_info['name']} (모델: {assistant_info['model']})")
+    logger.info("OpenAI Assistant 연결 성공: %s (모델: %s)", assistant_info['name'], assistant_info['model'])
 except Exception as e:
-    print(f"OpenAI Assistant 초기화 오류: {e}")
+    logger.warning("OpenAI Assistant 초기화 오류: %s", e)
     assistant_service = None
 
 @router.get("/info")
@@ -44,8 +55,13 @@ async def get_assistant_info():
     
     return info
 
+# Assistant 실행 대기열/진행 시간 통계 및 스레드 레지스트리 현황
+@router.get("/metrics")
+async def get_assistant_run_metrics():
+    return {**assistant_run_metrics.snapshot(), "thread_registry": thread_registry.stats()}
+
 @router.post("/chat")
-async def assistant_chat(request: AssistantChatRequest, db: Session = Depends(get_db)):
+async def assistant_chat(request: AssistantChatRequest, db: AsyncSession = Depends(get_async_db)):
     """
     Assistant API를 통해 사용자 메시지를 처리하고 응답합니다.
     """
@@ -54,10 +70,14 @@ async def assistant_chat(request: AssistantChatRequest, db: Session = Depends(ge
     
     thread_id = request.thread_id
     user_message = request.message
+
+    if request.stream:
+        return StreamingResponse(stream_assistant_chat(user_message, thread_id),
+                                 media_type=SSE_MEDIA_TYPE, headers=SSE_HEADERS)
     
     try:
         # Assistant에 질문하고 응답 받기
-        response, new_thread_id = assistant_service.get_response(user_message, thread_id)
+        response, new_thread_id = await assistant_service.get_response(user_message, thread_id)
         
         return {
             "type": "assistant", 
@@ -65,5 +85,25 @@ async def assistant_chat(request: AssistantChatRequest, db: Session = Depends(ge
             "thread_id": new_thread_id
         }
     except Exception as e:
-        print(f"Assistant API 처리 오류: {e}")
-        raise HTTPException(status_code=500, detail=f"처리 중 오류가 발생했습니다: {str(e)}") 
\ No newline at end of file
+        logger.exception("Assistant API 처리 오류")
+        raise HTTPException(status_code=500, detail=f"처리 중 오류가 발생했습니다: {str(e)}")
+
+
+async def stream_assistant_chat(user_message, thread_id):
+    """
+    가격 질문이면 price 이벤트를 먼저 보내고, Assistant 응답 토큰을 SSE 로 전달합니다.
+    """
+    try:
+        async with AsyncSessionLocal() as db:
+            await region_resolver.ensure_loaded(db)
+            with timed_stage(STAGE_PARSE):
+                intent = extract_intent(user_message)
+            if intent:
+                price_payload = await get_price_payload(intent, db)
+                if price_payload:
+                    yield sse_event("price", price_payload)
+    except Exception:
+        logger.exception("가격 데이터 조회 오류")
+
+    async for event, data in assistant_service.stream_response(user_message, thread_id):
+        yield sse_event(event, data)
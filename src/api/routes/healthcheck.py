@@ -1,37 +1,44 @@
+import logging
+
 from fastapi import APIRouter, Depends
 from sqlalchemy import text
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.database.database import SessionLocal
+from src.database.database import async_engine, engine, get_async_db
 
 router = APIRouter()
 
+logger = logging.getLogger(__name__)
+
 
 @router.get("/", status_code=200)
 def health_check():
     return {"status": "toadx2 api server ok"}
 
 
-def get_db():
-    db = SessionLocal()
+async def check_db_connection(db: AsyncSession):
     try:
-        yield db
-    finally:
-        db.close()
-
-
-def check_db_connection(db: Session):
-    try:
-        db.execute(text('SELECT 1'))
+        await db.execute(text('SELECT 1'))
         return True
     except Exception as e:
-        print(f"Database connection error: {e}")
+        logger.warning("Database connection error: %s", e)
         return False
 
 
 @router.get("/database")
-def db_health_check(db: Session = Depends(get_db)):
-    if check_db_connection(db):
+async def db_health_check(db: AsyncSession = Depends(get_async_db)):
+    if await check_db_connection(db):
         return {"status": "Database is connected"}
     else:
         return {"status": "Database connection failed"}, 500
+
+
+@router.get("/database/pool")
+def db_pool_status():
+    """
+    동기/비동기 엔진의 커넥션 풀 사용 현황과 커넥션 대기 시간 히스토그램을 반환합니다.
+    """
+    return {
+        "sync": engine.pool.metrics.snapshot(engine.pool),
+        "async": async_engine.sync_engine.pool.metrics.snapshot(async_engine.sync_engine.pool),
+    }
@@ -0,0 +1,15 @@
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+from src.api.services.request_metrics import render_metrics
+
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+def metrics():
+    """
+    Prometheus 스크레이프용 지표 (라우트별 지연, 요청별 DB/LLM/파싱 시간, 커넥션 풀, Assistant 실행)
+    """
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
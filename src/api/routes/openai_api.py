@@ -1,15 +1,24 @@
+import logging
 import os
 from datetime import datetime
 
 from fastapi import APIRouter, Request, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from dotenv import load_dotenv
-from sqlalchemy.orm import Session
-from openai import OpenAI
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.utils.mock_responses import get_mock_response, check_using_patterns
 from src.api.services.assistants_service import AssistantService
-from src.database.database import get_db
+from src.api.services.openai_client import create_chat_completion, stream_chat_completion
+from src.api.services.property_service import get_price_payload
+from src.api.services.region_resolver import region_resolver
+from src.api.services.response_cache import chat_response_cache, intent_cache_key
+from src.api.services.session_store import create_session_store, trim_history
+from src.api.services.request_metrics import STAGE_PARSE, timed_stage
+from src.api.utils.parsers import extract_intent
+from src.api.utils.sse import sse_event, SSE_HEADERS, SSE_MEDIA_TYPE
+from src.database.database import get_async_db, AsyncSessionLocal
 
 # 환경 변수 로드
 load_dotenv()
@@ -17,20 +26,37 @@ load_dotenv()
 # FastAPI 라우터 초기화
 router = APIRouter()
 
+logger = logging.getLogger(__name__)
+
 # API 요청 모델 정의
 class ChatRequest(BaseModel):
     message: str
     session_id: str
+    stream: bool = False  # True 이면 SSE 로 토큰 단위 스트리밍
 
 # 응답 모델 정의
 class ChatResponse(BaseModel):
     message: str
     timestamp: str
 
-# 캐시 설정 (사용자 세션을 위한 캐시)
-cache = {}
+# 세션 저장소 (사용자 세션별 대화 기록 - LRU/TTL, 토큰 기준 상한)
+session_store = create_session_store()
 res_type = "text"
 
+# 새 세션의 시스템 메시지
+SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "이 서비스는 영문으로는 'toadx2'이고, 한글로는 '두껍아두껍아'입니다. "
+              "이 서비스는 KB 부동산 데이터 허브의 API를 기반으로 한국의 아파트 매매가와 전세가 기록치와 "
+              "그 기록치를 바탕으로 Prophet 모델을 통해 예측치를 구성해서 데이터베이스에 보유하고 있습니다. "
+              "이 서비스는 위의 데이터베이스에 저장된 부동산 데이터를 기반으로 답변할 수 있습니다. "
+              "이 서비스는 한국어를 할 수 있습니다. "
+              "이 서비스는 부동산 중에서도 아파트와 관련된 매매가 혹은 전세가가 아니면 답변할 수 없습니다. "
+              "이 서비스는 도덕적 윤리를 지켜야 합니다. "
+              "유저가 한국어로 말할 때는 항상 말 끝마다 한 칸 띄어 쓰고 '~두껍!'이라고 붙여야 하며, "
+              "유저가 인사를 하면 자기 소개를 해야 합니다."
+}
+
 # 스레드 ID를 세션 ID와 매핑하는 딕셔너리
 thread_map = {}
 
@@ -38,13 +64,28 @@ thread_map = {}
 API_KEY = os.getenv("OPENAI_API_KEY")
 ENABLE_API = os.getenv("ENABLE_OPENAI_API", "false").lower() == "true"
 
-# OpenAI 클라이언트 초기화
-client = OpenAI(api_key=API_KEY)
+# 가격 질문 의도 추출 (응답 캐시 / price 이벤트용)
+# 지역 인덱스를 불러오지 못하면(DB 장애 등) 의도 없이 진행해 채팅 자체는 계속 응답
+async def extract_chat_intent(message: str, db: AsyncSession):
+    if not await region_resolver.try_ensure_loaded(db):
+        return None
+    with timed_stage(STAGE_PARSE):
+        return extract_intent(message)
+
+# 공유 응답 캐시에 저장해도 되는 프롬프트인지 (시스템 메시지 + 이번 질문뿐인 첫 턴)
+# 이전 대화가 포함된 응답은 그 사용자의 맥락이 담겨 있으므로 다른 세션에 돌려주지 않음
+def is_cacheable_prompt(messages):
+    return len(messages) == 2 and messages[0] == SYSTEM_MESSAGE and messages[1]["role"] == "user"
 
-async def chat_with_openai(request: ChatRequest, db: Session):
+# 모의 응답 (OpenAI API 비활성화 시 - 부하 테스트 기준선)
+def mock_reply(message: str):
+    response = get_mock_response([SYSTEM_MESSAGE, {"role": "user", "content": message}])
+    return response.choices[0].message.content
+
+async def chat_with_openai(request: ChatRequest, db: AsyncSession):
     if not ENABLE_API:
         # API가 비활성화된 경우 모의 응답 반환
-        mock_response = get_mock_response(request.message)
+        mock_response = mock_reply(request.message)
         return ChatResponse(
             message=mock_response,
             timestamp=datetime.now().isoformat()
@@ -54,31 +95,37 @@ async def chat_with_openai(request: ChatRequest, db: Session):
         raise HTTPException(status_code=500, detail="OpenAI API 키가 설정되지 않았습니다.")
     
     try:
-        # 사용자 세션 기록 가져오기 (메모리에 저장)
+        # 사용자 세션 기록 가져오기 (세션 저장소)
         session_id = request.session_id
-        if session_id not in cache:
+        messages = await session_store.get(session_id)
+        if messages is None:
             # 새 세션인 경우 시스템 메시지로 초기화
-            system_message = {
-                "role": "system",
-                "content": "이 서비스는 영문으로는 'toadx2'이고, 한글로는 '두껍아두껍아'입니다. "
-                          "이 서비스는 KB 부동산 데이터 허브의 API를 기반으로 한국의 아파트 매매가와 전세가 기록치와 "
-                          "그 기록치를 바탕으로 Prophet 모델을 통해 예측치를 구성해서 데이터베이스에 보유하고 있습니다. "
-                          "이 서비스는 위의 데이터베이스에 저장된 부동산 데이터를 기반으로 답변할 수 있습니다. "
-                          "이 서비스는 한국어를 할 수 있습니다. "
-                          "이 서비스는 부동산 중에서도 아파트와 관련된 매매가 혹은 전세가가 아니면 답변할 수 없습니다. "
-                          "이 서비스는 도덕적 윤리를 지켜야 합니다. "
-                          "유저가 한국어로 말할 때는 항상 말 끝마다 한 칸 띄어 쓰고 '~두껍!'이라고 붙여야 하며, "
-                          "유저가 인사를 하면 자기 소개를 해야 합니다."
-            }
-            cache[session_id] = [system_message]
+            messages = [SYSTEM_MESSAGE]
         
         # 현재 대화 기록에 사용자 메시지 추가
-        cache[session_id].append({"role": "user", "content": request.message})
+        messages.append({"role": "user", "content": request.message})
+
+        # 같은 의도(지역, 매매/전세, 시간)의 가격 질문이면 캐시된 응답 사용
+        intent = await extract_chat_intent(request.message, db)
+        cache_key = intent_cache_key(intent) if intent else None
+        cached_message = chat_response_cache.get(cache_key) if cache_key else None
+        if cached_message:
+            messages.append({"role": "assistant", "content": cached_message})
+            await session_store.save(session_id, trim_history(messages))
+            return ChatResponse(
+                message=cached_message,
+                timestamp=datetime.now().isoformat()
+            )
+
+        cacheable = cache_key is not None and is_cacheable_prompt(messages)
+
+        # 대화 기록이 토큰 상한을 넘으면 가장 오래된 메시지부터 제거 (시스템 메시지는 유지)
+        messages = trim_history(messages)
         
-        # gpt-4o-mini 모델을 사용한 채팅 완성 요청
-        response = client.chat.completions.create(
+        # gpt-4o-mini 모델을 사용한 채팅 완성 요청 (AsyncOpenAI - 공유 커넥션 풀, 동시성 제한)
+        response = await create_chat_completion(
             model="gpt-3.5-turbo",
-            messages=cache[session_id],
+            messages=messages,
             temperature=0.7,
             max_tokens=1000
         )
@@ -87,12 +134,10 @@ async def chat_with_openai(request: ChatRequest, db: Session):
         assistant_message = response.choices[0].message.content
         
         # 대화 기록에 어시스턴트 응답 추가
-        cache[session_id].append({"role": "assistant", "content": assistant_message})
-        
-        # 대화 기록이 너무 길어지면 가장 오래된 메시지 제거 (토큰 제한 관리)
-        if len(cache[session_id]) > 20:
-            # 시스템 메시지 유지하고 나머지 중 가장 오래된 메시지 2개 제거
-            cache[session_id] = [cache[session_id][0]] + cache[session_id][3:]
+        messages.append({"role": "assistant", "content": assistant_message})
+        await session_store.save(session_id, trim_history(messages))
+        if cacheable:
+            chat_response_cache.set(cache_key, assistant_message)
         
         # 응답 반환
         return ChatResponse(
@@ -104,8 +149,84 @@ async def chat_with_openai(request: ChatRequest, db: Session):
         # 오류 발생 시 예외 처리
         raise HTTPException(status_code=500, detail=f"OpenAI API 오류: {str(e)}")
 
+# SSE 스트리밍 채팅 - price 이벤트(가격 데이터) 후 token 이벤트를 도착 즉시 전달하고 done 으로 종료
+async def stream_chat_with_openai(request: ChatRequest):
+    async def event_stream():
+        if not ENABLE_API:
+            mock_response = mock_reply(request.message)
+            yield sse_event("token", {"content": mock_response})
+            yield sse_event("done", {"message": mock_response, "timestamp": datetime.now().isoformat()})
+            return
+
+        if not API_KEY:
+            yield sse_event("error", {"detail": "OpenAI API 키가 설정되지 않았습니다."})
+            return
+
+        try:
+            # 스트림이 끝날 때까지 DB 세션을 직접 관리 (Depends 세션은 응답 시작 전에 정리됨)
+            async with AsyncSessionLocal() as db:
+                session_id = request.session_id
+                messages = await session_store.get(session_id)
+                if messages is None:
+                    messages = [SYSTEM_MESSAGE]
+                messages.append({"role": "user", "content": request.message})
+
+                intent = await extract_chat_intent(request.message, db)
+
+                # 가격 질문이면 구조화된 가격 데이터를 먼저 별도 이벤트로 전송 (조회 실패 시 생략)
+                price_payload = None
+                if intent:
+                    try:
+                        price_payload = await get_price_payload(intent, db)
+                    except Exception:
+                        logger.exception("가격 데이터 조회 오류")
+                if price_payload:
+                    yield sse_event("price", price_payload)
+
+            cache_key = intent_cache_key(intent) if intent else None
+            assistant_message = chat_response_cache.get(cache_key) if cache_key else None
+            if assistant_message:
+                yield sse_event("token", {"content": assistant_message})
+            else:
+                cacheable = cache_key is not None and is_cacheable_prompt(messages)
+                chunks = []
+                async for delta in stream_chat_completion(
+                    model="gpt-3.5-turbo",
+                    messages=trim_history(messages),
+                    temperature=0.7,
+                    max_tokens=1000
+                ):
+                    chunks.append(delta)
+                    yield sse_event("token", {"content": delta})
+                assistant_message = "".join(chunks)
+                if cacheable:
+                    chat_response_cache.set(cache_key, assistant_message)
+
+            messages.append({"role": "assistant", "content": assistant_message})
+            await session_store.save(session_id, trim_history(messages))
+            yield sse_event("done", {"message": assistant_message, "timestamp": datetime.now().isoformat()})
+
+        except Exception as e:
+            yield sse_event("error", {"detail": f"OpenAI API 오류: {str(e)}"})
+
+    return StreamingResponse(event_stream(), media_type=SSE_MEDIA_TYPE, headers=SSE_HEADERS)
+
 #TODO: 기본적인 gpt-4o-mini 모델 사용해서 채팅 구현
 @router.post("/chat")
-async def chat(request: ChatRequest, db: Session = Depends(get_db)):
+async def chat(request: ChatRequest, db: AsyncSession = Depends(get_async_db)):
+    if request.stream:
+        return await stream_chat_with_openai(request)
     return await chat_with_openai(request, db)
 
+
+# 응답 캐시 히트/미스 통계
+@router.get("/chat/cache")
+async def chat_cache_stats():
+    return chat_response_cache.stats()
+
+
+# 세션 저장소 사용 현황
+@router.get("/chat/sessions")
+async def chat_session_stats():
+    return session_store.stats()
+
@@ -1,18 +1,25 @@
+import logging
 import os
 from datetime import datetime
 
 from fastapi import APIRouter, Request, Depends, HTTPException
 from pydantic import BaseModel
 from dotenv import load_dotenv
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from openai import OpenAI
 
-from src.database.database import get_db
-from src.api.utils.mock_responses import get_mock_response, check_using_patterns, get_conversation_response
+from src.database.database import get_async_db
+from src.api.utils.mock_responses import get_mock_response, check_using_patterns, get_conversation_response, \
+    classify_price_or_info
 from src.api.utils.parsers import fill_parsing_defaults, format_price_data, generate_analysis_summary
 from src.api.services.property_service import get_property_price
+from src.api.services.region_resolver import region_resolver
+from src.api.utils.query_parser import parse_query
 from src.api.services.news_service import get_news_articles, google_search
 from src.api.services.assistants_service import AssistantService
+from src.ml_models.intent.intent_classifier import intent_classifier
+
+logger = logging.getLogger(__name__)
 
 # 환경 변수 로드
 load_dotenv()
@@ -47,7 +54,7 @@ try:
                 messages=[{"role": "user", "content": "test"}],
                 max_tokens=5
             )
-            print(f"OpenAI API 키 유효성 검증 성공: {test_response.choices[0].message.content}")
+            logger.info("OpenAI API 키 유효성 검증 성공: %s", test_response.choices[0].message.content)
             USE_MOCK_RESPONSES = False
             
             # Assistant 서비스 초기화 시도
@@ -57,28 +64,28 @@ try:
                     assistant_service = AssistantService(client=client, assistant_id=assistant_id)
                     assistant_info = assistant_service.get_assistant_info()
                     if assistant_info:
-                        print(f"OpenAI Assistant 연결 성공: {assistant_info['name']} (모델: {assistant_info['model']})")
+                        logger.info("OpenAI Assistant 연결 성공: %s (모델: %s)", assistant_info['name'], assistant_info['model'])
                         USE_ASSISTANT_API = True
                     else:
-                        print("Assistant 정보를 가져오는데 실패했습니다. Chat Completion API를 사용합니다.")
+                        logger.warning("Assistant 정보를 가져오는데 실패했습니다. Chat Completion API를 사용합니다.")
                         USE_ASSISTANT_API = False
                 else:
-                    print("OPENAI_ASSISTANT_ID가 설정되지 않았습니다. Chat Completion API를 사용합니다.")
+                    logger.info("OPENAI_ASSISTANT_ID가 설정되지 않았습니다. Chat Completion API를 사용합니다.")
                     USE_ASSISTANT_API = False
             except Exception as e:
-                print(f"Assistant 초기화 오류: {e}. Chat Completion API를 사용합니다.")
+                logger.warning("Assistant 초기화 오류: %s. Chat Completion API를 사용합니다.", e)
                 USE_ASSISTANT_API = False
                 
         except Exception as e:
-            print(f"OpenAI API 키 유효성 검증 실패: {e}")
+            logger.warning("OpenAI API 키 유효성 검증 실패: %s", e)
             USE_MOCK_RESPONSES = True
             USE_ASSISTANT_API = False
     else:
-        print("OpenAI API 사용이 비활성화되어 있습니다. 모의 응답을 사용합니다.")
+        logger.info("OpenAI API 사용이 비활성화되어 있습니다. 모의 응답을 사용합니다.")
         USE_MOCK_RESPONSES = True
         USE_ASSISTANT_API = False
 except Exception as e:
-    print(f"OpenAI 클라이언트 초기화 오류: {e}")
+    logger.warning("OpenAI 클라이언트 초기화 오류: %s", e)
     USE_MOCK_RESPONSES = True
     USE_ASSISTANT_API = False
 
@@ -93,12 +100,22 @@ def gemini_api_confirm_question_kind(text: str):
     global res_type
     
     try:
+        # 로컬 의도 분류기로 먼저 판단 (확신도가 임계값 미만일 때만 아래 LLM/패턴 분류로 넘어감)
+        try:
+            local_kind = intent_classifier.predict(text)
+            if local_kind:
+                logger.debug("로컬 분류 결과: %s", local_kind)
+                if local_kind != "N":
+                    res_type = "text"
+                return local_kind
+        except Exception as e:
+            logger.warning("로컬 의도 분류 오류: %s", e)
+
         # API 호출을 할지 결정 (USE_MOCK_RESPONSES가 False인 경우만 실제 API 호출)
         try_api_call = not USE_MOCK_RESPONSES and os.getenv("ENABLE_OPENAI_API", "false").lower() == "true"
         
         if try_api_call:
-            print("API 호출 시도")
-            print(text)
+            logger.debug("질문 분류 API 호출: %s", text)
             try:
                 # OpenAI를 사용하여 질문 유형 확인
                 question_kind_response = client.chat.completions.create(
@@ -110,7 +127,7 @@ def gemini_api_confirm_question_kind(text: str):
                 )
                 
                 question_kind = question_kind_response.choices[0].message.content.strip()
-                print("질문 유형 확인 결과", question_kind)
+                logger.debug("질문 유형 확인 결과: %s", question_kind)
 
                 if question_kind == "N":
                     return "N"
@@ -131,32 +148,21 @@ def gemini_api_confirm_question_kind(text: str):
                     return followup_kind
                     
                 except Exception as e:
-                    print(f"후속 질문 API 호출 오류: {e}")
+                    logger.warning("후속 질문 API 호출 오류: %s", e)
                     # 후속 질문 API 오류 시 기본값으로 PRICE 반환
                     res_type = "text"
                     return "PRICE"  # 기본적으로 PRICE로 처리
                 
             except Exception as e:
-                print(f"질문 분류 API 호출 오류: {e}")
+                logger.warning("질문 분류 API 호출 오류: %s", e)
                 # 패턴 매칭 기반으로 처리
                 first_check = check_using_patterns(text.lower())
                 
                 if first_check == "N":
                     return "N"
                 else:
-                    # 부동산 관련 키워드 확인하여 PRICE/INFO 구분
-                    price_keywords = ["매매", "전세", "가격", "시세", "얼마", "값", "비용", 
-                                    "아파트", "집값", "부동산", "가격대", "평균", "중간값", "중위값"]
-                    info_keywords = ["뉴스", "전망", "동향", "투자", "추세", "호재", "악재", 
-                                    "이슈", "정책", "법률", "규제", "완화", "변화", "예측", "향후"]
-                    
-                    text_lower = text.lower()
-                    if any(keyword in text_lower for keyword in price_keywords):
-                        return "PRICE"
-                    elif any(keyword in text_lower for keyword in info_keywords):
-                        return "INFO"
-                    
-                    return "PRICE"  # 기본값
+                    # 부동산 관련 키워드 확인하여 PRICE/INFO 구분 (기본값 PRICE)
+                    return classify_price_or_info(text.lower())
         else:
             # 패턴 매칭 기반으로 진행
             first_check = check_using_patterns(text.lower())
@@ -164,33 +170,22 @@ def gemini_api_confirm_question_kind(text: str):
             if first_check == "N":
                 return "N"
             else:
-                # 부동산 관련 키워드 확인하여 PRICE/INFO 구분
-                price_keywords = ["매매", "전세", "가격", "시세", "얼마", "값", "비용", 
-                                "아파트", "집값", "부동산", "가격대", "평균", "중간값", "중위값"]
-                info_keywords = ["뉴스", "전망", "동향", "투자", "추세", "호재", "악재", 
-                                "이슈", "정책", "법률", "규제", "완화", "변화", "예측", "향후"]
-                
-                text_lower = text.lower()
-                if any(keyword in text_lower for keyword in price_keywords):
-                    return "PRICE"
-                elif any(keyword in text_lower for keyword in info_keywords):
-                    return "INFO"
-                
-                return "PRICE"  # 기본값
+                # 부동산 관련 키워드 확인하여 PRICE/INFO 구분 (기본값 PRICE)
+                return classify_price_or_info(text.lower())
         
-    except Exception as e:
-        print(f"질문 처리 전체 오류: {e}")
+    except Exception:
+        logger.exception("질문 처리 전체 오류")
         # 오류 발생 시 기본값 반환
         res_type = "text"
         return "PRICE"  # 기본적으로 PRICE로 처리
 
 # 8. 수정된 부동산 질문 핸들러
-def handle_real_estate_question(user_input, session_id, db: Session):
+async def handle_real_estate_question(user_input, session_id, db: AsyncSession):
     global res_type
     try:
         # 질문 유형 확인
         kind = gemini_api_confirm_question_kind(user_input)
-        print("부동산 관련 질문 여부 확인", kind)
+        logger.debug("부동산 관련 질문 여부 확인: %s", kind)
 
         # 질문이 부동산과 관련 없는 경우
         if kind == "N":
@@ -230,28 +225,17 @@ def handle_real_estate_question(user_input, session_id, db: Session):
                 
                 return response.choices[0].message.content
             except Exception as e:
-                print(f"OpenAI API 오류: {e}")
+                logger.warning("OpenAI API 오류: %s", e)
                 return "죄송합니다. 지금은 서비스 이용이 어렵습니다. 잠시 후 다시 시도해주세요~두껍!"
 
-        print(2222)
-
-        # 파싱 응답
-        try:
-            if USE_MOCK_RESPONSES:
-                parsed_result_response = get_mock_response([
-                    {"role": "system", "content": "모든 응답은 반드시 한국어로 작성되어야 합니다. 다음 유저의 질문을 파싱하여 지침에 따라 답변하세요."
-                    "특수문자는 넣지말고, key-value는 콜론으로 구분하세요"
-                    "각 값은 쉼표로 구분하세요"
-                    "파싱 결과:\n"
-                    "지역: [지역명을 여기에만 입력하세요],\n"
-                    "매매/전세 여부: [매매 or 전세를 명시하세요],\n"
-                    "시간 정보: [시간 정보를 여기에만 입력하세요]\n"},
-                    {"role": "user", "content": f"유저의 질문: {user_input}"}
-                ])
-            else:
-                parsed_result_response = client.chat.completions.create(
-                    model="gpt-4o-mini",
-                    messages=[
+        # 규칙 기반 파싱 우선 (지역을 찾지 못한 경우에만 LLM 파싱 요청)
+        await region_resolver.ensure_loaded(db)
+        parsed_result = parse_query(user_input)
+        if parsed_result is None:
+            # 파싱 응답
+            try:
+                if USE_MOCK_RESPONSES:
+                    parsed_result_response = get_mock_response([
                         {"role": "system", "content": "모든 응답은 반드시 한국어로 작성되어야 합니다. 다음 유저의 질문을 파싱하여 지침에 따라 답변하세요."
                         "특수문자는 넣지말고, key-value는 콜론으로 구분하세요"
                         "각 값은 쉼표로 구분하세요"
@@ -260,18 +244,31 @@ def handle_real_estate_question(user_input, session_id, db: Session):
                         "매매/전세 여부: [매매 or 전세를 명시하세요],\n"
                         "시간 정보: [시간 정보를 여기에만 입력하세요]\n"},
                         {"role": "user", "content": f"유저의 질문: {user_input}"}
-                    ]
-                )
+                    ])
+                else:
+                    parsed_result_response = client.chat.completions.create(
+                        model="gpt-4o-mini",
+                        messages=[
+                            {"role": "system", "content": "모든 응답은 반드시 한국어로 작성되어야 합니다. 다음 유저의 질문을 파싱하여 지침에 따라 답변하세요."
+                            "특수문자는 넣지말고, key-value는 콜론으로 구분하세요"
+                            "각 값은 쉼표로 구분하세요"
+                            "파싱 결과:\n"
+                            "지역: [지역명을 여기에만 입력하세요],\n"
+                            "매매/전세 여부: [매매 or 전세를 명시하세요],\n"
+                            "시간 정보: [시간 정보를 여기에만 입력하세요]\n"},
+                            {"role": "user", "content": f"유저의 질문: {user_input}"}
+                        ]
+                    )
             
-            parsed_text = parsed_result_response.choices[0].message.content
-            print("모델 응답결과 :", parsed_text)
-        except Exception as e:
-            print(f"파싱 API 오류: {e}")
-            parsed_text = "지역: 서울, 매매/전세 여부: 매매, 시간 정보: 현재"
+                parsed_text = parsed_result_response.choices[0].message.content
+                logger.debug("모델 파싱 응답: %s", parsed_text)
+            except Exception as e:
+                logger.warning("파싱 API 오류: %s", e)
+                parsed_text = "지역: 서울, 매매/전세 여부: 매매, 시간 정보: 현재"
         
-        # 텍스트 추출 및 파싱
-        parsed_result = fill_parsing_defaults(parsed_text)
-        print("전세/매매가 여부 파싱", parsed_result)
+            # 텍스트 추출 및 파싱
+            parsed_result = fill_parsing_defaults(parsed_text)
+        logger.debug("질문 파싱 결과: %s", parsed_result)
 
         # 질문이 매매가/전세가 관련일 경우
         if kind == "PRICE":
@@ -279,12 +276,12 @@ def handle_real_estate_question(user_input, session_id, db: Session):
             deal_type = parsed_result.get("매매/전세 여부", "매매")
             date_info = parsed_result.get("시간 정보", "현재")
 
-            print("매매가 안쪽", region, deal_type, date_info)
+            logger.debug("가격 질문: %s %s %s", region, deal_type, date_info)
 
             try:
                 # 매매가/전세가 DB 조회
-                price_data, avg_price = get_property_price(region, deal_type, date_info, db)
-                print("매매가 데이터 조회 결과", price_data)
+                price_data, avg_price = await get_property_price(region, deal_type, date_info, db)
+                logger.debug("가격 데이터 조회 결과: %d건", len(price_data))
                 if not price_data:
                     return "데이터를 찾을 수 없습니다~두껍!"
 
@@ -292,7 +289,6 @@ def handle_real_estate_question(user_input, session_id, db: Session):
                 formatted_price_data = format_price_data(region, price_data)
                 analysis_summary = generate_analysis_summary(price_data)
 
-                print(price_data)
                 res_type = "price"
 
                 return {
@@ -302,7 +298,7 @@ def handle_real_estate_question(user_input, session_id, db: Session):
                     "avg_price": avg_price
                 }
             except Exception as e:
-                print(f"데이터 처리 오류: {e}")
+                logger.exception("데이터 처리 오류")
                 return f"데이터 처리 중 오류가 발생했습니다~두껍! ({str(e)})"
 
         # 질문이 정보/뉴스 관련일 경우
@@ -311,7 +307,7 @@ def handle_real_estate_question(user_input, session_id, db: Session):
 
             try:
                 # 뉴스 DB 조회
-                news_data = get_news_articles(region_name, db)
+                news_data = await get_news_articles(region_name, db)
                 if not news_data:
                     # 구글 검색으로 대체
                     search_results = google_search(user_input)
@@ -327,14 +323,14 @@ def handle_real_estate_question(user_input, session_id, db: Session):
                 res_type = "info"
 
                 return news_data
-            except Exception as e:
-                print(f"뉴스 데이터 처리 오류: {e}")
+            except Exception:
+                logger.exception("뉴스 데이터 처리 오류")
                 return "뉴스 정보를 가져오는 중 오류가 발생했습니다~두껍!"
 
         # 부동산 관련이 아니면 고정된 프롬프트로 reject
         return "부동산 관련 질문만 대답할 수 있습니다!~두껍!"
-    except Exception as e:
-        print(f"질문 처리 중 오류 발생: {e}")
+    except Exception:
+        logger.exception("질문 처리 중 오류 발생")
         return "죄송합니다. 현재 서비스에 문제가 있습니다. 잠시 후 다시 시도해주세요~두껍!"
 
 # 함수 추가: 질문 유형 확인
@@ -383,12 +379,12 @@ def handle_non_real_estate_question(message):
         )
         return completion.choices[0].message.content
     except Exception as e:
-        print(f"비부동산 질문 처리 오류: {e}")
+        logger.warning("비부동산 질문 처리 오류: %s", e)
         return "죄송합니다. 부동산 정보만 안내해드릴 수 있습니다~두껍!"
 
 # 9. FastAPI '/chat' 엔드포인트
 @router.post("/chat")
-async def chat(chat_request: ChatRequest, db: Session = Depends(get_db)):
+async def chat(chat_request: ChatRequest, db: AsyncSession = Depends(get_async_db)):
     message = chat_request.message
     session_id = chat_request.session_id
 
@@ -455,7 +451,7 @@ async def chat(chat_request: ChatRequest, db: Session = Depends(get_db)):
             date_info = result["date_info"]
             
             # 부동산 가격 데이터 조회
-            price_data = get_property_price(db, region, deal_type, date_info)
+            price_data = await get_property_price(db, region, deal_type, date_info)
             if not price_data or len(price_data) == 0:
                 return {"type": "error", "response": f"{region}의 {deal_type} 데이터를 찾을 수 없습니다."}
             
@@ -499,7 +495,7 @@ async def chat(chat_request: ChatRequest, db: Session = Depends(get_db)):
                         "avg_price": avg_price
                     }
                 except Exception as e:
-                    print(f"Assistant API 응답 생성 오류: {e}")
+                    logger.warning("Assistant API 응답 생성 오류: %s", e)
                     # 오류 발생 시 기존 방식으로 응답 생성
             
             # 기존 방식으로 응답 생성
@@ -515,7 +511,7 @@ async def chat(chat_request: ChatRequest, db: Session = Depends(get_db)):
             }
             
         except Exception as e:
-            print(f"부동산 가격 응답 생성 오류: {e}")
+            logger.exception("부동산 가격 응답 생성 오류")
             return {"type": "error", "response": f"응답을 생성하는 중 오류가 발생했습니다: {e}"}
     
     # 부동산 정보 관련 질문 처리
@@ -530,7 +526,7 @@ async def chat(chat_request: ChatRequest, db: Session = Depends(get_db)):
             region = result["region"]
             
             # 뉴스 기사 조회
-            news_data = get_news_articles(region)
+            news_data = await get_news_articles(region)
             if not news_data or len(news_data) == 0:
                 return {"type": "error", "response": f"{region}의 부동산 관련 뉴스를 찾을 수 없습니다."}
             
@@ -575,7 +571,7 @@ async def chat(chat_request: ChatRequest, db: Session = Depends(get_db)):
                         "region": region
                     }
                 except Exception as e:
-                    print(f"Assistant API 응답 생성 오류: {e}")
+                    logger.warning("Assistant API 응답 생성 오류: %s", e)
                     # 오류 발생 시 기존 방식으로 응답 생성
             
             # 기존 방식으로 응답 생성
@@ -586,7 +582,7 @@ async def chat(chat_request: ChatRequest, db: Session = Depends(get_db)):
             }
             
         except Exception as e:
-            print(f"부동산 정보 응답 생성 오류: {e}")
+            logger.exception("부동산 정보 응답 생성 오류")
             return {"type": "error", "response": f"응답을 생성하는 중 오류가 발생했습니다: {e}"}
     
     # 기타 질문 처리
@@ -1,120 +1,135 @@
 import logging
-import os
+from contextlib import asynccontextmanager
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.services.korea_land_sync import KOREA_LAND_MAX_PER_PAGE, query_records
+from src.api.services.ministry_trade_fetcher import BulkRequestError, MinistryTradeFetcher, load_lawd_codes, \
+    month_range, plan_jobs, to_ndjson
+from src.api.services.ministry_trade_parser import TradeParseError, parse_trade_stream
+from src.api.services.proxy_cache import ministry_ttl, proxy_cache
+from src.api.services.public_data_client import MINISTRY, UpstreamError, public_data_client
+from src.database.database import AsyncSessionLocal, get_async_db
 
-import requests
-import xmltodict
-from dotenv import load_dotenv
-from fastapi import APIRouter
-
-load_dotenv()
 router = APIRouter()
 
-logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
-logging.getLogger("urllib3").setLevel(logging.DEBUG)
 
-koreaLandUrl = os.getenv('KOREA_LAND_API_URL')
-ministryUrl = os.getenv('MINISTRY_OF_LAND_API_URL')
-encodingKey = os.getenv('ENCODING_KEY')
-decodingKey = os.getenv('DECODING_KEY')
+
+# 공유 클라이언트로 업스트림 호출 (타임아웃/동시 요청 한도 초과는 504/503 으로 응답, 본문은 블록 안에서 스트리밍)
+@asynccontextmanager
+async def stream_upstream(upstream: str, path: str, params):
+    try:
+        async with public_data_client.stream(upstream, path, params=params) as response:
+            yield response
+    except UpstreamError as e:
+        logger.warning("공공데이터 API 호출 실패: %s", e)
+        raise HTTPException(status_code=e.status_code, detail=str(e))
+
+
+# 한국부동산원 조회 필터 (기준 년월은 YYYYMM, 양끝 포함)
+def korea_land_filters(
+        region: str = Query(None, description="지역 (예: 서울)"),
+        start_month: str = Query(None, pattern=r"^\d{6}$", description="시작 기준 년월 (YYYYMM)"),
+        end_month: str = Query(None, pattern=r"^\d{6}$", description="종료 기준 년월 (YYYYMM)"),
+        per_page: int = Query(10, ge=1, le=KOREA_LAND_MAX_PER_PAGE),
+):
+    return {"region": region, "start_month": start_month, "end_month": end_month, "per_page": per_page}
+
+
+# 한국부동산원 데이터셋 조회 (korea_land_sync 로 동기화한 로컬 테이블에서 필터링)
+async def get_korea_land(db: AsyncSession, dataset: str, page: int, filters):
+    if page < 1:
+        raise HTTPException(status_code=400, detail="page 는 1 이상이어야 합니다.")
+    result = await query_records(db, dataset, page=page, **filters)
+    if result["syncedAt"] is None:
+        raise HTTPException(status_code=503, detail=f"{dataset} 데이터셋이 아직 동기화되지 않았습니다.")
+    return result
+
+
+# 국토교통부 아파트 실거래가 지역 x 월 일괄 조회 (NDJSON 스트리밍)
+@router.get("/ministry/bulk")
+async def get_sale_cost_bulk_from_ministry(
+        start_ymd: str,
+        end_ymd: str,
+        lawd_cd: List[str] = Query(None, description="LAWD_CD 또는 법정동 코드 접두어 (예: 11 -> 서울 전체), 없으면 전국"),
+):
+    """
+    legal_dong_code 의 시군구 코드 x 계약년월 범위를 동시에 조회하고(초당 요청 수 제한, 페이지 자동 순회)
+    거래 한 건당 한 줄의 NDJSON 으로 도착하는 대로 반환합니다. 마지막 줄은 {"summary": ...}
+    """
+    try:
+        months = month_range(start_ymd, end_ymd)
+        async with AsyncSessionLocal() as db:
+            lawd_codes = await load_lawd_codes(db, lawd_cd)
+        if not lawd_codes:
+            raise HTTPException(status_code=404, detail="조회할 지역 코드가 없습니다.")
+        jobs = plan_jobs(lawd_codes, months)
+    except BulkRequestError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    async def body():
+        async for record in MinistryTradeFetcher().fetch(jobs):
+            yield to_ndjson(record)
+
+    return StreamingResponse(body(), media_type="application/x-ndjson")
 
 
 # 국토교통부 아파트 실거래가 Open API를 활용한 부동산 데이터 지역별/날짜별 조회
+# (거래 금액은 만원 단위 정수, 전용면적은 실수, 계약일은 날짜로 변환된 레코드 목록)
 @router.get("/ministry/{lawd_cd}/{deal_ymd}")
-def get_sale_cost_from_ministry(lawd_cd: str, deal_ymd: str):
+async def get_sale_cost_from_ministry(lawd_cd: str, deal_ymd: str):
     params = {
         'LAWD_CD': lawd_cd,
         'DEAL_YMD': deal_ymd,
     }
-    url = ministryUrl + '/getRTMSDataSvcAptTrade' + f'?serviceKey={encodingKey}'
-
-    print(url)
-
-    response = requests.get(url, params=params)
 
-    print(response.text)
-
-    if response.status_code == 200:
-        data_dict = xmltodict.parse(response.content)
-
-        items = data_dict['response']['body']['items']['item']
-        return items
-    else:
-        return {"error": "Failed to fetch data"}
+    async def fetch():
+        async with stream_upstream(MINISTRY, '/getRTMSDataSvcAptTrade', params) as response:
+            if response.status_code != 200:
+                return {"error": "Failed to fetch data"}, False
+            try:
+                records, _ = await parse_trade_stream(response.aiter_bytes(), lawd_cd)
+            except TradeParseError as e:
+                logger.warning("국토교통부 실거래가 응답 오류: %s", e)
+                return {"error": "Failed to fetch data"}, False
+            # 요청 URL 에는 서비스 키가 포함되므로 기록하지 않음
+            logger.debug("국토교통부 실거래가 응답: %s %s -> %d (%d bytes)",
+                         lawd_cd, deal_ymd, response.status_code, response.num_bytes_downloaded)
+        # 날짜는 ISO 문자열로 (메모리/디스크 캐시 계층에서 같은 값을 반환하도록)
+        return jsonable_encoder(records), True
+
+    # 지난달 이전 거래는 바뀌지 않으므로 오래 캐시, 이번 달은 짧게
+    return await proxy_cache.get_or_fetch(f"ministry:{lawd_cd}:{deal_ymd}", fetch, ministry_ttl(deal_ymd))
 
 
 # 한국부동산원 월별/지역별 아파트 매매가격지수 동향 조회
 @router.get("/korea-land/sale-index/{page}")
-def get_sale_index_from_korea_land(page: int):
-    params = {
-        'page': page,
-        'perPage': 10,
-    }
-    url = koreaLandUrl + '/15069826/v1/uddi:754c056e-8dea-4201-8a61-88e56da67e83' + f'?serviceKey={encodingKey}'
-
-    response = requests.get(url, params=params)
-
-    if response.status_code == 200:
-        json_data = response.json()
-
-        return json_data
-    else:
-        return {"error": "Failed to fetch data"}
+async def get_sale_index_from_korea_land(page: int, filters=Depends(korea_land_filters),
+                                         db: AsyncSession = Depends(get_async_db)):
+    return await get_korea_land(db, "sale_index", page, filters)
 
 
 # 한국부동산원 월별 아파트 평균 매매가격 조회
 @router.get("/korea-land/sale-cost/{page}")
-def get_sale_avg_cost_from_korea_land(page: int):
-    params = {
-        'page': page,
-        'perPage': 10,
-    }
-    url = koreaLandUrl + '/15069826/v1/uddi:c921d88a-6deb-4904-a658-e1fdb5437c92' + f'?serviceKey={encodingKey}'
-
-    response = requests.get(url, params=params)
-
-    if response.status_code == 200:
-        json_data = response.json()
-
-        return json_data
-    else:
-        return {"error": "Failed to fetch data"}
+async def get_sale_avg_cost_from_korea_land(page: int, filters=Depends(korea_land_filters),
+                                            db: AsyncSession = Depends(get_async_db)):
+    return await get_korea_land(db, "sale_cost", page, filters)
 
 
 # 한국부동산원 월별/지역별 아파트 전세가격지수 동향 조회
 @router.get("/korea-land/rent-index/{page}")
-def get_rent_index_from_korea_land(page: int):
-    params = {
-        'page': page,
-        'perPage': 10,
-    }
-    url = koreaLandUrl + '/15044018/v1/uddi:dd77d0b6-6927-46f4-884c-b5a0c1751b65' + f'?serviceKey={encodingKey}'
-
-    response = requests.get(url, params=params)
-
-    if response.status_code == 200:
-        json_data = response.json()
-
-        return json_data
-    else:
-        return {"error": "Failed to fetch data"}
+async def get_rent_index_from_korea_land(page: int, filters=Depends(korea_land_filters),
+                                         db: AsyncSession = Depends(get_async_db)):
+    return await get_korea_land(db, "rent_index", page, filters)
 
 
 # 한국부동산원 월별 아파트 평균 전세가격 조회
 @router.get("/korea-land/rent-cost/{page}")
-def get_rent_avg_cost_from_korea_land(page: int):
-    params = {
-        'page': page,
-        'perPage': 10,
-    }
-
-    url = f'{koreaLandUrl}/15067573/v1/uddi:d2dae93c-51eb-4873-983e-a71fdf4835f9?serviceKey={encodingKey}'
-
-    response = requests.get(url, params=params)
-
-    if response.status_code == 200:
-        json_data = response.json()
-
-        return json_data
-    else:
-        return {"error": "Failed to fetch data"}
+async def get_rent_avg_cost_from_korea_land(page: int, filters=Depends(korea_land_filters),
+                                            db: AsyncSession = Depends(get_async_db)):
+    return await get_korea_land(db, "rent_cost", page, filters)
@@ -0,0 +1,49 @@
+import logging
+import os
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database.models.database_model import ApartmentTrade
+
+logger = logging.getLogger(__name__)
+
+# INSERT 한 문장에 담을 행 수 (컬럼 17개 x 1000행 - PostgreSQL 바인드 파라미터 한도 32767 이하)
+APARTMENT_TRADE_UPSERT_BATCH = int(os.getenv("APARTMENT_TRADE_UPSERT_BATCH", "1000"))
+
+TRADE_COLUMNS = [column.name for column in ApartmentTrade.__table__.columns if column.name != "id"]
+# 같은 거래가 다시 들어오면 갱신할 컬럼 (해제 여부 등)
+UPDATE_COLUMNS = [name for name in TRADE_COLUMNS if name != "trade_key"]
+
+
+def build_upsert(rows):
+    stmt = insert(ApartmentTrade).values(rows)
+    return stmt.on_conflict_do_update(
+        index_elements=[ApartmentTrade.trade_key],
+        set_={name: stmt.excluded[name] for name in UPDATE_COLUMNS},
+    )
+
+
+async def upsert_apartment_trades(db: AsyncSession, records, batch_size: int = APARTMENT_TRADE_UPSERT_BATCH):
+    """
+    ministry_trade_parser 의 거래 레코드를 batch_size 행씩 INSERT ... ON CONFLICT (trade_key) DO UPDATE 로 저장합니다.
+    (레코드의 추가 필드는 무시, 커밋은 호출한 쪽에서)
+
+    Returns:
+        저장한 행 수
+    """
+    batch, saved = {}, 0
+    for record in records:
+        if not record.get("lawd_cd"):
+            continue
+        # 한 문장 안에 같은 키가 두 번 있으면 ON CONFLICT DO UPDATE 가 실패하므로 마지막 값만 유지
+        batch[record["trade_key"]] = {name: record.get(name) for name in TRADE_COLUMNS}
+        if len(batch) >= batch_size:
+            await db.execute(build_upsert(list(batch.values())))
+            saved += len(batch)
+            batch.clear()
+    if batch:
+        await db.execute(build_upsert(list(batch.values())))
+        saved += len(batch)
+    logger.debug("apartment_trade %d행 저장", saved)
+    return saved
@@ -0,0 +1,122 @@
+import asyncio
+import json
+import logging
+
+from src.api.services.news_service import get_news_articles
+from src.api.services.property_service import get_property_price
+from src.api.utils.analytics import summarize
+from src.database.database import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+# get_price 결과로 돌려줄 최근 관측치 수 (토큰 절약)
+PRICE_TOOL_MAX_POINTS = 12
+
+# 실행 생성 시 Assistant 에 전달하는 함수 정의
+TOOL_DEFINITIONS = [
+    {
+        "type": "function",
+        "function": {
+            "name": "get_price",
+            "description": "KB 부동산 데이터(실측치 + Prophet 예측치)에서 지역별 아파트 매매가/전세가 시계열과 요약 통계를 조회합니다.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "region": {"type": "string", "description": "지역 이름 (예: 서울, 부산 해운대구, 강남)"},
+                    "deal_type": {"type": "string", "enum": ["매매", "전세"], "description": "거래 유형"},
+                    "range": {"type": "string", "description": "시간 정보 (예: 현재, 2024년 3월)"},
+                },
+                "required": ["region", "deal_type"],
+            },
+        },
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "get_news",
+            "description": "지역과 관련된 최근 부동산 뉴스 기사를 조회합니다.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "region": {"type": "string", "description": "지역 이름"},
+                },
+                "required": ["region"],
+            },
+        },
+    },
+]
+
+
+async def get_price(region, deal_type="매매", range="현재"):
+    price_type = 'rent' if deal_type in ("전세", "rent") else 'sale'
+    # 동시에 실행되는 도구 호출마다 별도 세션 사용
+    async with AsyncSessionLocal() as db:
+        result = await get_property_price(region, price_type, range or "현재", db)
+
+    price_data, avg_price = result if result else ([], 0)
+    if not price_data:
+        return {"region": region, "deal_type": deal_type, "message": "해당 조건의 가격 데이터가 없습니다."}
+
+    return {
+        "region": region,
+        "deal_type": deal_type,
+        "unit": "만원",
+        "avg_price": avg_price,
+        "summary": summarize(price_data),
+        "recent": price_data.tail(PRICE_TOOL_MAX_POINTS).to_records(),
+    }
+
+
+async def get_news(region):
+    async with AsyncSessionLocal() as db:
+        articles = await get_news_articles(region, db)
+    return {"region": region, "articles": articles or []}
+
+
+TOOL_FUNCTIONS = {
+    "get_price": get_price,
+    "get_news": get_news,
+}
+
+
+# 실행 한 건의 함수 호출을 로컬에서 처리 (같은 인자의 호출은 실행 내에서 캐시)
+class ToolExecutor:
+    def __init__(self, functions=None):
+        self.functions = functions or TOOL_FUNCTIONS
+        self._cache = {}
+
+    async def _call(self, name, arguments):
+        try:
+            kwargs = json.loads(arguments or "{}")
+        except json.JSONDecodeError:
+            return {"error": f"인자를 해석할 수 없습니다: {arguments}"}
+        if not isinstance(kwargs, dict):
+            return {"error": f"인자는 JSON 객체여야 합니다: {arguments}"}
+
+        function = self.functions.get(name)
+        if function is None:
+            return {"error": f"알 수 없는 함수입니다: {name}"}
+
+        # 잘못된 인자(TypeError) 등 모든 실패는 실행을 중단시키지 않고 도구 출력의 error 로 전달
+        key = (name, json.dumps(kwargs, sort_keys=True, ensure_ascii=False))
+        try:
+            if key not in self._cache:
+                # 같은 호출이 동시에 들어와도 한 번만 실행되도록 태스크를 캐시
+                self._cache[key] = asyncio.ensure_future(function(**kwargs))
+            return await self._cache[key]
+        except Exception as e:
+            logger.warning("함수 실행 중 오류 발생 (%s): %s", name, e)
+            return {"error": str(e)}
+
+    async def execute(self, tool_calls):
+        """
+        required_action 의 tool_calls 를 동시에 실행하고 submit_tool_outputs 형식으로 반환합니다.
+        """
+        function_calls = [call for call in tool_calls if call.type == "function"]
+        results = await asyncio.gather(
+            *(self._call(call.function.name, call.function.arguments) for call in function_calls)
+        )
+        return [
+            {"tool_call_id": call.id, "output": json.dumps(result, ensure_ascii=False, default=str)}
+            for call, result in zip(function_calls, results)
+        ]
@@ -1,18 +1,167 @@
+import asyncio
+import logging
 import os
-from openai import OpenAI
+import threading
+import time
+
+from openai import OpenAI, NotFoundError
+from openai.lib.streaming import AsyncAssistantEventHandler
+
+from src.api.services.assistant_tools import TOOL_DEFINITIONS, ToolExecutor
+from src.api.services.openai_client import async_client as shared_async_client
+from src.api.services.request_metrics import observe_assistant_run
+from src.api.services.thread_registry import thread_registry
+
+logger = logging.getLogger(__name__)
+
+# Assistant 실행 최대 대기 시간(초)
+ASSISTANT_RUN_TIMEOUT = float(os.getenv("ASSISTANT_RUN_TIMEOUT", "60"))
+
+# 실행 시 로컬 함수(get_price, get_news) 정의를 Assistant 에 전달할지 여부
+ASSISTANT_LOCAL_TOOLS = os.getenv("ASSISTANT_LOCAL_TOOLS", "true").lower() == "true"
+
+# 실행 종료 상태 이벤트
+RUN_TERMINAL_EVENTS = {
+    "thread.run.completed": "completed",
+    "thread.run.failed": "failed",
+    "thread.run.cancelled": "cancelled",
+    "thread.run.expired": "expired",
+    "thread.run.requires_action": "requires_action",
+}
+
+# 취소 요청 등 응답과 분리된 백그라운드 태스크 참조 유지
+_background_tasks = set()
+
+
+# 실행 한 건의 대기열/진행 시간 기록
+class RunTimings:
+    __slots__ = ("run_id", "thread_id", "status", "started_at", "queued_at", "in_progress_at", "finished_at")
+
+    def __init__(self):
+        self.run_id = None
+        self.thread_id = None
+        self.status = None
+        self.started_at = time.monotonic()
+        self.queued_at = None
+        self.in_progress_at = None
+        self.finished_at = None
+
+    def finish(self, status):
+        self.status = status
+        self.finished_at = time.monotonic()
+
+    @property
+    def queued_seconds(self):
+        """
+        실행 생성(queued) 부터 in_progress 전환까지의 시간
+        """
+        if self.queued_at is None:
+            return None
+        end = self.in_progress_at or self.finished_at
+        return end - self.queued_at if end else None
+
+    @property
+    def in_progress_seconds(self):
+        if self.in_progress_at is None or self.finished_at is None:
+            return None
+        return self.finished_at - self.in_progress_at
+
+    @property
+    def total_seconds(self):
+        return (self.finished_at or time.monotonic()) - self.started_at
+
+    def as_dict(self):
+        return {
+            "run_id": self.run_id,
+            "thread_id": self.thread_id,
+            "status": self.status,
+            "queued_seconds": self.queued_seconds,
+            "in_progress_seconds": self.in_progress_seconds,
+            "total_seconds": self.total_seconds,
+        }
+
+
+# 실행 스트림 이벤트로 상태 전환 시각을 기록하는 핸들러
+class RunEventHandler(AsyncAssistantEventHandler):
+    def __init__(self, timings=None):
+        super().__init__()
+        # 함수 호출 결과 제출 후 이어지는 스트림도 같은 실행 기록을 공유
+        self.timings = timings or RunTimings()
+
+    async def on_event(self, event):
+        now = time.monotonic()
+        if event.event == "thread.run.created":
+            self.timings.run_id = event.data.id
+            self.timings.thread_id = event.data.thread_id
+        if event.event in ("thread.run.created", "thread.run.queued") and self.timings.queued_at is None:
+            self.timings.queued_at = now
+        elif event.event == "thread.run.in_progress" and self.timings.in_progress_at is None:
+            self.timings.in_progress_at = now
+        elif event.event in RUN_TERMINAL_EVENTS:
+            self.timings.status = RUN_TERMINAL_EVENTS[event.event]
+            self.timings.finished_at = now
+
+
+# 실행 시간 누적 통계 (기본 메트릭 훅)
+class RunMetrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.statuses = {}
+        self.queued_total = 0.0
+        self.queued_max = 0.0
+        self.in_progress_total = 0.0
+        self.in_progress_max = 0.0
+        self.timed_runs = 0
+
+    def record(self, timings: RunTimings):
+        with self._lock:
+            self.statuses[timings.status] = self.statuses.get(timings.status, 0) + 1
+            queued, in_progress = timings.queued_seconds, timings.in_progress_seconds
+            if queued is not None and in_progress is not None:
+                self.timed_runs += 1
+                self.queued_total += queued
+                self.queued_max = max(self.queued_max, queued)
+                self.in_progress_total += in_progress
+                self.in_progress_max = max(self.in_progress_max, in_progress)
+
+    def snapshot(self):
+        with self._lock:
+            runs = self.timed_runs
+            return {
+                "runs": dict(self.statuses),
+                "queued_avg": self.queued_total / runs if runs else 0.0,
+                "queued_max": self.queued_max,
+                "in_progress_avg": self.in_progress_total / runs if runs else 0.0,
+                "in_progress_max": self.in_progress_max,
+            }
+
+
+assistant_run_metrics = RunMetrics()
+
+
+# 기본 메트릭 훅: 누적 통계(/assistant/metrics) + Prometheus 지표(/metrics)
+def record_run_metrics(timings: RunTimings):
+    assistant_run_metrics.record(timings)
+    observe_assistant_run(timings)
 
 # Assistant ID를 사용해 특정 Assistant와 대화하는 클래스
 class AssistantService:
-    def __init__(self, client=None, assistant_id=None):
+    def __init__(self, client=None, assistant_id=None, async_client=None, metrics_hook=None):
         """
         OpenAI Assistant 서비스 초기화
         
         Args:
             client: OpenAI 클라이언트 객체
             assistant_id: 사용할 OpenAI Assistant의 ID
+            async_client: 스트리밍에 사용할 AsyncOpenAI 클라이언트 (기본값: 공유 클라이언트)
+            metrics_hook: 실행 종료 시 RunTimings 를 받는 콜백 (기본값: record_run_metrics)
         """
         self.client = client or OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        self.async_client = async_client or shared_async_client
+        self.metrics_hook = metrics_hook or record_run_metrics
         self.assistant_id = assistant_id or os.getenv("OPENAI_ASSISTANT_ID")
+        # 실행에 전달할 도구 목록 (Assistant 에 설정된 도구 + 로컬 함수, 처음 실행할 때 한 번 조회)
+        self._run_tools = None
         
         if not self.assistant_id:
             raise ValueError("Assistant ID가 설정되지 않았습니다. OPENAI_ASSISTANT_ID 환경 변수를 설정하세요.")
@@ -138,52 +287,186 @@ class AssistantService:
             print(f"메시지 조회 중 오류 발생: {e}")
             return []
     
-    def wait_for_completion(self, thread_id, run_id, timeout=60, initial_delay=1, max_delay=5):
+    async def get_run_tools(self):
+        """
+        Assistant 에 설정된 도구(file_search 등)에 로컬 함수 정의(TOOL_DEFINITIONS)를 합친 목록을 반환합니다.
+        실행의 tools 인자는 Assistant 의 도구를 대체하므로 기존 도구를 유지하도록 합쳐서 전달합니다.
+        (같은 이름의 함수는 로컬 정의 사용, 조회에 실패하면 None - Assistant 설정 그대로 실행)
         """
-        Assistant의 응답이 완료될 때까지 대기합니다. 폴링 간격을 점진적으로 늘려 API 호출 횟수를 줄입니다.
+        if self._run_tools is None:
+            try:
+                assistant = await self.async_client.beta.assistants.retrieve(self.assistant_id)
+            except Exception as e:
+                logger.warning("Assistant 도구 조회 실패, Assistant 설정 그대로 실행합니다: %s", e)
+                return None
+            local_names = {tool["function"]["name"] for tool in TOOL_DEFINITIONS}
+            tools = [
+                tool.model_dump(exclude_none=True) for tool in assistant.tools
+                if not (tool.type == "function" and tool.function.name in local_names)
+            ]
+            self._run_tools = tools + TOOL_DEFINITIONS
+        return self._run_tools
+
+    async def stream_run(self, query, thread_id=None, handler=None, timeout=ASSISTANT_RUN_TIMEOUT, **run_options):
+        """
+        사용자 메시지를 추가하면서 실행을 생성하고(run-stream API) 텍스트 조각을 도착 즉시 반환합니다.
+        기존 스레드는 runs.stream(additional_messages), 새 대화는 create_and_run_stream 한 번으로 처리합니다.
+        실행이 함수 호출(requires_action)을 요청하면 get_price/get_news 를 로컬에서 동시에 실행하고
+        결과를 제출한 뒤 같은 스트림으로 이어갑니다. 폴링 없이 실행 완료 이벤트가 오는 즉시 종료됩니다.
         
         Args:
-            thread_id: 스레드 ID
-            run_id: 실행 ID
-            timeout: 최대 대기 시간(초) (기본값: 60초)
-            initial_delay: 초기 대기 시간(초) (기본값: 1초)
-            max_delay: 최대 대기 시간(초) (기본값: 5초)
+            query: 사용자 질문
+            thread_id: 실행할 스레드 ID (없으면 스레드 생성과 실행을 한 번에 요청)
+            handler: 실행 이벤트/시간을 기록할 RunEventHandler (실행 후 handler.timings 로 상태/스레드 확인)
+            timeout: 최대 대기 시간(초) - 초과하면 실행을 취소하고 status 를 'timeout' 으로 기록
+            run_options: 실행 요청에 전달할 추가 인자 (instructions 등)
             
-        Returns:
-            완료 여부(Boolean)와 최종 상태
+        Yields:
+            텍스트 조각
         """
-        import time
-        
-        start_time = time.time()
-        delay = initial_delay
-        
-        # 첫 번째 상태 확인 전에 잠시 대기 (대부분의 간단한 응답은 1-2초 내에 완료됨)
-        time.sleep(initial_delay)
-        
-        while time.time() - start_time < timeout:
-            run = self.get_run_status(thread_id, run_id)
-            if not run:
-                return False, "오류 발생"
-                
-            # 완료된 경우 즉시 반환
-            if run.status in ["completed", "failed", "expired", "cancelled"]:
-                return run.status == "completed", run.status
-            
-            # 진행 상태에 따라 다음 폴링 간격 조정
-            if run.status == "queued":
-                # 대기열에 있는 경우 더 길게 대기
-                delay = min(delay * 1.5, max_delay)
-            elif run.status == "in_progress":
-                # 진행 중인 경우 약간 더 길게 대기
-                delay = min(delay * 1.2, max_delay)
-            
-            # 다음 확인 전 대기
-            time.sleep(delay)
+        handler = handler or RunEventHandler()
+        handler.timings.thread_id = thread_id
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+
+        threads = self.async_client.beta.threads
+        user_message = {"role": "user", "content": query}
+        if ASSISTANT_LOCAL_TOOLS and "tools" not in run_options:
+            tools = await self.get_run_tools()
+            if tools is not None:
+                run_options["tools"] = tools
+        if thread_id:
+            manager = threads.runs.stream(
+                thread_id=thread_id,
+                assistant_id=self.assistant_id,
+                additional_messages=[user_message],
+                event_handler=handler,
+                timeout=timeout,
+                **run_options
+            )
+        else:
+            manager = threads.create_and_run_stream(
+                assistant_id=self.assistant_id,
+                thread={"messages": [user_message]},
+                event_handler=handler,
+                timeout=timeout,
+                **run_options
+            )
+
+        # 함수 호출 결과는 실행 단위로 캐시
+        tool_executor = ToolExecutor()
+
+        try:
+            while True:
+                async with manager as stream:
+                    deltas = stream.text_deltas
+                    while True:
+                        try:
+                            delta = await asyncio.wait_for(deltas.__anext__(), deadline - loop.time())
+                        except StopAsyncIteration:
+                            break
+                        yield delta
+                    run = stream.current_run
+
+                if handler.timings.status != "requires_action" or not run or not run.required_action:
+                    break
+
+                # 함수 호출을 로컬에서 동시에 실행하고 결과를 제출한 스트림으로 이어서 수신
+                tool_outputs = await asyncio.wait_for(
+                    tool_executor.execute(run.required_action.submit_tool_outputs.tool_calls),
+                    deadline - loop.time()
+                )
+                handler.timings.status = None
+                manager = threads.runs.submit_tool_outputs_stream(
+                    thread_id=handler.timings.thread_id,
+                    run_id=handler.timings.run_id,
+                    tool_outputs=tool_outputs,
+                    event_handler=RunEventHandler(handler.timings),
+                    timeout=timeout
+                )
+        except asyncio.TimeoutError:
+            handler.timings.finish("timeout")
+            await self.cancel_run(handler.timings.thread_id, handler.timings.run_id)
+        except (asyncio.CancelledError, GeneratorExit):
+            # 클라이언트 연결 종료 등으로 중단되면 업스트림 실행도 취소 (현재 태스크와 분리해서 실행)
+            handler.timings.finish("cancelled")
+            if handler.timings.run_id:
+                task = asyncio.ensure_future(self.cancel_run(handler.timings.thread_id, handler.timings.run_id))
+                _background_tasks.add(task)
+                task.add_done_callback(_background_tasks.discard)
+            raise
+        except NotFoundError:
+            # 업스트림에서 삭제된 스레드는 레지스트리에서도 제거
+            if thread_id:
+                thread_registry.discard(thread_id)
+            raise
+        except Exception:
+            # 그 밖의 오류도 실행이 requires_action/in_progress 로 남아 다음 턴을 막지 않도록 취소
+            handler.timings.finish("error")
+            await self.cancel_run(handler.timings.thread_id, handler.timings.run_id)
+            raise
+        finally:
+            if handler.timings.status is None:
+                handler.timings.finish("error")
+            try:
+                self.metrics_hook(handler.timings)
+            except Exception as e:
+                logger.warning("실행 메트릭 기록 중 오류 발생: %s", e)
+
+    async def cancel_run(self, thread_id, run_id):
+        """
+        진행 중인 실행을 취소합니다. (이미 종료된 실행이면 무시)
+        """
+        if not thread_id or not run_id:
+            return
+        try:
+            await self.async_client.beta.threads.runs.cancel(run_id=run_id, thread_id=thread_id)
+        except Exception as e:
+            logger.warning("실행 취소 중 오류 발생: %s", e)
+
+    async def resolve_thread(self, thread_id, max_messages_per_thread=20):
+        """
+        이어서 사용할 스레드와 현재 메시지 수를 결정합니다.
+        레지스트리에 있는 스레드는 API 호출 없이 사용하고, 처음 보는 스레드만 한 번 조회해서 등록합니다.
         
-        # 타임아웃 도달
-        return False, "timeout"
+        Returns:
+            (스레드 ID, 메시지 수) - 새 스레드가 필요하면 (None, 0)
+        """
+        if not thread_id:
+            return None, 0
+
+        message_count = thread_registry.get(thread_id)
+        if message_count is None:
+            try:
+                # 존재 확인과 메시지 수 계산을 한 번의 조회로 처리 (목록 조회 최대 100개)
+                messages = await self.async_client.beta.threads.messages.list(
+                    thread_id=thread_id,
+                    limit=min(max_messages_per_thread, 100)
+                )
+                message_count = len(messages.data)
+            except Exception as e:
+                logger.warning("스레드 %s에 접근할 수 없습니다: %s, 새 스레드를 생성합니다.", thread_id, e)
+                return None, 0
+            thread_registry.record(thread_id, message_count)
+
+        # 스레드당 최대 메시지 수를 넘으면 새 스레드로 전환
+        if message_count >= max_messages_per_thread:
+            logger.info("스레드 %s의 메시지 수(%d)가 최대치에 도달했습니다. 새 스레드를 생성합니다.", thread_id, message_count)
+            return None, 0
+
+        return thread_id, message_count
+
+    @staticmethod
+    def _record_turn(handler, message_count):
+        """
+        실행 결과에 따라 스레드의 메시지 수를 갱신합니다. (사용자 메시지 + 완료 시 응답 메시지)
+        """
+        thread_id = handler.timings.thread_id
+        if thread_id:
+            added = 2 if handler.timings.status == "completed" else 1
+            thread_registry.record(thread_id, message_count + added)
     
-    def get_response(self, query, thread_id=None, max_messages_per_thread=20):
+    async def get_response(self, query, thread_id=None, max_messages_per_thread=20):
         """
         사용자 질문에 대한 Assistant의 응답을 생성합니다.
         
@@ -196,56 +479,61 @@ class AssistantService:
             응답 텍스트와 스레드 ID
         """
         # 스레드 관리 - 기존 스레드가 없거나 메시지가 너무 많으면 새로 생성
-        if thread_id:
-            try:
-                # 기존 스레드의 메시지 수 확인
-                messages = self.get_messages(thread_id, limit=1)
-                if not messages:
-                    # 스레드가 존재하지 않거나 접근 불가능한 경우 새로 생성
-                    print(f"스레드 {thread_id}에 접근할 수 없습니다. 새 스레드를 생성합니다.")
-                    thread_id = self.create_thread()
-            except Exception as e:
-                print(f"스레드 확인 중 오류 발생: {e}, 새 스레드를 생성합니다.")
-                thread_id = self.create_thread()
-        else:
-            # 스레드가 없으면 새로 생성
-            thread_id = self.create_thread()
-        
-        if not thread_id:
-            return "스레드 생성에 실패했습니다.", None
+        thread_id, message_count = await self.resolve_thread(thread_id, max_messages_per_thread)
         
+        handler = RunEventHandler()
         try:
-            # 메시지 추가
-            self.add_message_to_thread(thread_id, query)
-            
-            # Assistant 실행
-            run_id = self.run_assistant(thread_id)
-            if not run_id:
-                return "Assistant 실행에 실패했습니다.", thread_id
-            
-            # 완료될 때까지 대기 (최적화된 폴링 방식)
-            completed, status = self.wait_for_completion(thread_id, run_id, initial_delay=1.5, max_delay=6)
-            if not completed:
+            # 메시지 추가 + Assistant 실행 - 완료 이벤트가 오는 즉시 반환 (폴링 없음)
+            chunks = [delta async for delta in self.stream_run(query, thread_id, handler)]
+            thread_id = handler.timings.thread_id
+            self._record_turn(handler, message_count)
+
+            status = handler.timings.status
+            if status != "completed":
                 return f"응답 생성 실패: {status}", thread_id
             
-            # 응답 가져오기 - 최신 메시지 1개만 조회하여 API 호출 최소화
-            messages = self.get_messages(thread_id, limit=1)
-            if not messages:
-                return "응답 메시지를 가져오는데 실패했습니다.", thread_id
-            
-            # 가장 최근 메시지가 assistant 응답인지 확인
-            latest_message = messages[0]
-            if latest_message.role != "assistant":
-                return "예상치 못한 응답 형식입니다.", thread_id
+            return "".join(chunks), thread_id
             
-            # 응답 텍스트 추출 및 캐싱
-            response_text = ""
-            for content_item in latest_message.content:
-                if content_item.type == "text":
-                    response_text += content_item.text.value
-            
-            return response_text, thread_id
+        except Exception as e:
+            logger.exception("응답 생성 중 오류 발생")
+            return f"오류가 발생했습니다: {str(e)}", handler.timings.thread_id
+
+    async def stream_response(self, query, thread_id=None, max_messages_per_thread=20):
+        """
+        Assistants run-stream API 로 응답을 생성하며 이벤트를 도착 즉시 반환합니다.
+        
+        Args:
+            query: 사용자 질문
+            thread_id: 기존 스레드 ID (없으면 새로 생성)
+            max_messages_per_thread: 스레드당 최대 메시지 수 (초과 시 새 스레드 생성)
             
+        Yields:
+            (이벤트 이름, 데이터) 튜플 - thread, token, done, error
+        """
+        thread_id, message_count = await self.resolve_thread(thread_id, max_messages_per_thread)
+
+        handler = RunEventHandler()
+        try:
+            thread_sent = False
+            chunks = []
+            async for delta in self.stream_run(query, thread_id, handler):
+                # 새 스레드는 실행 생성 이벤트로 ID 를 알게 되므로 첫 토큰 전에 전달
+                if not thread_sent and handler.timings.thread_id:
+                    yield "thread", {"thread_id": handler.timings.thread_id}
+                    thread_sent = True
+                chunks.append(delta)
+                yield "token", {"content": delta}
+
+            thread_id = handler.timings.thread_id
+            self._record_turn(handler, message_count)
+
+            status = handler.timings.status
+            if status != "completed":
+                yield "error", {"detail": f"응답 생성 실패: {status}", "thread_id": thread_id}
+                return
+
+            yield "done", {"response": "".join(chunks), "thread_id": thread_id}
+
         except Exception as e:
-            print(f"응답 생성 중 오류 발생: {e}")
-            return f"오류가 발생했습니다: {str(e)}", thread_id 
\ No newline at end of file
+            logger.exception("스트리밍 응답 생성 중 오류 발생")
+            yield "error", {"detail": f"오류가 발생했습니다: {str(e)}", "thread_id": handler.timings.thread_id}
@@ -0,0 +1,195 @@
+import asyncio
+import logging
+import math
+import os
+import re
+import time
+from datetime import datetime
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.services.public_data_client import KOREA_LAND, UpstreamError, public_data_client
+from src.database.database import AsyncSessionLocal
+from src.database.models.database_model import KoreaLandRecord, KoreaLandSyncState
+
+logger = logging.getLogger(__name__)
+
+# 한국부동산원 Open API 데이터셋 경로 (이름 -> odcloud 경로)
+KOREA_LAND_DATASETS = {
+    "sale_index": '/15069826/v1/uddi:754c056e-8dea-4201-8a61-88e56da67e83',  # 월별/지역별 아파트 매매가격지수
+    "sale_cost": '/15069826/v1/uddi:c921d88a-6deb-4904-a658-e1fdb5437c92',  # 월별 아파트 평균 매매가격
+    "rent_index": '/15044018/v1/uddi:dd77d0b6-6927-46f4-884c-b5a0c1751b65',  # 월별/지역별 아파트 전세가격지수
+    "rent_cost": '/15067573/v1/uddi:d2dae93c-51eb-4873-983e-a71fdf4835f9',  # 월별 아파트 평균 전세가격
+}
+
+# 동기화 설정
+KOREA_LAND_SYNC_PER_PAGE = int(os.getenv("KOREA_LAND_SYNC_PER_PAGE", "1000"))  # 업스트림 요청당 행 수 (perPage)
+KOREA_LAND_SYNC_CONCURRENCY = int(os.getenv("KOREA_LAND_SYNC_CONCURRENCY", "4"))  # 동시에 요청할 페이지 수
+# 조회 API 의 perPage 상한
+KOREA_LAND_MAX_PER_PAGE = int(os.getenv("KOREA_LAND_MAX_PER_PAGE", "1000"))
+
+# 행에서 지역 / 기준 년월을 찾을 컬럼 이름 (데이터셋마다 컬럼명이 다름)
+REGION_KEYS = ("지역", "지역명", "지역구분", "시도", "시군구")
+MONTH_KEYS = ("년월", "기준년월", "조사년월", "시점", "기준일자", "조사일자", "날짜")
+
+_DIGITS = re.compile(r"\d+")
+
+
+def extract_month(value):
+    """
+    '2023-01' / '2023.1' / '202301' / '20230115' -> '202301', 그 외는 None
+    """
+    parts = _DIGITS.findall(str(value or ""))
+    if not parts:
+        return None
+    if len(parts[0]) >= 6:
+        return parts[0][:6]
+    if len(parts[0]) == 4 and len(parts) > 1 and 1 <= int(parts[1]) <= 12:
+        return f"{parts[0]}{int(parts[1]):02d}"
+    return None
+
+
+def extract_fields(row):
+    """
+    odcloud 행에서 (지역, 기준 년월) 을 추출합니다. 해당 컬럼이 없으면 None
+    """
+    region = next((str(row[key]).strip() for key in REGION_KEYS if row.get(key)), None)
+    month = next((extract_month(row[key]) for key in MONTH_KEYS if row.get(key)), None)
+    return region, month
+
+
+async def fetch_page(path: str, page: int, per_page: int):
+    response = await public_data_client.get(KOREA_LAND, path, params={'page': page, 'perPage': per_page})
+    if response.status_code != 200:
+        raise UpstreamError(KOREA_LAND, f"HTTP {response.status_code} (page {page})")
+    return response.json()
+
+
+async def save_page(db: AsyncSession, dataset: str, page: int, per_page: int, rows):
+    """
+    한 페이지의 행을 (dataset, row_no) 기준으로 upsert 합니다. 행 번호는 업스트림 정렬 순서를 따름
+    """
+    if not rows:
+        return 0
+    values = []
+    for index, row in enumerate(rows):
+        region, month = extract_fields(row)
+        values.append({"dataset": dataset, "row_no": (page - 1) * per_page + index + 1,
+                       "region": region, "month": month, "data": row})
+    stmt = insert(KoreaLandRecord).values(values)
+    await db.execute(stmt.on_conflict_do_update(
+        constraint="uq_korea_land_record_dataset_row_no",
+        set_={"region": stmt.excluded.region, "month": stmt.excluded.month, "data": stmt.excluded.data},
+    ))
+    return len(values)
+
+
+async def sync_dataset(dataset: str, per_page: int = KOREA_LAND_SYNC_PER_PAGE,
+                       concurrency: int = KOREA_LAND_SYNC_CONCURRENCY, full: bool = False):
+    """
+    데이터셋을 high-water mark(synced_rows) 이후 페이지부터 concurrency 페이지씩 동시에 받아 저장합니다.
+    업스트림 전체 행 수가 저장된 행 수보다 줄었으면(데이터셋 교체) 처음부터 다시 받습니다.
+    페이지 묶음마다 커밋하므로 중간에 실패해도 다음 실행은 마지막으로 저장된 위치부터 이어 받습니다.
+    다시 받는 동안에도 기존 행은 지우지 않고 같은 행 번호를 덮어쓰며, 끝까지 받은 뒤에
+    전체 행 수를 넘는 행만 정리합니다. (동기화 중에도 조회 API 가 잘린 데이터셋을 반환하지 않도록)
+    """
+    path = KOREA_LAND_DATASETS[dataset]
+    started = time.perf_counter()
+    async with AsyncSessionLocal() as db:
+        state = await db.get(KoreaLandSyncState, dataset)
+        if state is None:
+            state = KoreaLandSyncState(dataset=dataset, synced_rows=0, total_count=0)
+            db.add(state)
+        synced_rows = 0 if full else (state.synced_rows or 0)
+
+        # 마지막으로 일부만 저장된 페이지부터 (이미 모두 받았다면 빈 페이지 하나로 전체 건수만 확인)
+        start_page = synced_rows // per_page + 1
+        first = await fetch_page(path, start_page, per_page)
+        total_count = int(first.get("totalCount") or 0)
+        if total_count < synced_rows:
+            logger.info("%s 전체 행 수 감소 (%d -> %d), 처음부터 다시 동기화", dataset, synced_rows, total_count)
+            synced_rows, start_page = 0, 1
+            first = await fetch_page(path, start_page, per_page)
+            total_count = int(first.get("totalCount") or 0)
+
+        saved = await save_page(db, dataset, start_page, per_page, first.get("data") or [])
+        fetched_pages = 1
+        synced_rows = max(synced_rows, min(total_count, (start_page - 1) * per_page + saved))
+
+        async def commit():
+            state.synced_rows = synced_rows
+            state.total_count = total_count
+            state.synced_at = datetime.now()
+            await db.commit()
+
+        await commit()
+
+        pages = list(range(start_page + 1, math.ceil(total_count / per_page) + 1))
+        for offset in range(0, len(pages), concurrency):
+            window = pages[offset:offset + concurrency]
+            payloads = await asyncio.gather(*(fetch_page(path, page, per_page) for page in window))
+            for page, payload in zip(window, payloads):
+                saved += await save_page(db, dataset, page, per_page, payload.get("data") or [])
+            fetched_pages += len(window)
+            synced_rows = min(total_count, window[-1] * per_page)
+            await commit()
+
+        # 업스트림에서 줄어든 뒷부분 행 정리
+        await db.execute(delete(KoreaLandRecord).where(KoreaLandRecord.dataset == dataset,
+                                                       KoreaLandRecord.row_no > total_count))
+        await commit()
+
+    summary = {"dataset": dataset, "pages": fetched_pages, "rows": saved, "synced_rows": synced_rows,
+               "total_count": total_count, "seconds": round(time.perf_counter() - started, 3)}
+    logger.info("한국부동산원 데이터셋 동기화 완료: %s", summary)
+    return summary
+
+
+async def sync_all(datasets=None, **kwargs):
+    """
+    데이터셋별로 차례대로 동기화합니다. (실패한 데이터셋은 기록하고 다음 데이터셋 진행)
+    """
+    results = []
+    for dataset in datasets or KOREA_LAND_DATASETS:
+        try:
+            results.append(await sync_dataset(dataset, **kwargs))
+        except Exception as e:
+            logger.warning("한국부동산원 데이터셋 동기화 실패 %s: %s", dataset, e)
+            results.append({"dataset": dataset, "error": str(e)})
+    return results
+
+
+async def query_records(db: AsyncSession, dataset: str, page: int = 1, per_page: int = 10, region: str = None,
+                        start_month: str = None, end_month: str = None):
+    """
+    저장된 행을 지역 / 기준 년월(YYYYMM, 양끝 포함)로 필터링해 odcloud 응답과 같은 형태로 반환합니다.
+    """
+    conditions = [KoreaLandRecord.dataset == dataset]
+    if region:
+        conditions.append(KoreaLandRecord.region == region)
+    if start_month:
+        conditions.append(KoreaLandRecord.month >= start_month)
+    if end_month:
+        conditions.append(KoreaLandRecord.month <= end_month)
+
+    match_count = (await db.execute(select(func.count()).select_from(KoreaLandRecord).where(*conditions))).scalar()
+    result = await db.execute(
+        select(KoreaLandRecord.data)
+        .where(*conditions)
+        .order_by(KoreaLandRecord.row_no)
+        .offset((page - 1) * per_page)
+        .limit(per_page)
+    )
+    data = [row for (row,) in result.all()]
+    state = await db.get(KoreaLandSyncState, dataset)
+    return {
+        "page": page,
+        "perPage": per_page,
+        "totalCount": state.total_count if state else 0,
+        "matchCount": match_count,
+        "currentCount": len(data),
+        "syncedAt": state.synced_at if state else None,
+        "data": data,
+    }
@@ -0,0 +1,197 @@
+import asyncio
+import json
+import logging
+import os
+import time
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.services.ministry_trade_parser import parse_trade_stream
+from src.api.services.public_data_client import MINISTRY, UpstreamError, public_data_client
+from src.database.models.database_model import LegalDongCode
+
+logger = logging.getLogger(__name__)
+
+MINISTRY_TRADE_PATH = '/getRTMSDataSvcAptTrade'
+
+# 일괄 조회 설정
+MINISTRY_BULK_CONCURRENCY = int(os.getenv("MINISTRY_BULK_CONCURRENCY", "8"))  # 동시 작업 수 (MINISTRY_API_MAX_CONCURRENCY 이하)
+MINISTRY_BULK_RATE_LIMIT = float(os.getenv("MINISTRY_BULK_RATE_LIMIT", "10"))  # 초당 요청 수 (일일 호출 한도 보호)
+MINISTRY_BULK_ROWS = int(os.getenv("MINISTRY_BULK_ROWS", "1000"))  # 페이지당 행 수 (numOfRows)
+MINISTRY_BULK_MAX_JOBS = int(os.getenv("MINISTRY_BULK_MAX_JOBS", "5000"))  # 요청 하나의 (지역, 월) 조합 상한
+MINISTRY_BULK_RETRIES = int(os.getenv("MINISTRY_BULK_RETRIES", "2"))
+
+class BulkRequestError(ValueError):
+    pass
+
+
+# 토큰 버킷 방식의 초당 요청 수 제한
+class AsyncRateLimiter:
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+def month_range(start_ymd: str, end_ymd: str):
+    """
+    '202301' ~ '202303' -> ['202301', '202302', '202303']
+    """
+    for value in (start_ymd, end_ymd):
+        if len(value) != 6 or not value.isdigit() or not 1 <= int(value[4:]) <= 12:
+            raise BulkRequestError(f"계약년월은 YYYYMM 형식이어야 합니다: {value}")
+    start, end = int(start_ymd[:4]) * 12 + int(start_ymd[4:]) - 1, int(end_ymd[:4]) * 12 + int(end_ymd[4:]) - 1
+    if start > end:
+        raise BulkRequestError(f"시작 월이 종료 월보다 늦습니다: {start_ymd} > {end_ymd}")
+    return [f"{index // 12:04d}{index % 12 + 1:02d}" for index in range(start, end + 1)]
+
+
+def select_lawd_codes(codes):
+    """
+    10자리 법정동 코드 목록에서 실거래가 API 의 LAWD_CD(시군구 5자리)를 추출합니다.
+    구가 있는 시(예: 수원시 41110)는 구 코드(41111, 41113 ...)로 조회하므로 제외합니다.
+    """
+    sigungu = sorted({code[:5] for code in codes if len(code) == 10 and code[2:5] != "000" and code[5:] == "00000"})
+    with_districts = {code[:4] for code in sigungu if code[4] != "0"}
+    return [code for code in sigungu if not (code[4] == "0" and code[:4] in with_districts)]
+
+
+async def load_lawd_codes(db: AsyncSession, prefixes=None):
+    """
+    legal_dong_code 테이블(존재하는 법정동)에서 LAWD_CD 목록을 읽습니다.
+    prefixes 가 있으면 그 코드로 시작하는 것만 ('11' -> 서울 전체, '41110' -> 수원시 구들)
+    """
+    result = await db.execute(select(LegalDongCode.code).where(LegalDongCode.is_active.is_(True)))
+    codes = select_lawd_codes(code for (code,) in result.all())
+    if prefixes:
+        codes = [code for code in codes if any(code.startswith(prefix[:5]) or prefix.startswith(code)
+                                               for prefix in prefixes)]
+    return codes
+
+
+def plan_jobs(lawd_codes, months, max_jobs: int = MINISTRY_BULK_MAX_JOBS):
+    """
+    (LAWD_CD, 계약년월) 조합 목록을 만듭니다. 상한을 넘으면 BulkRequestError.
+    """
+    jobs = [(lawd_cd, deal_ymd) for lawd_cd in lawd_codes for deal_ymd in months]
+    if max_jobs and len(jobs) > max_jobs:
+        raise BulkRequestError(f"조회 조합 수({len(jobs)})가 상한({max_jobs})을 넘습니다.")
+    return jobs
+
+
+# 지역 x 월 실거래가 일괄 조회
+class MinistryTradeFetcher:
+    def __init__(self, concurrency: int = MINISTRY_BULK_CONCURRENCY, rate_limit: float = MINISTRY_BULK_RATE_LIMIT,
+                 rows: int = MINISTRY_BULK_ROWS, retries: int = MINISTRY_BULK_RETRIES, client=public_data_client):
+        self.concurrency = concurrency
+        self.rows = rows
+        self.retries = retries
+        self.client = client
+        self.rate_limiter = AsyncRateLimiter(rate_limit, burst=max(1, int(rate_limit)))
+
+    async def fetch_page(self, lawd_cd: str, deal_ymd: str, page_no: int):
+        """
+        한 페이지를 조회합니다. 본문은 받는 대로 파서에 넣어 전체 응답을 메모리에 두지 않음
+        (5xx / 업스트림 오류는 retries 번까지 지수 백오프로 재시도)
+        """
+        params = {'LAWD_CD': lawd_cd, 'DEAL_YMD': deal_ymd, 'numOfRows': self.rows, 'pageNo': page_no}
+        for attempt in range(self.retries + 1):
+            await self.rate_limiter.acquire()
+            try:
+                async with self.client.stream(MINISTRY, MINISTRY_TRADE_PATH, params=params) as response:
+                    if response.status_code < 500:
+                        if response.status_code != 200:
+                            raise BulkRequestError(f"HTTP {response.status_code}")
+                        return await parse_trade_stream(response.aiter_bytes(), lawd_cd)
+                    error = UpstreamError(MINISTRY, f"HTTP {response.status_code}")
+            except UpstreamError as e:
+                error = e
+            if attempt == self.retries:
+                raise error
+            await asyncio.sleep(2 ** attempt)
+
+    async def fetch_month(self, lawd_cd: str, deal_ymd: str):
+        """
+        (지역, 월) 하나의 모든 페이지를 순서대로 조회합니다. (totalCount 기준으로 다음 페이지 요청)
+        """
+        page_no, fetched = 1, 0
+        while True:
+            items, total_count = await self.fetch_page(lawd_cd, deal_ymd, page_no)
+            for item in items:
+                yield item
+            fetched += len(items)
+            if not items or fetched >= total_count:
+                return
+            page_no += 1
+
+    async def fetch(self, jobs):
+        """
+        (지역, 월) 조합을 concurrency 개의 작업자로 동시에 조회하고 도착하는 대로 레코드를 반환합니다.
+
+        Yields:
+            거래 레코드 {"deal_ymd", ...ministry_trade_parser 의 타입 변환된 필드}, 실패한 조합은 {"error", "lawd_cd", "deal_ymd"},
+            마지막에 {"summary": {...}}
+        """
+        pending = asyncio.Queue()
+        for job in jobs:
+            pending.put_nowait(job)
+        results = asyncio.Queue(maxsize=self.rows * 2)
+        summary = {"jobs": len(jobs), "records": 0, "failed": 0}
+        started = time.perf_counter()
+        done = object()
+
+        async def worker():
+            while True:
+                try:
+                    lawd_cd, deal_ymd = pending.get_nowait()
+                except asyncio.QueueEmpty:
+                    await results.put(done)
+                    return
+                try:
+                    async for item in self.fetch_month(lawd_cd, deal_ymd):
+                        await results.put({"deal_ymd": deal_ymd, **item})
+                except Exception as e:
+                    logger.warning("실거래가 일괄 조회 실패 %s %s: %s", lawd_cd, deal_ymd, e)
+                    await results.put({"error": str(e), "lawd_cd": lawd_cd, "deal_ymd": deal_ymd})
+
+        workers = [asyncio.ensure_future(worker()) for _ in range(min(self.concurrency, len(jobs)) or 1)]
+        try:
+            remaining = len(workers)
+            while remaining:
+                record = await results.get()
+                if record is done:
+                    remaining -= 1
+                    continue
+                if "error" in record:
+                    summary["failed"] += 1
+                else:
+                    summary["records"] += 1
+                yield record
+        finally:
+            # 클라이언트 연결이 끊기는 등으로 중단되면 남은 작업 취소
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        summary["seconds"] = round(time.perf_counter() - started, 3)
+        yield {"summary": summary}
+
+
+def to_ndjson(record):
+    return json.dumps(record, ensure_ascii=False, default=str) + "\n"
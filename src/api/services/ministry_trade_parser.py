@@ -0,0 +1,228 @@
+import hashlib
+from datetime import date
+from xml.etree.ElementTree import ParseError, XMLPullParser
+
+# 한 번에 파서에 넣을 바이트 수
+PARSE_CHUNK_SIZE = 64 * 1024
+
+# 정상 응답 코드 (구 API '00', 신 API '000')
+SUCCESS_RESULT_CODES = {"00", "000"}
+
+# 정상 응답의 루트 태그 (게이트웨이 오류는 <OpenAPI_ServiceResponse> 등 다른 루트로 옴)
+RESPONSE_ROOT_TAG = "response"
+# 게이트웨이 오류 응답에만 있는 태그 (인증키 미등록, 트래픽 초과 등)
+GATEWAY_ERROR_TAGS = ("returnReasonCode", "errMsg", "returnAuthMsg")
+
+
+class TradeParseError(ValueError):
+    pass
+
+
+def to_int(text: str):
+    """
+    '  12,500' -> 12500, 빈 값/형식 오류는 None
+    """
+    try:
+        return int(text.replace(",", "").strip())
+    except (AttributeError, ValueError):
+        return None
+
+
+def to_float(text: str):
+    try:
+        return float(text.replace(",", "").strip())
+    except (AttributeError, ValueError):
+        return None
+
+
+def to_str(text: str):
+    text = (text or "").strip()
+    return text or None
+
+
+def parse_compact_date(text: str):
+    """
+    해제사유발생일 '24.03.05' / '20240305' -> date(2024, 3, 5), 그 외는 None
+    """
+    digits = "".join(ch for ch in (text or "") if ch.isdigit())
+    try:
+        if len(digits) == 6:
+            return date(2000 + int(digits[:2]), int(digits[2:4]), int(digits[4:]))
+        if len(digits) == 8:
+            return date(int(digits[:4]), int(digits[4:6]), int(digits[6:]))
+    except ValueError:
+        pass
+    return None
+
+
+# 응답 태그 -> 필드 (구 API 는 한글 태그, 신 API 는 영문 태그)
+TAG_FIELDS = {
+    "거래금액": "deal_amount", "dealAmount": "deal_amount",
+    "년": "deal_year", "dealYear": "deal_year",
+    "월": "deal_month", "dealMonth": "deal_month",
+    "일": "deal_day", "dealDay": "deal_day",
+    "전용면적": "exclusive_area", "excluUseAr": "exclusive_area",
+    "법정동": "legal_dong_name", "umdNm": "legal_dong_name",
+    "지역코드": "lawd_cd", "sggCd": "lawd_cd",
+    "법정동읍면동코드": "umd_cd", "umdCd": "umd_cd",
+    "아파트": "apt_name", "aptNm": "apt_name",
+    "aptDong": "apt_dong",
+    "일련번호": "apt_seq", "aptSeq": "apt_seq",
+    "지번": "jibun", "jibun": "jibun",
+    "층": "floor", "floor": "floor",
+    "건축년도": "build_year", "buildYear": "build_year",
+    "거래유형": "deal_type", "dealingGbn": "deal_type",
+    "해제여부": "cancel_flag", "cdealType": "cancel_flag",
+    "해제사유발생일": "canceled_date", "cdealDay": "canceled_date",
+}
+
+# 같은 거래를 식별하는 필드 (API 에 거래 ID 가 없으므로 조합으로 식별, 해제 여부는 갱신 대상)
+TRADE_KEY_FIELDS = ("lawd_cd", "legal_dong_name", "jibun", "apt_name", "apt_dong", "floor",
+                    "exclusive_area", "deal_date", "deal_amount")
+
+
+def trade_key(record):
+    raw = "|".join("" if record[field] is None else str(record[field]) for field in TRADE_KEY_FIELDS)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def build_record(values, lawd_cd: str = None):
+    """
+    item 하나의 {필드: 문자열} 을 타입이 있는 거래 레코드로 변환합니다. (금액 단위: 만원)
+    응답에 지역코드가 없으면 요청한 lawd_cd 를 사용합니다.
+    """
+    year, month, day = to_int(values.get("deal_year")), to_int(values.get("deal_month")), to_int(values.get("deal_day"))
+    try:
+        deal_date = date(year, month, day)
+    except (TypeError, ValueError):
+        deal_date = None
+
+    lawd_cd = to_str(values.get("lawd_cd")) or lawd_cd
+    umd_cd = to_str(values.get("umd_cd"))
+    record = {
+        "lawd_cd": lawd_cd,
+        "legal_dong_code": f"{lawd_cd}{umd_cd}" if lawd_cd and umd_cd else None,
+        "legal_dong_name": to_str(values.get("legal_dong_name")),
+        "jibun": to_str(values.get("jibun")),
+        "apt_name": to_str(values.get("apt_name")),
+        "apt_dong": to_str(values.get("apt_dong")),
+        "apt_seq": to_str(values.get("apt_seq")),
+        "deal_amount": to_int(values.get("deal_amount")),
+        "exclusive_area": to_float(values.get("exclusive_area")),
+        "floor": to_int(values.get("floor")),
+        "build_year": to_int(values.get("build_year")),
+        "deal_date": deal_date,
+        "deal_type": to_str(values.get("deal_type")),
+        "is_canceled": (to_str(values.get("cancel_flag")) or "").upper() == "O",
+        "canceled_date": parse_compact_date(values.get("canceled_date")),
+    }
+    record["trade_key"] = trade_key(record)
+    return record
+
+
+# 실거래가 응답 XML 증분 파서
+# 응답 본문을 조각으로 받아 item 이 끝날 때마다 레코드로 변환한 뒤 XML 요소를 버리므로
+# 본문 전체나 XML 트리를 메모리에 두지 않음 (메모리에는 변환된 레코드만 남음)
+class TradeXmlParser:
+    def __init__(self, lawd_cd: str = None):
+        self.lawd_cd = lawd_cd
+        self._parser = XMLPullParser(events=("start", "end"))
+        self._items = None
+        self._root_checked = False
+        self.gateway_error = {}
+        self.result_code = None
+        self.result_msg = None
+        self.total_count = 0
+
+    def _events(self):
+        for event, elem in self._parser.read_events():
+            if event == "start":
+                if not self._root_checked:
+                    self._root_checked = True
+                    if elem.tag != RESPONSE_ROOT_TAG:
+                        self.gateway_error["root"] = elem.tag
+                if elem.tag == "items":
+                    self._items = elem
+                continue
+
+            tag = elem.tag
+            if self.gateway_error:
+                # 게이트웨이 오류 응답은 끝까지 읽어 사유를 모은 뒤 close 에서 오류로 처리
+                if tag in GATEWAY_ERROR_TAGS:
+                    self.gateway_error[tag] = to_str(elem.text)
+                continue
+            if tag in GATEWAY_ERROR_TAGS:
+                raise TradeParseError(f"게이트웨이 오류 응답: {tag}={to_str(elem.text)}")
+            if tag == "item":
+                values = {TAG_FIELDS[child.tag]: child.text for child in elem if child.tag in TAG_FIELDS}
+                yield build_record(values, self.lawd_cd)
+                if self._items is not None:
+                    self._items.clear()
+            elif tag == "resultCode":
+                self.result_code = to_str(elem.text)
+            elif tag == "resultMsg":
+                self.result_msg = to_str(elem.text)
+                if self.result_code is not None and self.result_code not in SUCCESS_RESULT_CODES:
+                    raise TradeParseError(f"{self.result_code} {self.result_msg}")
+            elif tag == "totalCount":
+                self.total_count = to_int(elem.text) or 0
+
+    def feed(self, chunk: bytes):
+        """
+        바이트 조각을 넣고 그 안에서 완성된 거래 레코드를 반환합니다.
+        """
+        try:
+            self._parser.feed(chunk)
+        except ParseError as e:
+            raise TradeParseError(f"XML 파싱 실패: {e}") from e
+        yield from self._events()
+
+    def close(self):
+        try:
+            self._parser.close()
+        except ParseError as e:
+            raise TradeParseError(f"XML 파싱 실패: {e}") from e
+        yield from self._events()
+        if self.gateway_error:
+            reason = ", ".join(f"{tag}={value}" for tag, value in self.gateway_error.items())
+            raise TradeParseError(f"게이트웨이 오류 응답: {reason}")
+        if self.result_code is not None and self.result_code not in SUCCESS_RESULT_CODES:
+            raise TradeParseError(f"{self.result_code} {self.result_msg}")
+
+
+def iter_trade_records(content, parser: TradeXmlParser = None, chunk_size: int = PARSE_CHUNK_SIZE):
+    """
+    응답 본문(bytes) 또는 바이트 조각의 iterable 에서 거래 레코드를 순서대로 반환합니다.
+    전체 건수 등은 parser 인자로 넘긴 TradeXmlParser 에서 확인합니다.
+    """
+    parser = parser or TradeXmlParser()
+    if isinstance(content, (bytes, bytearray)):
+        view = memoryview(content)
+        chunks = (view[start:start + chunk_size] for start in range(0, len(view), chunk_size))
+    else:
+        chunks = content
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+def parse_trade_page(content, lawd_cd: str = None):
+    """
+    응답 XML 에서 (거래 레코드 목록, 전체 건수) 를 추출합니다. 오류 응답이면 TradeParseError.
+    """
+    parser = TradeXmlParser(lawd_cd)
+    records = list(iter_trade_records(content, parser))
+    return records, parser.total_count
+
+
+async def parse_trade_stream(chunks, lawd_cd: str = None):
+    """
+    응답 본문 바이트 조각의 async iterable (httpx 의 response.aiter_bytes()) 에서 도착하는 대로 파싱해
+    (거래 레코드 목록, 전체 건수) 를 반환합니다. 오류 응답이면 TradeParseError.
+    """
+    parser = TradeXmlParser(lawd_cd)
+    records = []
+    async for chunk in chunks:
+        records.extend(parser.feed(chunk))
+    records.extend(parser.close())
+    return records, parser.total_count
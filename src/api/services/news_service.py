@@ -2,7 +2,7 @@ import os
 import requests
 from datetime import datetime, timedelta
 from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from src.database.models.database_model import NewsArticle
 
 # Google Custom Search API를 통한 뉴스 검색
@@ -16,7 +16,7 @@ def google_search(query):
     return [(item['title'], item['link']) for item in results]
 
 # 뉴스 데이터 조회
-def get_news_articles(region_name: str, db: Session):
+async def get_news_articles(region_name: str, db: AsyncSession):
     # 현재 날짜 기준 1달 내 데이터 조회
     one_month_ago = datetime.now().date() - timedelta(days=120)
 
@@ -26,7 +26,7 @@ def get_news_articles(region_name: str, db: Session):
         .where(NewsArticle.published_date > one_month_ago)  # 최근 1달 내 데이터
         .limit(4)  # 최대 4개의 뉴스 기사 조회
     )
-    query_result = db.execute(query).fetchall()
+    query_result = (await db.execute(query)).fetchall()
 
     result = []
     for record in query_result:
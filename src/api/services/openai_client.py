@@ -0,0 +1,74 @@
+import asyncio
+import os
+
+import httpx
+from dotenv import load_dotenv
+from openai import AsyncOpenAI
+
+from src.api.services.request_metrics import track_llm
+
+load_dotenv()
+
+# OpenAI 호환 서버 주소 (부하 테스트 시 로컬 가짜 서버로 교체 가능)
+OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL") or None
+# 요청 타임아웃(초) / 연결 타임아웃(초)
+OPENAI_TIMEOUT = float(os.getenv("OPENAI_TIMEOUT", "30"))
+OPENAI_CONNECT_TIMEOUT = float(os.getenv("OPENAI_CONNECT_TIMEOUT", "5"))
+# 워커당 동시에 진행할 수 있는 OpenAI 요청 수
+OPENAI_MAX_CONCURRENCY = int(os.getenv("OPENAI_MAX_CONCURRENCY", "200"))
+# 공유 HTTP 커넥션 풀 크기
+OPENAI_MAX_CONNECTIONS = int(os.getenv("OPENAI_MAX_CONNECTIONS", "200"))
+OPENAI_MAX_KEEPALIVE = int(os.getenv("OPENAI_MAX_KEEPALIVE", "50"))
+OPENAI_MAX_RETRIES = int(os.getenv("OPENAI_MAX_RETRIES", "2"))
+
+# 모든 요청이 공유하는 HTTP 커넥션 풀
+http_client = httpx.AsyncClient(
+    limits=httpx.Limits(max_connections=OPENAI_MAX_CONNECTIONS,
+                        max_keepalive_connections=OPENAI_MAX_KEEPALIVE),
+    timeout=httpx.Timeout(OPENAI_TIMEOUT, connect=OPENAI_CONNECT_TIMEOUT),
+)
+
+async_client = AsyncOpenAI(
+    api_key=os.getenv("OPENAI_API_KEY") or "",
+    base_url=OPENAI_BASE_URL,
+    http_client=http_client,
+    max_retries=OPENAI_MAX_RETRIES,
+)
+
+# 업스트림 동시 요청 수 제한
+_semaphore = asyncio.Semaphore(OPENAI_MAX_CONCURRENCY)
+
+
+# 채팅 완성 요청 (이벤트 루프를 블로킹하지 않음)
+async def create_chat_completion(timeout: float = OPENAI_TIMEOUT, **kwargs):
+    """
+    AsyncOpenAI 로 chat.completions.create 를 호출합니다.
+
+    Args:
+        timeout: 요청별 타임아웃(초)
+        kwargs: chat.completions.create 인자 (model, messages 등)
+    """
+    async with _semaphore:
+        with track_llm("chat_completion"):
+            return await async_client.chat.completions.create(timeout=timeout, **kwargs)
+
+
+# 채팅 완성 스트리밍 요청 - 토큰(content delta)이 도착하는 대로 yield
+async def stream_chat_completion(timeout: float = OPENAI_TIMEOUT, **kwargs):
+    """
+    stream=True 로 chat.completions.create 를 호출하고 텍스트 조각을 순서대로 반환합니다.
+    스트림이 끝날 때까지 동시성 슬롯을 점유합니다.
+    """
+    async with _semaphore:
+        with track_llm("chat_completion_stream"):
+            stream = await async_client.chat.completions.create(stream=True, timeout=timeout, **kwargs)
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    yield delta
+
+
+async def close_client():
+    await async_client.close()
@@ -0,0 +1,234 @@
+import asyncio
+import logging
+import os
+from collections import defaultdict
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database.database import AsyncSessionLocal
+from src.database.models.database_model import PropertyPriceData, Prediction
+
+logger = logging.getLogger(__name__)
+
+# 서버 기동 시 KB 시세/예측 데이터를 메모리에 적재할지 여부
+PRICE_STORE_ENABLED = os.getenv("PRICE_STORE_ENABLED", "true").lower() == "true"
+
+# 알림으로 예약한 갱신 태스크 참조 유지 (참조가 없으면 실행 중에 GC 될 수 있음)
+_background_tasks = set()
+
+
+def _log_refresh_failure(task):
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning("가격 시계열 저장소 갱신 실패: %s", task.exception())
+
+
+# (region_code, price_type) 하나에 대한 날짜순 정렬 시계열
+class PriceSeries:
+    __slots__ = ("region_code", "price_type", "dates", "prices", "is_prediction")
+
+    def __init__(self, region_code, price_type, dates, prices, is_prediction):
+        self.region_code = region_code
+        self.price_type = price_type
+        self.dates = dates  # datetime64[D]
+        self.prices = prices  # float64 (결측치는 NaN)
+        self.is_prediction = is_prediction  # bool
+
+    @classmethod
+    def from_rows(cls, region_code, price_type, rows):
+        """
+        날짜순 (date, price, is_prediction) 행으로 만듭니다. (DB 직접 조회 경로, price 가 None 이면 NaN)
+        """
+        rows = list(rows)
+        return cls(region_code, price_type,
+                   np.array([row[0] for row in rows], dtype="datetime64[D]"),
+                   np.array([np.nan if row[1] is None else row[1] for row in rows], dtype=np.float64),
+                   np.array([bool(row[2]) for row in rows], dtype=bool))
+
+    def __len__(self):
+        return len(self.dates)
+
+    def slice(self, start_date, end_date):
+        """
+        [start_date, end_date] 구간을 이진 탐색으로 잘라 뷰(view)로 반환합니다.
+        """
+        lo = np.searchsorted(self.dates, np.datetime64(start_date, "D"), side="left")
+        hi = np.searchsorted(self.dates, np.datetime64(end_date, "D"), side="right")
+        return PriceSeries(self.region_code, self.price_type,
+                           self.dates[lo:hi], self.prices[lo:hi], self.is_prediction[lo:hi])
+
+    def tail(self, count: int):
+        """
+        마지막 count 건을 뷰(view)로 반환합니다.
+        """
+        start = max(len(self) - count, 0)
+        return PriceSeries(self.region_code, self.price_type,
+                           self.dates[start:], self.prices[start:], self.is_prediction[start:])
+
+    def mean_price(self):
+        if not len(self) or np.isnan(self.prices).all():
+            return 0
+        return float(np.nanmean(self.prices))
+
+    def to_records(self):
+        """
+        JSON 응답용 dict 목록으로 변환합니다. (응답을 직렬화하는 곳에서만 호출)
+        """
+        dates = np.datetime_as_string(self.dates, unit="D").tolist()
+        return [
+            {
+                'region': self.region_code,
+                'date': date,
+                'deal_type': self.price_type,
+                'price': None if np.isnan(price) else float(price),
+                'is_prediction': bool(is_prediction)
+            }
+            for date, price, is_prediction in zip(dates, self.prices, self.is_prediction)
+        ]
+
+
+def _merge_series(key, actual, predicted):
+    """
+    실제/예측 시계열을 합쳐 날짜별 한 건만 남깁니다. (같은 날짜면 실제 데이터 우선)
+    """
+    empty = (np.array([], dtype="datetime64[D]"), np.array([], dtype=np.float64))
+    actual_dates, actual_prices = actual or empty
+    predicted_dates, predicted_prices = predicted or empty
+
+    dates = np.concatenate([actual_dates, predicted_dates])
+    prices = np.concatenate([actual_prices, predicted_prices])
+    is_prediction = np.concatenate([np.zeros(len(actual_dates), dtype=bool),
+                                    np.ones(len(predicted_dates), dtype=bool)])
+
+    # 날짜 -> 실제 우선 순으로 정렬 후 날짜별 첫 행만 사용
+    order = np.lexsort((is_prediction, dates))
+    dates, prices, is_prediction = dates[order], prices[order], is_prediction[order]
+    _, first = np.unique(dates, return_index=True)
+    return PriceSeries(key[0], key[1], dates[first], prices[first], is_prediction[first])
+
+
+def _group_rows(rows):
+    """
+    (region_code, price_type, date, price) 행을 키별 (dates, prices) 배열로 묶습니다.
+    """
+    grouped = defaultdict(lambda: ([], []))
+    for region_code, price_type, date, price in rows:
+        dates, prices = grouped[(region_code, price_type)]
+        dates.append(date)
+        prices.append(np.nan if price is None else price)
+    return {
+        key: (np.array(dates, dtype="datetime64[D]"), np.array(prices, dtype=np.float64))
+        for key, (dates, prices) in grouped.items()
+    }
+
+
+def _append_sorted(existing, added):
+    dates = np.concatenate([existing[0], added[0]])
+    prices = np.concatenate([existing[1], added[1]])
+    order = np.argsort(dates, kind="stable")
+    return dates[order], prices[order]
+
+
+# kb_property_price_data / kb_prediction 을 메모리에 올려두고 구간 조회에 응답하는 저장소
+class PriceSeriesStore:
+    def __init__(self):
+        self._actual = {}
+        self._predicted = {}
+        self._series = {}
+        self._last_prediction_id = 0
+        self._lock = asyncio.Lock()
+        self.is_loaded = False
+
+    async def _load_actual(self, db: AsyncSession):
+        # 시세 테이블은 파이프라인이 기존 행(avg_price)을 갱신하므로 전체를 다시 읽음
+        result = await db.execute(
+            select(PropertyPriceData.region_code, PropertyPriceData.price_type,
+                   PropertyPriceData.date, PropertyPriceData.avg_price)
+            .order_by(PropertyPriceData.region_code, PropertyPriceData.price_type, PropertyPriceData.date)
+        )
+        return _group_rows(result.all())
+
+    async def _load_predicted(self, db: AsyncSession, after_id: int):
+        # 예측 테이블은 insert 만 일어나므로 마지막으로 읽은 id 이후만 가져옴
+        result = await db.execute(
+            select(Prediction.id, Prediction.region_code, Prediction.price_type,
+                   Prediction.date, Prediction.predicted_price)
+            .where(Prediction.id > after_id)
+            .order_by(Prediction.region_code, Prediction.price_type, Prediction.date)
+        )
+        rows = result.all()
+        last_id = max((row[0] for row in rows), default=after_id)
+        # 예측 가격이 없는 경우 실제 데이터와 같이 NaN 으로 두고 통계에서 제외 (DB 조회 경로와 동일)
+        grouped = _group_rows((r[1], r[2], r[3], r[4]) for r in rows)
+        return grouped, last_id
+
+    async def refresh(self, db: AsyncSession, table: str = None):
+        """
+        저장소를 갱신합니다.
+
+        Args:
+            db: 비동기 DB 세션
+            table: 변경된 테이블명 (None 이면 전체 재적재)
+        """
+        async with self._lock:
+            actual, predicted = self._actual, dict(self._predicted)
+            changed = set()
+
+            if table in (None, PropertyPriceData.__tablename__):
+                actual = await self._load_actual(db)
+                changed.update(actual)
+                changed.update(self._actual)
+
+            if table is None:
+                predicted, self._last_prediction_id = await self._load_predicted(db, 0)
+                changed.update(predicted)
+            elif table == Prediction.__tablename__:
+                added, self._last_prediction_id = await self._load_predicted(db, self._last_prediction_id)
+                for key, arrays in added.items():
+                    predicted[key] = _append_sorted(predicted[key], arrays) if key in predicted else arrays
+                changed.update(added)
+
+            series = dict(self._series) if table else {}
+            for key in changed:
+                if key in actual or key in predicted:
+                    series[key] = _merge_series(key, actual.get(key), predicted.get(key))
+                else:
+                    series.pop(key, None)
+
+            # 조회 중인 요청에 영향이 없도록 참조를 한 번에 교체
+            self._actual, self._predicted, self._series = actual, predicted, series
+            self.is_loaded = True
+            logger.info("가격 시계열 저장소 갱신 완료 (table=%s, 시계열 %d개)", table or "전체", len(series))
+
+    async def refresh_from_notification(self, payload: str = None):
+        async with AsyncSessionLocal() as db:
+            try:
+                await self.refresh(db, payload or None)
+            except Exception as e:
+                logger.warning("가격 시계열 저장소 갱신 실패: %s", e)
+
+    def on_notification(self, payload: str = None):
+        """
+        kb_data_updated 알림 콜백 - 이벤트 루프에서 비동기로 갱신을 예약합니다.
+        """
+        if self.is_loaded:
+            task = asyncio.get_running_loop().create_task(self.refresh_from_notification(payload))
+            _background_tasks.add(task)
+            task.add_done_callback(_background_tasks.discard)
+            task.add_done_callback(_log_refresh_failure)
+
+    def get_series(self, region_code: str, price_type: str):
+        return self._series.get((region_code, price_type))
+
+    def query(self, region_code: str, price_type: str, start_date, end_date):
+        """
+        지역/거래 유형의 [start_date, end_date] 구간 시계열을 반환합니다. 없으면 None.
+        """
+        series = self._series.get((region_code, price_type))
+        if series is None:
+            return None
+        return series.slice(start_date, end_date)
+
+
+price_series_store = PriceSeriesStore()
@@ -1,168 +1,143 @@
+import logging
 from datetime import datetime, timedelta
-from sqlalchemy import select, or_
-from sqlalchemy.orm import Session
-from src.database.models.database_model import PropertyPriceData, Prediction, Region
+from sqlalchemy import Boolean, literal, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.database.models.database_model import PropertyPriceData, Prediction
+from src.api.services.region_resolver import region_resolver
+from src.api.services.price_series_store import PriceSeries, price_series_store
+from src.api.utils.query_parser import parse_time_info, period_of
+
+logger = logging.getLogger(__name__)
+
+
+# 조회 기간 계산 ("현재"면 오늘 기준 한 달 전후, 연/월이면 해당 기간, 날짜면 해당일부터 3개월)
+def get_date_range(date_info: str):
+    # '2024년 3월', '작년' 같은 표현도 'YYYY-MM', 'YYYY' 로 정규화
+    date_info = parse_time_info(date_info)
+    if date_info == "현재":
+        today = datetime.now().date()
+        return today - timedelta(days=30), today + timedelta(days=30)
+
+    period = period_of(date_info)
+    if period:
+        return period
+
+    target_date = datetime.strptime(date_info, "%Y-%m-%d").date()
+    return target_date, target_date + timedelta(days=90)
+
+
+# 실제 데이터와 예측 데이터를 한 번에 조회하는 쿼리
+def build_merged_price_query(region_code: str, price_type: str, start_date, end_date):
+    """
+    kb_property_price_data 와 kb_prediction 을 UNION ALL 로 합친 뒤
+    DISTINCT ON (date) 로 날짜별 한 건만 남깁니다. 같은 날짜에 실제 데이터가 있으면
+    is_prediction = false 가 먼저 정렬되므로 실제 데이터가 우선합니다.
+    """
+    actual = select(
+        PropertyPriceData.date.label("date"),
+        PropertyPriceData.region_code.label("region"),
+        PropertyPriceData.price_type.label("deal_type"),
+        PropertyPriceData.avg_price.label("price"),
+        literal(False, Boolean).label("is_prediction"),
+    ).where(
+        PropertyPriceData.region_code == region_code,
+        PropertyPriceData.price_type == price_type,
+        PropertyPriceData.date >= start_date,
+        PropertyPriceData.date <= end_date,
+    )
+
+    predicted = select(
+        Prediction.date.label("date"),
+        Prediction.region_code.label("region"),
+        Prediction.price_type.label("deal_type"),
+        Prediction.predicted_price.label("price"),
+        literal(True, Boolean).label("is_prediction"),
+    ).where(
+        Prediction.region_code == region_code,
+        Prediction.price_type == price_type,
+        Prediction.date >= start_date,
+        Prediction.date <= end_date,
+    )
+
+    merged = union_all(actual, predicted).subquery()
+    return (
+        select(merged.c.region, merged.c.date, merged.c.deal_type, merged.c.price, merged.c.is_prediction)
+        .distinct(merged.c.date)
+        .order_by(merged.c.date, merged.c.is_prediction)
+    )
+
+
+async def fetch_merged_prices(db: AsyncSession, region_code: str, price_type: str, start_date, end_date):
+    """
+    인메모리 저장소가 적재되지 않았을 때 DB 에서 직접 조회합니다. (저장소 경로와 같은 PriceSeries, 평균 가격 반환)
+    """
+    result = await db.execute(build_merged_price_query(region_code, price_type, start_date, end_date))
+    # ORM 엔티티 대신 Row 튜플을 그대로 사용
+    series = PriceSeries.from_rows(
+        region_code, price_type, ((date, price, is_prediction) for _, date, _, price, is_prediction in result)
+    )
+    return series, series.mean_price()
+
+
+# 부동산 가격 데이터 조회 함수 ((PriceSeries, 평균 가격), 데이터가 없으면 ([], 0))
+async def get_property_price(region_name: str, price_type: str, date_info: str, db: AsyncSession):
+    # 지역 이름으로 지역 코드 찾기 (인메모리 인덱스 - LIKE 스캔 없이 region_code 로 조회)
+    await region_resolver.ensure_loaded(db)
+    region_code = region_resolver.resolve(region_name)
+    if not region_code:
+        logger.info("지역 코드를 찾을 수 없습니다: %s", region_name)
+        return [], 0
 
-# 부동산 가격 데이터 조회 함수
-def get_property_price(region_name: str, price_type: str, date_info: str, db: Session):
     if "month" in date_info:
         # ... 기존 코드 유지
         pass
     else:
         try:
-            # "현재"인 경우 오늘 날짜 기준 한 달 전후로 설정
-            if date_info == "현재":
-                today = datetime.now().date()
-                target_date = today - timedelta(days=30)  # 1달 전
-                end_date = today + timedelta(days=30)     # 1달 후
-                print(f"현재 날짜 기준 데이터 조회: 시작일={target_date}, 종료일={end_date}")
-            else:
-                # date_info가 구체적인 날짜인 경우
-                target_date = datetime.strptime(date_info, "%Y-%m-%d").date()
-                end_date = target_date + timedelta(days=90)  # 3개월 후
-
-            # 지역 이름으로 지역 코드 찾기
-            regions = [region_name]
-            print(f"매매가 안쪽 {regions} {price_type}")
-            
-            # 실제 데이터 쿼리 (kb_property_price_data)
-            actual_query = (
-                select(PropertyPriceData)
-                .join(Region, PropertyPriceData.region_code == Region.region_code)
-                .where(
-                    or_(*[Region.region_name_kor.like(f"%{name}%") for name in regions]),
-                    PropertyPriceData.price_type == price_type,
-                    PropertyPriceData.date >= target_date,
-                    PropertyPriceData.date <= end_date
-                )
-            )
-            
-            actual_results = db.execute(actual_query).scalars().all()
-            
-            # 예측 데이터 쿼리 (kb_prediction)
-            prediction_query = (
-                select(Prediction)
-                .join(Region, Prediction.region_code == Region.region_code)
-                .where(
-                    or_(*[Region.region_name_kor.like(f"%{name}%") for name in regions]),
-                    Prediction.price_type == price_type,
-                    Prediction.date >= target_date,
-                    Prediction.date <= end_date
-                )
-            )
-            
-            prediction_results = db.execute(prediction_query).scalars().all()
-            
-            # 결과를 딕셔너리로 변환 (날짜를 키로 사용)
-            data_dict = {}
-            
-            # 실제 데이터 먼저 추가 (우선순위가 높음)
-            for row in actual_results:
-                date_str = row.date.strftime('%Y-%m-%d')
-                data_dict[date_str] = {
-                    'region': row.region_code,
-                    'date': date_str,
-                    'deal_type': row.price_type,
-                    'price': row.avg_price,
-                    'is_prediction': False
-                }
-            
-            # 예측 데이터 추가 (실제 데이터와 중복되지 않는 날짜만)
-            for row in prediction_results:
-                date_str = row.date.strftime('%Y-%m-%d')
-                if date_str not in data_dict:
-                    price_value = row.predicted_price if row.predicted_price is not None else 0
-                    data_dict[date_str] = {
-                        'region': row.region_code,
-                        'date': date_str,
-                        'deal_type': row.price_type,
-                        'price': price_value,
-                        'is_prediction': True
-                    }
-            
-            # 딕셔너리를 리스트로 변환
-            data = list(data_dict.values())
-            
-            # 평균 가격 계산
-            total_price = sum(item['price'] for item in data) if data else 0
-            avg_price = total_price / len(data) if data else 0
-            
-            print(f"쿼리결과: {data}")
-            return data, avg_price
-            
-        except Exception as e:
-            print(f"데이터 처리 중 오류 발생: {e}")
-            # 오류가 발생해도 빈 결과 대신 다시 시도
+            start_date, end_date = get_date_range(date_info)
+            logger.debug("가격 조회 %s(%s) %s: 시작일=%s, 종료일=%s",
+                         region_name, region_code, price_type, start_date, end_date)
+
+            # 인메모리 시계열 저장소가 적재되어 있으면 DB 조회 없이 응답
+            if price_series_store.is_loaded:
+                series = price_series_store.query(region_code, price_type, start_date, end_date)
+                if series is None:
+                    return [], 0
+                return series, series.mean_price()
+
+            series, avg_price = await fetch_merged_prices(db, region_code, price_type, start_date, end_date)
+            logger.debug("가격 조회 결과: %d건", len(series))
+            return series, avg_price
+
+        except Exception:
+            logger.exception("데이터 처리 중 오류 발생: %s %s %s", region_name, price_type, date_info)
+            # 오류가 발생해도 빈 결과 대신 현재 기준으로 다시 시도
             try:
-                today = datetime.now().date()
-                start_date = today - timedelta(days=30)  # 1달 전
-                end_date = today + timedelta(days=30)    # 1달 후
-                print(f"오류 발생으로 현재 기준 데이터 조회: 시작일={start_date}, 종료일={end_date}")
-                
-                # 실제 데이터 쿼리 (kb_property_price_data)
-                actual_query = (
-                    select(PropertyPriceData)
-                    .join(Region, PropertyPriceData.region_code == Region.region_code)
-                    .where(
-                        or_(*[Region.region_name_kor.like(f"%{name}%") for name in regions]),
-                        PropertyPriceData.price_type == price_type,
-                        PropertyPriceData.date >= start_date,
-                        PropertyPriceData.date <= end_date
-                    )
-                )
-                
-                actual_results = db.execute(actual_query).scalars().all()
-                
-                # 예측 데이터 쿼리 (kb_prediction)
-                prediction_query = (
-                    select(Prediction)
-                    .join(Region, Prediction.region_code == Region.region_code)
-                    .where(
-                        or_(*[Region.region_name_kor.like(f"%{name}%") for name in regions]),
-                        Prediction.price_type == price_type,
-                        Prediction.date >= start_date,
-                        Prediction.date <= end_date
-                    )
-                )
-                
-                prediction_results = db.execute(prediction_query).scalars().all()
-                
-                # 결과를 딕셔너리로 변환 (날짜를 키로 사용)
-                data_dict = {}
-                
-                # 실제 데이터 먼저 추가 (우선순위가 높음)
-                for row in actual_results:
-                    date_str = row.date.strftime('%Y-%m-%d')
-                    data_dict[date_str] = {
-                        'region': row.region_code,
-                        'date': date_str,
-                        'deal_type': row.price_type,
-                        'price': row.avg_price,
-                        'is_prediction': False
-                    }
-                
-                # 예측 데이터 추가 (실제 데이터와 중복되지 않는 날짜만)
-                for row in prediction_results:
-                    date_str = row.date.strftime('%Y-%m-%d')
-                    if date_str not in data_dict:
-                        price_value = row.predicted_price if row.predicted_price is not None else 0
-                        data_dict[date_str] = {
-                            'region': row.region_code,
-                            'date': date_str,
-                            'deal_type': row.price_type,
-                            'price': price_value,
-                            'is_prediction': True
-                        }
-                
-                # 딕셔너리를 리스트로 변환
-                data = list(data_dict.values())
-                
-                # 평균 가격 계산
-                total_price = sum(item['price'] for item in data)
-                avg_price = total_price / len(data) if data else 0
-                
-                print(f"쿼리결과(오류 복구): {data}")
-                return data, avg_price
-            except Exception as nested_e:
-                print(f"복구 시도 중 추가 오류 발생: {nested_e}")
-                return [], 0 
\ No newline at end of file
+                await db.rollback()
+                start_date, end_date = get_date_range("현재")
+                logger.info("오류 발생으로 현재 기준 데이터 조회: 시작일=%s, 종료일=%s", start_date, end_date)
+
+                series, avg_price = await fetch_merged_prices(db, region_code, price_type, start_date, end_date)
+                logger.debug("가격 조회 결과(오류 복구): %d건", len(series))
+                return series, avg_price
+            except Exception:
+                logger.exception("복구 시도 중 추가 오류 발생")
+                return [], 0
+
+
+# 스트리밍 응답에서 별도 이벤트로 보낼 가격 데이터 (extract_intent 결과 기준)
+async def get_price_payload(intent: dict, db: AsyncSession):
+    region_name = intent["지역"]
+    price_type = intent["매매/전세 여부"]
+    result = await get_property_price(region_name, price_type, intent["시간 정보"], db)
+    if not result:
+        return None
+
+    price_data, avg_price = result
+    if not price_data:
+        return None
+    return {
+        "region": region_name,
+        "price_type": price_type,
+        "avg_price": avg_price,
+        "data": price_data.to_records(),
+    }
@@ -0,0 +1,180 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from datetime import date
+
+from cachetools import TLRUCache
+from prometheus_client import Counter
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+# 공공데이터 프록시 응답 캐시 설정
+PROXY_CACHE_ENABLED = os.getenv("PROXY_CACHE_ENABLED", "true").lower() == "true"
+PROXY_CACHE_MAXSIZE = int(os.getenv("PROXY_CACHE_MAXSIZE", "2048"))  # 메모리 계층 최대 항목 수
+PROXY_CACHE_DIR = os.getenv("PROXY_CACHE_DIR", os.path.join(PROJECT_ROOT, "datasets", "cache", "public_data"))
+# 신선 기간(초): 신고 기한(계약 후 30일)이 지난 달의 실거래 데이터는 바뀌지 않으므로 길게,
+# 이번 달/지난달(신고 진행 중)은 짧게
+PROXY_CACHE_CLOSED_MONTH_TTL = int(os.getenv("PROXY_CACHE_CLOSED_MONTH_TTL", str(30 * 24 * 3600)))
+PROXY_CACHE_CURRENT_MONTH_TTL = int(os.getenv("PROXY_CACHE_CURRENT_MONTH_TTL", "3600"))
+# 신선 기간이 지난 뒤에도 이 시간(초) 동안은 기존 응답을 바로 돌려주고 백그라운드에서 갱신
+PROXY_CACHE_STALE_TTL = int(os.getenv("PROXY_CACHE_STALE_TTL", str(24 * 3600)))
+
+CACHE_REQUESTS = Counter("proxy_cache_requests", "공공데이터 프록시 캐시 조회 결과", ["result"])
+
+# 백그라운드 갱신 태스크 참조 유지
+_background_tasks = set()
+
+
+def ministry_ttl(deal_ymd: str, today: date = None):
+    """
+    계약년월(YYYYMM)이 지난달보다 이전이면 긴 TTL, 지난달 이후(또는 형식 오류)면 짧은 TTL.
+    """
+    today = today or date.today()
+    year, month = (today.year, today.month - 1) if today.month > 1 else (today.year - 1, 12)
+    if len(deal_ymd) == 6 and deal_ymd.isdigit() and deal_ymd < f"{year:04d}{month:02d}":
+        return PROXY_CACHE_CLOSED_MONTH_TTL
+    return PROXY_CACHE_CURRENT_MONTH_TTL
+
+
+# 갱신 실패는 다음 조회 때 다시 시도 (기존 응답은 stale 기간 동안 유지)
+def _log_refresh_failure(task):
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning("프록시 캐시 갱신 실패: %s", task.exception())
+
+
+# 캐시 항목 (wall clock 기준 - 디스크 계층에 그대로 저장해 재시작 후에도 사용)
+class CacheEntry:
+    __slots__ = ("value", "fresh_until", "stale_until")
+
+    def __init__(self, value, fresh_until: float, stale_until: float):
+        self.value = value
+        self.fresh_until = fresh_until
+        self.stale_until = stale_until
+
+    @classmethod
+    def create(cls, value, ttl: float, stale_ttl: float = PROXY_CACHE_STALE_TTL, now: float = None):
+        now = time.time() if now is None else now
+        return cls(value, now + ttl, now + ttl + stale_ttl)
+
+    def as_dict(self):
+        return {"value": self.value, "fresh_until": self.fresh_until, "stale_until": self.stale_until}
+
+
+# 메모리(LRU) + 디스크 2계층 캐시, stale-while-revalidate
+class ProxyCache:
+    def __init__(self, maxsize: int = PROXY_CACHE_MAXSIZE, cache_dir: str = PROXY_CACHE_DIR,
+                 enabled: bool = PROXY_CACHE_ENABLED):
+        self.enabled = enabled
+        self.cache_dir = cache_dir
+        self._memory = TLRUCache(maxsize=maxsize, ttu=lambda key, entry, now: entry.stale_until, timer=time.time)
+        # 같은 키의 동시 미스/갱신은 업스트림 호출 한 번으로 합침
+        self._inflight = {}
+
+    def _path(self, key: str):
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, digest[:2], f"{digest}.json")
+
+    def _read_disk(self, key: str):
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        entry = CacheEntry(data["value"], data["fresh_until"], data["stale_until"])
+        if entry.stale_until <= time.time():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+        return entry
+
+    def _write_disk(self, key: str, entry: CacheEntry):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"key": key, **entry.as_dict()}, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    async def _lookup(self, key: str):
+        entry = self._memory.get(key)
+        if entry is not None:
+            return entry, "memory"
+        entry = await asyncio.to_thread(self._read_disk, key)
+        if entry is not None:
+            self._memory[key] = entry
+            return entry, "disk"
+        return None, None
+
+    async def _store(self, key: str, value, ttl: float):
+        entry = CacheEntry.create(value, ttl)
+        self._memory[key] = entry
+        try:
+            await asyncio.to_thread(self._write_disk, key, entry)
+        except OSError as e:
+            logger.warning("프록시 캐시 디스크 저장 실패: %s", e)
+        return entry
+
+    def _fetch_once(self, key: str, fetch, ttl: float):
+        """
+        fetch() 는 (값, 캐시 가능 여부) 를 반환하는 코루틴 함수입니다.
+        """
+        future = self._inflight.get(key)
+        if future is not None:
+            return future
+
+        async def run():
+            try:
+                value, cacheable = await fetch()
+                if cacheable:
+                    await self._store(key, value, ttl)
+                return value
+            finally:
+                self._inflight.pop(key, None)
+
+        future = asyncio.ensure_future(run())
+        self._inflight[key] = future
+        return future
+
+    def _revalidate(self, key: str, fetch, ttl: float):
+        if key in self._inflight:
+            return
+        task = self._fetch_once(key, fetch, ttl)
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+        task.add_done_callback(_log_refresh_failure)
+
+    async def get_or_fetch(self, key: str, fetch, ttl: float):
+        """
+        신선한 캐시가 있으면 바로 반환하고, 신선 기간이 지났지만 stale 기간 안이면
+        기존 값을 반환하면서 백그라운드에서 갱신합니다. 캐시가 없으면 fetch 결과를 기다립니다.
+        """
+        if not self.enabled:
+            value, _ = await fetch()
+            return value
+
+        entry, tier = await self._lookup(key)
+        if entry is not None:
+            if entry.fresh_until > time.time():
+                CACHE_REQUESTS.labels(f"{tier}_hit").inc()
+            else:
+                CACHE_REQUESTS.labels("stale").inc()
+                self._revalidate(key, fetch, ttl)
+            return entry.value
+
+        CACHE_REQUESTS.labels("miss").inc()
+        # 요청이 취소되어도 같은 키를 기다리는 다른 요청을 위해 업스트림 호출은 계속 진행
+        return await asyncio.shield(self._fetch_once(key, fetch, ttl))
+
+    def clear(self):
+        self._memory.clear()
+
+
+proxy_cache = ProxyCache()
@@ -0,0 +1,147 @@
+import asyncio
+import logging
+import os
+import time
+from contextlib import asynccontextmanager
+
+import httpx
+from dotenv import load_dotenv
+
+from src.api.services.request_metrics import STAGE_UPSTREAM, record_stage
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# 공공데이터 API (국토교통부 / 한국부동산원) 주소와 서비스 키
+KOREA_LAND_API_URL = os.getenv("KOREA_LAND_API_URL")
+MINISTRY_OF_LAND_API_URL = os.getenv("MINISTRY_OF_LAND_API_URL")
+ENCODING_KEY = os.getenv("ENCODING_KEY")
+
+# 공유 커넥션 풀 설정
+PUBLIC_API_MAX_CONNECTIONS = int(os.getenv("PUBLIC_API_MAX_CONNECTIONS", "50"))
+PUBLIC_API_MAX_KEEPALIVE = int(os.getenv("PUBLIC_API_MAX_KEEPALIVE", "20"))
+PUBLIC_API_CONNECT_TIMEOUT = float(os.getenv("PUBLIC_API_CONNECT_TIMEOUT", "3"))
+# h2 패키지가 설치되어 있을 때만 HTTP/2 사용
+PUBLIC_API_HTTP2 = os.getenv("PUBLIC_API_HTTP2", "true").lower() == "true"
+
+# 업스트림 이름
+MINISTRY = "ministry"
+KOREA_LAND = "korea_land"
+
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+class UpstreamError(Exception):
+    """
+    업스트림 호출 실패 (status_code 는 클라이언트에 돌려줄 HTTP 상태)
+    """
+
+    def __init__(self, upstream: str, message: str, status_code: int = 502):
+        super().__init__(f"{upstream}: {message}")
+        self.upstream = upstream
+        self.status_code = status_code
+
+
+# 업스트림별 타임아웃 / 동시 요청 수 제한
+class Upstream:
+    def __init__(self, name: str, base_url: str, timeout: float, max_concurrency: int, queue_timeout: float):
+        self.name = name
+        self.base_url = (base_url or "").rstrip("/")
+        self.timeout = httpx.Timeout(timeout, connect=PUBLIC_API_CONNECT_TIMEOUT)
+        self.queue_timeout = queue_timeout
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+
+    @classmethod
+    def from_env(cls, name: str, prefix: str, base_url: str):
+        """
+        {prefix}_TIMEOUT(응답 대기, 초), {prefix}_MAX_CONCURRENCY(동시 요청 수),
+        {prefix}_QUEUE_TIMEOUT(동시 요청 슬롯 대기, 초) 환경 변수로 생성합니다.
+        """
+        return cls(
+            name,
+            base_url,
+            timeout=float(os.getenv(f"{prefix}_TIMEOUT", "10")),
+            max_concurrency=int(os.getenv(f"{prefix}_MAX_CONCURRENCY", "10")),
+            queue_timeout=float(os.getenv(f"{prefix}_QUEUE_TIMEOUT", "5")),
+        )
+
+    def url(self, path: str):
+        # ENCODING_KEY 는 이미 URL 인코딩된 값이므로 params 로 넘기지 않고 그대로 붙임 (이중 인코딩 방지)
+        return f"{self.base_url}{path}?serviceKey={ENCODING_KEY}"
+
+
+# 공공데이터 API 공유 HTTP 클라이언트 (앱 lifespan 에서 start / close)
+class PublicDataClient:
+    def __init__(self, upstreams):
+        self.upstreams = {upstream.name: upstream for upstream in upstreams}
+        self._client = None
+
+    def start(self):
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=PUBLIC_API_HTTP2 and HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_connections=PUBLIC_API_MAX_CONNECTIONS,
+                                    max_keepalive_connections=PUBLIC_API_MAX_KEEPALIVE),
+            )
+        return self._client
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    @asynccontextmanager
+    async def _slot(self, upstream_name: str, path: str):
+        """
+        업스트림의 동시 요청 슬롯을 점유하고 블록 안의 httpx 오류를 UpstreamError 로 변환합니다.
+        슬롯을 queue_timeout 안에 얻지 못하면(503), 응답이 timeout 안에 오지 않으면(504), 연결에 실패하면(502)
+        """
+        upstream = self.upstreams[upstream_name]
+        try:
+            await asyncio.wait_for(upstream.semaphore.acquire(), upstream.queue_timeout)
+        except asyncio.TimeoutError:
+            raise UpstreamError(upstream_name, "동시 요청 한도 초과", status_code=503)
+
+        started = time.perf_counter()
+        try:
+            yield upstream
+        except httpx.TimeoutException as e:
+            raise UpstreamError(upstream_name, f"응답 시간 초과 ({type(e).__name__})", status_code=504) from e
+        except httpx.HTTPError as e:
+            raise UpstreamError(upstream_name, f"요청 실패 ({type(e).__name__})") from e
+        finally:
+            upstream.semaphore.release()
+            elapsed = time.perf_counter() - started
+            record_stage(STAGE_UPSTREAM, elapsed)
+            logger.debug("%s %s 응답 대기 %.3f초", upstream_name, path, elapsed)
+
+    async def get(self, upstream_name: str, path: str, params=None):
+        """
+        업스트림에 GET 요청을 보내고 본문까지 읽은 응답을 반환합니다. (오류는 _slot 참고)
+        """
+        client = self.start()
+        async with self._slot(upstream_name, path) as upstream:
+            return await client.get(upstream.url(path), params=params, timeout=upstream.timeout)
+
+    @asynccontextmanager
+    async def stream(self, upstream_name: str, path: str, params=None):
+        """
+        get 과 같지만 본문을 읽지 않은 응답을 반환합니다. 본문은 블록 안에서 response.aiter_bytes() 로 조금씩 읽으며,
+        읽는 동안에도 동시 요청 슬롯을 점유하고 읽기 중 타임아웃/연결 오류도 UpstreamError 로 변환합니다.
+        """
+        client = self.start()
+        async with self._slot(upstream_name, path) as upstream:
+            async with client.stream("GET", upstream.url(path), params=params, timeout=upstream.timeout) as response:
+                yield response
+
+
+public_data_client = PublicDataClient([
+    Upstream.from_env(MINISTRY, "MINISTRY_API", MINISTRY_OF_LAND_API_URL),
+    Upstream.from_env(KOREA_LAND, "KOREA_LAND_API", KOREA_LAND_API_URL),
+])
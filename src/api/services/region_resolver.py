@@ -0,0 +1,230 @@
+import asyncio
+import logging
+import os
+import re
+import time
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database.models.database_model import LegalDongCode, Region
+from src.api.utils.keyword_matcher import KeywordMatcher
+
+logger = logging.getLogger(__name__)
+
+# 지역 인덱스 재로딩 주기(초)
+REGION_CACHE_TTL = int(os.getenv("REGION_CACHE_TTL", "3600"))
+# 로딩 실패 후 다시 시도하기까지 대기 시간(초) - try_ensure_loaded 에서 DB 장애 시 매 요청마다 접속을 기다리지 않도록
+REGION_RETRY_INTERVAL = float(os.getenv("REGION_RETRY_INTERVAL", "30"))
+
+# 행정구역 정식 명칭 / 자주 쓰는 표현 -> kb_region.region_name_kor
+REGION_ALIASES = {
+    "충청북도": "충북",
+    "충청남도": "충남",
+    "전라북도": "전북",
+    "전북특별자치도": "전북",
+    "전라남도": "전남",
+    "경상북도": "경북",
+    "경상남도": "경남",
+    "강원특별자치도": "강원",
+    "제주특별자치도": "제주",
+    "세종특별자치시": "세종",
+    "강남": "강남11개구",
+    "강북": "강북14개구",
+    "지방": "기타지방",
+    "전체": "전국",
+    "한국": "전국",
+}
+
+# 폐지된 시도 코드 -> 현재 시도 코드 (강원도 -> 강원특별자치도, 전라북도 -> 전북특별자치도)
+LEGACY_SIDO_CODES = {"42": "51", "45": "52"}
+# 법정동 이름 중 지역명으로 사용할 행정구역 접미사 (시군구 / 읍면동)
+_SIGUNGU_SUFFIXES = ("시", "군", "구")
+_EUPMYEONDONG_SUFFIXES = ("읍", "면", "동", "가")
+
+# 비교 전에 제거하는 행정구역 접미사 (긴 것부터)
+_SUFFIX_PATTERN = re.compile(r"(특별자치시|특별자치도|특별시|광역시|도|시)$")
+_SPACE_PATTERN = re.compile(r"\s+")
+
+
+def normalize_region_name(name: str):
+    name = _SPACE_PATTERN.sub("", name or "").lower()
+    if name in REGION_ALIASES:
+        return REGION_ALIASES[name]
+    stripped = _SUFFIX_PATTERN.sub("", name)
+    return stripped if len(stripped) >= 2 else name
+
+
+# kb_region 전체(약 24건)를 메모리에 올려 지역명 -> region_code 로 변환하는 인덱스
+class RegionResolver:
+    def __init__(self, ttl: int = REGION_CACHE_TTL):
+        self.ttl = ttl
+        self._index = {}
+        self._names_by_length = []
+        self._names_by_code = {}
+        self._legal_dong_matcher = None
+        self._loaded_at = None
+        self._retry_at = 0.0
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_stale(self):
+        return self._loaded_at is None or time.monotonic() - self._loaded_at > self.ttl
+
+    def invalidate(self, payload=None):
+        """
+        다음 조회 시 인덱스를 다시 읽도록 표시합니다. (DB 알림 콜백으로도 사용)
+        """
+        self._loaded_at = None
+
+    def build(self, rows):
+        """
+        (region_code, region_name_kor, region_name_eng) 목록으로 인덱스를 구성합니다.
+        """
+        index, names_by_code = {}, {}
+        for region_code, name_kor, name_eng in rows:
+            names_by_code[region_code] = name_kor
+            for name in (name_kor, name_eng):
+                if name:
+                    index[normalize_region_name(name)] = region_code
+                    index[_SPACE_PATTERN.sub("", name).lower()] = region_code
+        for alias, name_kor in REGION_ALIASES.items():
+            if name_kor in index:
+                index[alias] = index[name_kor]
+
+        self._index = index
+        self._names_by_code = names_by_code
+        # 부분 문자열 매칭 시 긴 이름을 우선 (예: '강남11개구' 가 '강남' 보다 먼저)
+        self._names_by_length = sorted(index, key=len, reverse=True)
+        self._loaded_at = time.monotonic()
+
+    def build_legal_dong(self, rows):
+        """
+        (법정동 코드, 법정동명) 목록으로 시군구/읍면동 이름 -> KB 시도 region_code 매처를 구성합니다.
+        여러 시도에 같은 이름이 있는 경우(예: '중구')는 지역을 특정할 수 없으므로 제외합니다.
+        """
+        codes_by_name = {}
+        for code, name in rows:
+            sido = LEGACY_SIDO_CODES.get(code[:2], code[:2])
+            region_code = f"{sido}00000000"
+            if region_code not in self._names_by_code:
+                continue
+            for name_key in _legal_dong_keys(name):
+                codes_by_name.setdefault(name_key, set()).add(region_code)
+
+        tables = {}
+        for name_key, region_codes in codes_by_name.items():
+            if len(region_codes) == 1:
+                tables.setdefault(next(iter(region_codes)), []).append(name_key)
+        self._legal_dong_matcher = KeywordMatcher(tables) if tables else None
+
+    async def refresh(self, db: AsyncSession):
+        result = await db.execute(
+            select(Region.region_code, Region.region_name_kor, Region.region_name_eng)
+        )
+        self.build(result.all())
+        legal_dong = await db.execute(
+            select(LegalDongCode.code, LegalDongCode.name).where(LegalDongCode.is_active.is_(True))
+        )
+        self.build_legal_dong(legal_dong.all())
+        logger.info("지역 인덱스 로딩 완료: %d개 키", len(self._index))
+
+    async def ensure_loaded(self, db: AsyncSession):
+        if not self.is_stale:
+            return
+        async with self._lock:
+            if self.is_stale:
+                await self.refresh(db)
+
+    async def try_ensure_loaded(self, db: AsyncSession):
+        """
+        ensure_loaded 와 같지만 실패해도 예외를 내지 않습니다. (캐시 등 부가 기능용)
+        실패하면 REGION_RETRY_INTERVAL 동안 다시 시도하지 않고 기존 인덱스를 그대로 사용합니다.
+
+        Returns:
+            사용할 수 있는 인덱스가 있으면 True
+        """
+        if self.is_stale and time.monotonic() >= self._retry_at:
+            try:
+                await self.ensure_loaded(db)
+            except Exception as e:
+                self._retry_at = time.monotonic() + REGION_RETRY_INTERVAL
+                logger.warning("지역 인덱스 로딩 실패 (%.0f초 후 재시도): %s", REGION_RETRY_INTERVAL, e)
+        return bool(self._index)
+
+    def resolve(self, region_name: str):
+        """
+        지역명(한글/영문/별칭/부분 문자열)을 region_code 로 변환합니다.
+
+        Returns:
+            region_code, 찾지 못하면 None
+        """
+        key = normalize_region_name(region_name)
+        if not key:
+            return None
+        if key in self._index:
+            return self._index[key]
+        # '부산광역시 해운대구' 처럼 여러 단어인 경우 단어 단위로 먼저 확인
+        for token in (region_name or "").split():
+            token_key = normalize_region_name(token)
+            if token_key in self._index:
+                return self._index[token_key]
+        for name in self._names_by_length:
+            if name in key or (len(key) >= 2 and key in name):
+                return self._index[name]
+        return None
+
+    def name_of(self, region_code: str):
+        """
+        region_code 의 대표 한글 지역명(kb_region.region_name_kor)을 반환합니다.
+        """
+        return self._names_by_code.get(region_code)
+
+    def find_in_text(self, text: str):
+        """
+        문장 안에 포함된 지역명을 찾아 (region_code, 매칭된 이름) 으로 반환합니다.
+        KB 지역명을 먼저 찾고, 없으면 법정동 시군구/읍면동 이름으로 시도를 찾습니다.
+        """
+        compact = _SPACE_PATTERN.sub("", text or "").lower()
+        kb_match = next(((name, compact.find(name)) for name in self._names_by_length
+                         if len(name) >= 2 and name in compact), None)
+
+        if self._legal_dong_matcher is not None:
+            matches = self._legal_dong_matcher.find(compact)
+            if kb_match:
+                # KB 지역명을 포함하는 더 긴 법정동 이름이 있으면 법정동 우선 (예: '해운대구' 안의 '대구')
+                name, start = kb_match
+                for legal_start, legal_end, region_codes in matches:
+                    if legal_start <= start and start + len(name) <= legal_end \
+                            and legal_end - legal_start > len(name):
+                        region_code = next(iter(region_codes))
+                        return region_code, self.name_of(region_code)
+            else:
+                # 서로 다른 시도의 이름이 함께 나오면 지역을 특정하지 않음
+                region_codes = set().union(*(codes for _, _, codes in matches))
+                if len(region_codes) == 1:
+                    region_code = next(iter(region_codes))
+                    return region_code, self.name_of(region_code)
+
+        if kb_match:
+            return self._index[kb_match[0]], kb_match[0]
+        return None, None
+
+
+def _legal_dong_keys(name: str):
+    """
+    법정동명('부산광역시 해운대구 우동')에서 매칭에 쓸 이름을 만듭니다.
+    시군구는 접미사까지 포함한 전체 이름만 사용합니다. 접미사를 떼면 예산(군)/이천(시)/영광(군) 처럼
+    일반 단어와 겹치는 경우가 많기 때문입니다. 짧아서 오탐이 많은 읍면동 이름(2자)도 제외합니다.
+    """
+    parts = (name or "").split()
+    keys = []
+    for depth, part in enumerate(parts[1:4], start=1):
+        if part.endswith(_SIGUNGU_SUFFIXES) and len(part) >= 2 and depth <= 2:
+            keys.append(part)
+        elif part.endswith(_EUPMYEONDONG_SUFFIXES) and len(part) >= 3:
+            keys.append(part)
+    return keys
+
+
+region_resolver = RegionResolver()
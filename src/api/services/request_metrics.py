@@ -0,0 +1,265 @@
+import contextvars
+import os
+import time
+from contextlib import contextmanager
+
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge, Histogram, \
+    generate_latest
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from sqlalchemy import event
+from starlette.routing import Match
+
+from src.api.utils.profiler import PROFILE_HEADER, PROFILER_ENABLED, RequestProfiler
+
+# 여러 워커(uvicorn --workers)의 지표를 합칠 때 prometheus_client 멀티프로세스 디렉터리
+PROMETHEUS_MULTIPROC_DIR = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+# 지표에서 제외할 경로 (스크레이프 / 헬스체크)
+METRICS_EXCLUDED_PATHS = set(filter(None, os.getenv("METRICS_EXCLUDED_PATHS", "/metrics").split(",")))
+
+# 요청 지연 히스토그램 버킷 (초) - 스트리밍/LLM 응답까지 포함하므로 30초까지
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, float("inf"))
+
+# 요청 안에서 시간을 나눠 기록하는 구간 이름
+STAGE_DB = "db"
+STAGE_LLM = "llm"
+STAGE_PARSE = "parse"
+STAGE_UPSTREAM = "upstream"  # 공공데이터 API 등 LLM 외 외부 API
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds", "요청 처리 시간 (응답 본문 전송 완료까지)",
+    ["method", "route", "status"], buckets=LATENCY_BUCKETS,
+)
+REQUEST_STAGE_SECONDS = Histogram(
+    "http_request_stage_seconds", "요청 하나가 구간(db/llm/parse/upstream)별로 사용한 시간",
+    ["route", "stage"], buckets=LATENCY_BUCKETS,
+)
+REQUEST_DB_QUERIES = Histogram(
+    "http_request_db_queries", "요청 하나가 실행한 SQL 수",
+    ["route"], buckets=(0, 1, 2, 5, 10, 20, 50, 100, float("inf")),
+)
+REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress", "처리 중인 요청 수", ["method"], multiprocess_mode="livesum",
+)
+DB_QUERY_SECONDS = Histogram(
+    "db_query_duration_seconds", "SQL 실행 시간", ["engine"], buckets=LATENCY_BUCKETS,
+)
+LLM_REQUEST_SECONDS = Histogram(
+    "llm_request_duration_seconds", "업스트림 LLM 요청 시간 (스트리밍은 마지막 토큰까지)",
+    ["operation", "status"], buckets=LATENCY_BUCKETS,
+)
+ASSISTANT_RUN_SECONDS = Histogram(
+    "assistant_run_phase_seconds", "Assistant 실행 단계별 시간", ["phase", "status"], buckets=LATENCY_BUCKETS,
+)
+ASSISTANT_RUNS = Counter("assistant_runs", "Assistant 실행 수", ["status"])
+
+
+# 요청 하나의 구간별 누적 시간 (contextvar 로 요청 안의 모든 코드에서 공유)
+class RequestTimings:
+    __slots__ = ("stages", "db_queries")
+
+    def __init__(self):
+        self.stages = {}
+        self.db_queries = 0
+
+    def add(self, stage: str, seconds: float):
+        self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+
+
+_current_timings = contextvars.ContextVar("request_timings", default=None)
+
+
+def current_timings():
+    """
+    현재 요청의 RequestTimings 를 반환합니다. (요청 밖에서는 None)
+    """
+    return _current_timings.get()
+
+
+def record_stage(stage: str, seconds: float):
+    timings = _current_timings.get()
+    if timings is not None:
+        timings.add(stage, seconds)
+
+
+@contextmanager
+def timed_stage(stage: str):
+    """
+    with 블록의 실행 시간을 현재 요청의 stage 구간에 더합니다.
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_stage(stage, time.perf_counter() - started)
+
+
+@contextmanager
+def track_llm(operation: str):
+    """
+    업스트림 LLM 호출 시간을 llm_request_duration_seconds 와 현재 요청의 llm 구간에 기록합니다.
+    """
+    started = time.perf_counter()
+    status = "error"
+    try:
+        yield
+        status = "ok"
+    finally:
+        elapsed = time.perf_counter() - started
+        LLM_REQUEST_SECONDS.labels(operation, status).observe(elapsed)
+        record_stage(STAGE_LLM, elapsed)
+
+
+# AssistantService.metrics_hook 으로 연결 (RunTimings 를 받아 단계별 시간 기록)
+def observe_assistant_run(timings):
+    status = timings.status or "unknown"
+    ASSISTANT_RUNS.labels(status).inc()
+    for phase, seconds in (("queued", timings.queued_seconds),
+                           ("in_progress", timings.in_progress_seconds),
+                           ("total", timings.total_seconds)):
+        if seconds is not None:
+            ASSISTANT_RUN_SECONDS.labels(phase, status).observe(seconds)
+    # 실행 전체(함수 호출 실행 포함)를 현재 요청의 llm 구간으로 기록
+    record_stage(STAGE_LLM, timings.total_seconds)
+
+
+# SQLAlchemy 커서 실행 시간 -> db_query_duration_seconds + 현재 요청의 db 구간
+def instrument_engine(engine, name: str):
+    """
+    before/after_cursor_execute 이벤트로 SQL 실행 시간을 측정합니다.
+    비동기 엔진은 async_engine.sync_engine 을 전달합니다.
+    """
+    histogram = DB_QUERY_SECONDS.labels(name)
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["query_started_at"].pop()
+        elapsed = time.perf_counter() - started
+        histogram.observe(elapsed)
+        timings = _current_timings.get()
+        if timings is not None:
+            timings.add(STAGE_DB, elapsed)
+            timings.db_queries += 1
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(exception_context):
+        # 실패한 쿼리는 after_cursor_execute 가 호출되지 않으므로 시작 시각만 정리
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("query_started_at"):
+            conn.info["query_started_at"].pop()
+
+
+# 커넥션 풀 상태를 스크레이프 시점에 읽어오는 수집기 (PoolMetrics.snapshot 재사용)
+class PoolCollector:
+    def __init__(self, engines):
+        self.engines = engines
+
+    def collect(self):
+        checked_out = GaugeMetricFamily("db_pool_checked_out", "사용 중인 커넥션 수", labels=["engine"])
+        idle = GaugeMetricFamily("db_pool_idle", "유휴 커넥션 수", labels=["engine"])
+        overflow = GaugeMetricFamily("db_pool_overflow", "pool_size 를 넘어 연 커넥션 수", labels=["engine"])
+        timeouts = CounterMetricFamily("db_pool_timeouts", "커넥션 획득 타임아웃 수", labels=["engine"])
+        wait = CounterMetricFamily("db_pool_wait_seconds", "커넥션 획득 대기 시간 합계", labels=["engine"])
+        for name, engine in self.engines.items():
+            pool = engine.pool
+            snapshot = pool.metrics.snapshot(pool)
+            checked_out.add_metric([name], snapshot["checked_out"])
+            idle.add_metric([name], snapshot["idle"])
+            overflow.add_metric([name], snapshot["overflow"])
+            timeouts.add_metric([name], snapshot["timeouts"])
+            wait.add_metric([name], snapshot["wait_time"]["sum_seconds"])
+        return [checked_out, idle, overflow, timeouts, wait]
+
+
+# render_metrics 가 멀티프로세스 레지스트리에도 다시 등록할 수 있도록 보관
+_pool_collectors = []
+
+
+def register_pool_collector(engines):
+    """
+    {이름: 동기 엔진} 의 커넥션 풀 지표를 기본 레지스트리에 등록합니다.
+    """
+    collector = PoolCollector(engines)
+    REGISTRY.register(collector)
+    _pool_collectors.append(collector)
+
+
+def render_metrics():
+    """
+    /metrics 응답 본문과 Content-Type 을 반환합니다.
+    """
+    if PROMETHEUS_MULTIPROC_DIR:
+        from prometheus_client import multiprocess
+
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        # 커넥션 풀은 프로세스마다 따로 있으므로 파일로 합산되지 않음 - 스크레이프를 처리한 워커의 풀 상태를 함께 노출
+        for collector in _pool_collectors:
+            registry.register(collector)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+
+
+def _route_template(scope):
+    """
+    '/real-estate/{id}' 같은 라우트 경로를 반환합니다. (실제 경로를 라벨로 쓰면 시계열 수가 폭증)
+    """
+    app = scope.get("app")
+    for route in getattr(app, "routes", ()):
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return route.path
+    return "unmatched"
+
+
+# 라우트별 지연/구간 시간 측정 미들웨어 (순수 ASGI - 스트리밍 응답도 본문 전송 완료까지 측정)
+class RequestMetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in METRICS_EXCLUDED_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        timings = RequestTimings()
+        token = _current_timings.set(timings)
+        status_code = 500
+        profiler = None
+        if PROFILER_ENABLED:
+            headers = dict(scope.get("headers") or ())
+            if headers.get(PROFILE_HEADER):
+                profiler = RequestProfiler(method, scope["path"])
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if profiler is not None:
+                    headers = list(message.get("headers") or ())
+                    headers.append((b"x-profile-file", profiler.output_name.encode()))
+                    message = {**message, "headers": headers}
+            await send(message)
+
+        REQUESTS_IN_PROGRESS.labels(method).inc()
+        started = time.perf_counter()
+        if profiler is not None:
+            profiler.start()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            if profiler is not None:
+                profiler.stop()
+            REQUESTS_IN_PROGRESS.labels(method).dec()
+            _current_timings.reset(token)
+
+            route = _route_template(scope)
+            REQUEST_LATENCY.labels(method, route, str(status_code)).observe(elapsed)
+            for stage, seconds in timings.stages.items():
+                REQUEST_STAGE_SECONDS.labels(route, stage).observe(seconds)
+            REQUEST_DB_QUERIES.labels(route).observe(timings.db_queries)
@@ -0,0 +1,66 @@
+import os
+from datetime import date
+
+from cachetools import TTLCache
+
+# 응답 캐시 최대 항목 수 / 유효 시간(초)
+RESPONSE_CACHE_MAXSIZE = int(os.getenv("RESPONSE_CACHE_MAXSIZE", "1024"))
+RESPONSE_CACHE_TTL = int(os.getenv("RESPONSE_CACHE_TTL", "600"))
+
+
+# 파싱된 의도(지역, 매매/전세, 시간 정보)를 캐시 키로 정규화
+def intent_cache_key(parsed: dict):
+    """
+    fill_parsing_defaults 결과를 캐시 키 튜플로 변환합니다.
+    '현재' 는 날짜가 바뀌면 다른 키가 되도록 오늘 날짜를 붙입니다.
+    """
+    time_info = parsed.get("시간 정보") or "현재"
+    if time_info == "현재":
+        time_info = f"현재:{date.today().isoformat()}"
+    return (
+        parsed.get("지역", "전국"),
+        parsed.get("매매/전세 여부", "sale"),
+        " ".join(time_info.split()),
+    )
+
+
+# LRU + TTL 응답 캐시 (히트/미스 카운터 포함)
+class ResponseCache:
+    def __init__(self, maxsize: int = RESPONSE_CACHE_MAXSIZE, ttl: int = RESPONSE_CACHE_TTL):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, key):
+        value = self._cache.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, key, value):
+        self._cache[key] = value
+
+    def invalidate(self, payload=None):
+        """
+        캐시를 모두 비웁니다. (KB 데이터 적재 알림 콜백으로 사용)
+        """
+        self._cache.clear()
+        self.invalidations += 1
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "size": self._cache.currsize,
+            "maxsize": self._cache.maxsize,
+            "ttl": self._cache.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+            "invalidations": self.invalidations,
+        }
+
+
+chat_response_cache = ResponseCache()
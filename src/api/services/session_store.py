@@ -0,0 +1,129 @@
+import json
+import os
+from abc import ABC, abstractmethod
+
+from cachetools import TTLCache
+
+# 세션 저장소 설정
+SESSION_STORE_BACKEND = os.getenv("SESSION_STORE_BACKEND", "memory").lower()  # memory | redis
+SESSION_TTL = int(os.getenv("SESSION_TTL", "3600"))  # 마지막 대화 이후 세션 유지 시간(초)
+SESSION_STORE_MAX_TOKENS = int(os.getenv("SESSION_STORE_MAX_TOKENS", "2000000"))  # 인메모리 저장소 전체 토큰 상한
+CHAT_HISTORY_MAX_TOKENS = int(os.getenv("CHAT_HISTORY_MAX_TOKENS", "3000"))  # 세션당 대화 기록 토큰 상한
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+# 메시지마다 붙는 역할/구분자 토큰 (OpenAI chat 포맷 기준 근사치)
+MESSAGE_OVERHEAD_TOKENS = 4
+
+try:
+    import tiktoken
+
+    _encoding = tiktoken.get_encoding("cl100k_base")
+except Exception:
+    _encoding = None
+
+
+# 텍스트 토큰 수 계산 (tiktoken 이 없으면 근사치: 영문 4자당 1토큰, 한글 등은 1자당 1토큰)
+def count_tokens(text: str):
+    if not text:
+        return 0
+    if _encoding is not None:
+        return len(_encoding.encode(text))
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return (ascii_chars + 3) // 4 + (len(text) - ascii_chars)
+
+
+def history_tokens(messages):
+    return sum(MESSAGE_OVERHEAD_TOKENS + count_tokens(m.get("content", "")) for m in messages)
+
+
+# 토큰 상한에 맞춰 오래된 대화부터 제거 (시스템 메시지와 마지막 메시지는 유지)
+def trim_history(messages, max_tokens: int = CHAT_HISTORY_MAX_TOKENS):
+    system = [m for m in messages[:1] if m.get("role") == "system"]
+    rest = messages[len(system):]
+
+    budget = max_tokens - history_tokens(system)
+    kept, used = [], 0
+    for message in reversed(rest):
+        tokens = MESSAGE_OVERHEAD_TOKENS + count_tokens(message.get("content", ""))
+        if kept and used + tokens > budget:
+            break
+        kept.append(message)
+        used += tokens
+    return system + kept[::-1]
+
+
+# 세션 저장소 인터페이스
+class SessionStore(ABC):
+    @abstractmethod
+    async def get(self, session_id: str):
+        """
+        세션의 대화 기록(메시지 목록)을 반환합니다. 없으면 None.
+        """
+
+    @abstractmethod
+    async def save(self, session_id: str, messages):
+        pass
+
+    @abstractmethod
+    async def delete(self, session_id: str):
+        pass
+
+    def stats(self):
+        return {}
+
+
+# 프로세스 내 LRU + TTL 저장소 (전체 토큰 수 기준으로 메모리 상한 적용)
+class InMemorySessionStore(SessionStore):
+    def __init__(self, max_tokens: int = SESSION_STORE_MAX_TOKENS, ttl: int = SESSION_TTL):
+        self._cache = TTLCache(maxsize=max_tokens, ttl=ttl, getsizeof=history_tokens)
+
+    async def get(self, session_id: str):
+        messages = self._cache.get(session_id)
+        # 저장된 목록을 직접 수정하면 크기 계산이 어긋나므로 복사본을 반환
+        return list(messages) if messages is not None else None
+
+    async def save(self, session_id: str, messages):
+        self._cache[session_id] = list(messages)
+
+    async def delete(self, session_id: str):
+        self._cache.pop(session_id, None)
+
+    def stats(self):
+        return {
+            "backend": "memory",
+            "sessions": len(self._cache),
+            "tokens": self._cache.currsize,
+            "max_tokens": self._cache.maxsize,
+        }
+
+
+# Redis 호환 저장소 (여러 워커가 세션을 공유해야 할 때 사용)
+class RedisSessionStore(SessionStore):
+    def __init__(self, url: str = REDIS_URL, ttl: int = SESSION_TTL, prefix: str = "toadx2:chat:"):
+        try:
+            import redis.asyncio as redis
+        except ImportError as e:
+            raise RuntimeError("SESSION_STORE_BACKEND=redis 를 사용하려면 redis 패키지를 설치하세요.") from e
+
+        self._redis = redis.from_url(url, decode_responses=True)
+        self.ttl = ttl
+        self.prefix = prefix
+
+    async def get(self, session_id: str):
+        raw = await self._redis.get(self.prefix + session_id)
+        return json.loads(raw) if raw else None
+
+    async def save(self, session_id: str, messages):
+        await self._redis.set(self.prefix + session_id, json.dumps(messages, ensure_ascii=False), ex=self.ttl)
+
+    async def delete(self, session_id: str):
+        await self._redis.delete(self.prefix + session_id)
+
+    def stats(self):
+        return {"backend": "redis"}
+
+
+def create_session_store():
+    if SESSION_STORE_BACKEND == "redis":
+        return RedisSessionStore()
+    return InMemorySessionStore()
@@ -0,0 +1,35 @@
+import os
+
+from cachetools import TTLCache
+
+# 확인된 Assistant 스레드 보관 개수 / 유효 시간(초)
+THREAD_REGISTRY_MAXSIZE = int(os.getenv("THREAD_REGISTRY_MAXSIZE", "10000"))
+THREAD_REGISTRY_TTL = int(os.getenv("THREAD_REGISTRY_TTL", "86400"))
+
+
+# 검증된 스레드 ID 와 스레드의 메시지 수 (LRU + TTL)
+class ThreadRegistry:
+    def __init__(self, maxsize: int = THREAD_REGISTRY_MAXSIZE, ttl: int = THREAD_REGISTRY_TTL):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def get(self, thread_id: str):
+        """
+        등록된 스레드의 메시지 수를 반환합니다. 등록되지 않았거나 만료되었으면 None.
+        """
+        return self._cache.get(thread_id)
+
+    def record(self, thread_id: str, message_count: int):
+        self._cache[thread_id] = message_count
+
+    def discard(self, thread_id: str):
+        self._cache.pop(thread_id, None)
+
+    def stats(self):
+        return {
+            "threads": self._cache.currsize,
+            "maxsize": self._cache.maxsize,
+            "ttl": self._cache.ttl,
+        }
+
+
+thread_registry = ThreadRegistry()
@@ -0,0 +1,81 @@
+import numpy as np
+
+# 최근 추세 기울기를 계산할 관측치 수 (주간 데이터 기준 약 3개월)
+SLOPE_WINDOW = 12
+# 추세를 '보합'으로 볼 30일당 변화율 임계값
+FLAT_THRESHOLD = 0.001
+
+
+# 가격 데이터(PriceSeries 또는 dict 목록)를 (dates, prices) 배열로 변환
+def to_arrays(price_data):
+    if hasattr(price_data, "dates") and hasattr(price_data, "prices"):
+        return price_data.dates, price_data.prices
+
+    dates = np.array([item['date'] for item in price_data], dtype="datetime64[D]")
+    prices = np.array([np.nan if item['price'] is None else item['price'] for item in price_data],
+                      dtype=np.float64)
+    order = np.argsort(dates, kind="stable")
+    return dates[order], prices[order]
+
+
+def _change_since(dates, prices, days):
+    """
+    마지막 관측일로부터 days 일 이전(또는 그 직전) 값 대비 변화율. 비교 대상이 없으면 None.
+    """
+    idx = np.searchsorted(dates, dates[-1] - np.timedelta64(days, "D"), side="right") - 1
+    if idx < 0 or prices[idx] == 0:
+        return None
+    return float(prices[-1] / prices[idx] - 1)
+
+
+# 가격 시계열 요약 통계
+def summarize(price_data):
+    """
+    가격 시계열의 기초 통계와 추세 지표를 계산합니다.
+
+    Returns:
+        mean, median, first, last, mom(전월 대비), yoy(전년 대비), slope_30d(최근 30일당 변화율),
+        volatility(기간 수익률 표준편차), max_drawdown(최대 낙폭), trend('상승'/'하락'/'보합') 를 담은 dict.
+        유효한 가격이 없으면 None.
+    """
+    dates, prices = to_arrays(price_data)
+    valid = ~np.isnan(prices)
+    dates, prices = dates[valid], prices[valid]
+    if not len(prices):
+        return None
+
+    # 최근 구간 선형회귀 기울기 (일 단위 -> 30일당 변화율)
+    recent_dates, recent_prices = dates[-SLOPE_WINDOW:], prices[-SLOPE_WINDOW:]
+    slope_30d = 0.0
+    if len(recent_prices) >= 2 and recent_prices.mean() != 0:
+        x = (recent_dates - recent_dates[0]).astype(np.float64)
+        x -= x.mean()
+        denominator = (x * x).sum()
+        if denominator:
+            slope = (x * (recent_prices - recent_prices.mean())).sum() / denominator
+            slope_30d = float(slope * 30 / recent_prices.mean())
+
+    returns = np.diff(prices) / prices[:-1] if len(prices) >= 2 else np.array([])
+    running_max = np.maximum.accumulate(prices)
+    drawdowns = prices / running_max - 1
+
+    if slope_30d > FLAT_THRESHOLD:
+        trend = "상승"
+    elif slope_30d < -FLAT_THRESHOLD:
+        trend = "하락"
+    else:
+        trend = "보합"
+
+    return {
+        "count": int(len(prices)),
+        "mean": float(prices.mean()),
+        "median": float(np.median(prices)),
+        "first": float(prices[0]),
+        "last": float(prices[-1]),
+        "mom": _change_since(dates, prices, 30),
+        "yoy": _change_since(dates, prices, 365),
+        "slope_30d": slope_30d,
+        "volatility": float(returns.std()) if len(returns) else 0.0,
+        "max_drawdown": float(drawdowns.min()),
+        "trend": trend,
+    }
@@ -0,0 +1,71 @@
+import asyncio
+import json
+import os
+import time
+import uuid
+
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+
+# OpenAI chat.completions 호환 가짜 서버 (부하 테스트용)
+# 실행: uvicorn src.api.utils.fake_openai_server:app --port 8001
+# API 서버는 OPENAI_BASE_URL=http://localhost:8001/v1 로 설정
+FAKE_OPENAI_LATENCY = float(os.getenv("FAKE_OPENAI_LATENCY", "1.0"))  # 응답 지연(초)
+FAKE_OPENAI_REPLY = os.getenv("FAKE_OPENAI_REPLY", "부하 테스트용 가짜 응답입니다 ~두껍!")
+FAKE_OPENAI_TTFT = float(os.getenv("FAKE_OPENAI_TTFT", "0.2"))  # 스트리밍 첫 토큰까지 지연(초)
+
+app = FastAPI()
+
+
+@app.post("/v1/chat/completions")
+async def chat_completions(request: Request):
+    body = await request.json()
+    if body.get("stream"):
+        return StreamingResponse(_stream_chunks(body), media_type="text/event-stream")
+
+    # 실제 LLM 지연을 흉내냄 (이벤트 루프는 블로킹하지 않음)
+    await asyncio.sleep(FAKE_OPENAI_LATENCY)
+
+    return {
+        "id": f"chatcmpl-{uuid.uuid4().hex}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": body.get("model", "fake-model"),
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": FAKE_OPENAI_REPLY},
+                "finish_reason": "stop",
+            }
+        ],
+        "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+    }
+
+
+# stream=True 요청: 첫 토큰까지 FAKE_OPENAI_TTFT, 이후 남은 지연을 토큰(단어)마다 나눠서 전송
+async def _stream_chunks(body):
+    completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+    created = int(time.time())
+    model = body.get("model", "fake-model")
+    words = FAKE_OPENAI_REPLY.split(" ")
+    tokens = [word + " " for word in words[:-1]] + words[-1:]
+    interval = max(FAKE_OPENAI_LATENCY - FAKE_OPENAI_TTFT, 0) / len(tokens)
+
+    def chunk(delta, finish_reason=None):
+        data = {
+            "id": completion_id,
+            "object": "chat.completion.chunk",
+            "created": created,
+            "model": model,
+            "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+        }
+        return f"data: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+    await asyncio.sleep(FAKE_OPENAI_TTFT)
+    yield chunk({"role": "assistant", "content": ""})
+    for i, token in enumerate(tokens):
+        if i:
+            await asyncio.sleep(interval)
+        yield chunk({"content": token})
+    yield chunk({}, finish_reason="stop")
+    yield "data: [DONE]\n\n"
@@ -0,0 +1,105 @@
+import json
+import os
+from collections import deque
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+KEYWORD_TABLES_PATH = os.path.join(os.path.dirname(__file__), "keyword_tables.json")
+
+
+def load_keyword_tables(path: str = KEYWORD_TABLES_PATH):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+# 키워드 -> 카테고리 목록 (같은 키워드가 여러 카테고리에 속할 수 있음)
+def _keyword_categories(tables):
+    keywords = {}
+    for category, words in tables.items():
+        for word in words:
+            keywords.setdefault(word, set()).add(category)
+    return {word: frozenset(categories) for word, categories in keywords.items()}
+
+
+# 순수 파이썬 Aho–Corasick 오토마타 (pyahocorasick 이 없을 때 사용)
+class _Automaton:
+    def __init__(self, keywords):
+        self.goto = [{}]
+        self.fail = [0]
+        # 상태별 출력: (키워드 길이, 카테고리) 목록
+        self.output = [()]
+
+        for word, categories in keywords.items():
+            state = 0
+            for ch in word:
+                next_state = self.goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(self.goto)
+                    self.goto[state][ch] = next_state
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append(())
+                state = next_state
+            self.output[state] = ((len(word), categories),)
+
+        # BFS 로 실패 링크 계산, 실패 링크 상태의 출력을 합침
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and ch not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(ch, 0)
+                self.fail[next_state] = target if target != next_state else 0
+                self.output[next_state] = self.output[next_state] + self.output[self.fail[next_state]]
+
+    def iter(self, text):
+        """
+        pyahocorasick Automaton.iter 와 같은 (끝 위치, (키워드 길이, 카테고리)) 를 반환합니다.
+        """
+        goto, fail, output = self.goto, self.fail, self.output
+        state = 0
+        for end, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for value in output[state]:
+                yield end, value
+
+
+# 여러 카테고리의 키워드를 한 번의 텍스트 순회로 찾는 매처
+class KeywordMatcher:
+    def __init__(self, tables):
+        keywords = _keyword_categories(tables)
+        if ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for word, categories in keywords.items():
+                self._automaton.add_word(word, (len(word), categories))
+            self._automaton.make_automaton()
+        else:
+            self._automaton = _Automaton(keywords)
+
+    def categories(self, text: str):
+        """
+        텍스트에 포함된 키워드의 카테고리를 모두 반환합니다.
+        """
+        found = set()
+        for _, (_, categories) in self._automaton.iter(text):
+            found |= categories
+        return found
+
+    def find(self, text: str):
+        """
+        일치한 키워드마다 (시작 위치, 끝 위치(포함하지 않음), 카테고리) 를 반환합니다.
+        """
+        return [(end + 1 - length, end + 1, categories)
+                for end, (length, categories) in self._automaton.iter(text)]
+
+
+KEYWORD_TABLES = load_keyword_tables()
+keyword_matcher = KeywordMatcher(KEYWORD_TABLES)
@@ -0,0 +1,133 @@
+import atexit
+import logging
+import os
+import queue
+import random
+import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener
+
+from pythonjsonlogger import jsonlogger
+
+# 로깅 설정 (프로세스 시작 시 configure_logging 한 번만 호출)
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_FORMAT = os.getenv("LOG_FORMAT", "json").lower()  # json | text
+# 요청 처리 스레드는 큐에 넣기만 하고 출력은 별도 스레드에서 처리
+LOG_ASYNC = os.getenv("LOG_ASYNC", "true").lower() == "true"
+# SQL 로그 레벨 - INFO 이면 실행 SQL 을, DEBUG 이면 결과 행까지 기록 (기본값은 기록하지 않음)
+LOG_SQL_LEVEL = os.getenv("LOG_SQL_LEVEL", "WARNING").upper()
+# LOG_SQL_LEVEL 이 INFO/DEBUG 일 때 실제로 기록할 SQL 비율 (0.0 ~ 1.0, WARNING 이상은 항상 기록)
+LOG_SQL_SAMPLE_RATE = float(os.getenv("LOG_SQL_SAMPLE_RATE", "0.01"))
+# 로거별 레벨 ('openai=INFO,httpx=WARNING' 형식)
+LOG_LEVELS = os.getenv("LOG_LEVELS", "httpx=WARNING,httpcore=WARNING,openai=WARNING,urllib3=WARNING")
+
+# LOG_SQL_LEVEL 을 적용할 로거 (커넥션 풀 로거 이름은 풀 클래스의 모듈 경로를 따름)
+SQL_LOGGER_NAMES = ("sqlalchemy.engine", "sqlalchemy.dialects", "sqlalchemy.pool", "src.database.pool")
+# 샘플링 대상 (실행 SQL / 파라미터 / 결과 행)
+SQL_SAMPLED_LOGGER = "sqlalchemy.engine"
+
+TEXT_FORMAT = "%(asctime)s %(levelname)s [%(name)s] %(message)s"
+JSON_FORMAT = "%(asctime)s %(levelname)s %(name)s %(message)s"
+
+_listener = None
+_configured = False
+_lock = threading.Lock()
+
+
+def parse_levels(spec: str):
+    """
+    'openai=INFO,httpx=WARNING' -> {'openai': 'INFO', 'httpx': 'WARNING'}
+    """
+    levels = {}
+    for item in (spec or "").split(","):
+        name, sep, level = item.partition("=")
+        if sep and name.strip():
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+# SQL 로그 샘플링 필터 (핸들러에 붙여 prefix 로거의 INFO/DEBUG 레코드만 rate 비율로 통과)
+# SQLAlchemy 는 SQL 문과 파라미터('[%s] %r')를 연달아 별도 레코드로 남기므로 파라미터 레코드는 직전 SQL 의 결정을 따름
+class SamplingFilter(logging.Filter):
+    def __init__(self, rate: float, prefix: str = SQL_SAMPLED_LOGGER):
+        super().__init__()
+        self.rate = rate
+        self.prefix = prefix
+        self._local = threading.local()
+
+    def filter(self, record):
+        if record.levelno >= logging.WARNING or not record.name.startswith(self.prefix):
+            return True
+        if isinstance(record.msg, str) and record.msg.startswith("["):
+            return getattr(self._local, "keep", False)
+        keep = self.rate >= 1.0 or random.random() < self.rate
+        self._local.keep = keep
+        return keep
+
+
+# 레코드를 포맷하지 않고 그대로 큐에 넣는 핸들러 (같은 프로세스 안의 큐이므로 직렬화 불필요)
+# 기본 QueueHandler.prepare 는 호출한 스레드에서 메시지를 포맷하므로 요청 경로에 포맷 비용이 남는다
+class DeferredQueueHandler(QueueHandler):
+    def prepare(self, record):
+        return record
+
+
+def build_formatter(log_format: str = LOG_FORMAT):
+    if log_format == "json":
+        return jsonlogger.JsonFormatter(
+            JSON_FORMAT,
+            rename_fields={"asctime": "time", "levelname": "level", "name": "logger"},
+            json_ensure_ascii=False,
+        )
+    return logging.Formatter(TEXT_FORMAT)
+
+
+def configure_logging(level: str = LOG_LEVEL, log_format: str = LOG_FORMAT, use_queue: bool = LOG_ASYNC,
+                      sql_level: str = LOG_SQL_LEVEL, sql_sample_rate: float = LOG_SQL_SAMPLE_RATE,
+                      levels: str = LOG_LEVELS):
+    """
+    루트 로거에 핸들러를 한 번만 설정합니다. (여러 번 호출해도 처음 설정을 유지)
+    use_queue 이면 루트 로거에는 큐 핸들러만 두고, 포맷/출력은 QueueListener 스레드에서 처리합니다.
+    """
+    global _listener, _configured
+    with _lock:
+        if _configured:
+            return
+        _configured = True
+        root = logging.getLogger()
+
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(build_formatter(log_format))
+
+        if use_queue:
+            log_queue = queue.SimpleQueue()
+            handler = DeferredQueueHandler(log_queue)
+            _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+            _listener.start()
+            atexit.register(shutdown_logging)
+        else:
+            handler = stream_handler
+        # 버려질 SQL 레코드는 큐에 넣기 전에 거름
+        if sql_sample_rate < 1.0:
+            handler.addFilter(SamplingFilter(sql_sample_rate))
+
+        for existing in list(root.handlers):
+            root.removeHandler(existing)
+        root.addHandler(handler)
+        root.setLevel(level)
+
+        for name in SQL_LOGGER_NAMES:
+            logging.getLogger(name).setLevel(sql_level)
+        for name, logger_level in parse_levels(levels).items():
+            logging.getLogger(name).setLevel(logger_level)
+
+
+def shutdown_logging():
+    """
+    큐에 남은 로그를 모두 출력하고 리스너 스레드를 종료합니다.
+    """
+    global _listener
+    with _lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
@@ -3,46 +3,58 @@ import re
 from datetime import datetime
 from openai.types.chat import ChatCompletionMessage
 
+from src.api.utils.keyword_matcher import KEYWORD_TABLES, keyword_matcher
+
+# 키워드 테이블 (keyword_tables.json - 질문 의도 분류기 학습 데이터로도 사용)
+GREETING_PATTERNS = KEYWORD_TABLES["greeting"]
+SERVICE_INQUIRY_PATTERNS = KEYWORD_TABLES["service_inquiry"]
+OTHER_TOPICS = KEYWORD_TABLES["other_topic"]
+DAILY_CONVERSATION = KEYWORD_TABLES["daily_conversation"]
+
+# 부동산 질문의 PRICE/INFO 구분 키워드
+PRICE_KEYWORDS = KEYWORD_TABLES["price"]
+INFO_KEYWORDS = KEYWORD_TABLES["info"]
+
+# 인사말/서비스 문의/다른 주제/일상 대화 카테고리
+NON_REAL_ESTATE_CATEGORIES = {"greeting", "service_inquiry", "other_topic", "daily_conversation"}
+
+# 대화형 응답 (먼저 일치하는 카테고리 우선)
+CONVERSATION_RESPONSES = [
+    ("reply_greeting", "안녕하세요! 저는 두껍이입니다. 한국의 아파트 매매가와 전세가에 대한 정보를 알려드릴 수 있어요~두껍!"),
+    ("reply_service", "저는 한국의 아파트 매매가와 전세가 정보를 알려드리는 두껍이입니다. 지역명과 함께 물어보시면 최신 부동산 가격 정보를 알려드릴게요~두껍!"),
+    ("reply_other_topic", "죄송해요, 저는 부동산 정보만 알려드릴 수 있어요. 아파트 매매가나 전세가에 대해 물어봐주세요~두껍!"),
+    ("reply_thanks", "도움이 되어 기쁩니다! 또 궁금한 것이 있으시면 언제든지 물어보세요~두껍!"),
+    ("reply_real_estate", "부동산에 관심이 있으시군요! 특정 지역의 아파트 매매가나 전세가에 대해 물어보시면 자세히 알려드릴게요~두껍!"),
+    ("reply_ability", "저는 한국의 아파트 매매가와 전세가 정보를 알려드릴 수 있어요. KB 부동산 데이터 허브의 데이터를 기반으로 정보를 제공하고 있습니다~두껍!"),
+]
+DEFAULT_CONVERSATION_RESPONSE = "안녕하세요! 한국의 아파트 매매가나 전세가에 대해 궁금한 점이 있으신가요? 지역명을 말씀해주시면 도와드릴게요~두껍!"
+
 # 패턴 매칭을 통한 메시지 유형 확인 (API 호출 실패 시 대체 함수)
 def check_using_patterns(text):
-    greeting_patterns = ["안녕", "반가", "hi", "hello", "hey", "하이", "ㅎㅇ", "방가"]
-    service_inquiry_patterns = ["뭐하는", "어떤 일", "서비스", "무엇을", "기능", "할 수 있"]
-    other_topics = ["주식", "날씨", "게임", "음식", "영화", "취미", "스포츠"]
-    daily_conversation = ["고마", "감사", "thank", "땡큐", "반가", "잘 지냈"]
-    
-    # 인사말이나 일상 대화인 경우 N 반환
-    if any(pattern in text for pattern in greeting_patterns) or \
-       any(pattern in text for pattern in service_inquiry_patterns) or \
-       any(topic in text for topic in other_topics) or \
-       any(expr in text for expr in daily_conversation):
+    # 인사말이나 일상 대화인 경우 N 반환 (모든 카테고리를 한 번의 순회로 확인)
+    if keyword_matcher.categories(text) & NON_REAL_ESTATE_CATEGORIES:
         return "N"
     
     # 기본적으로 Y 반환 (부동산 관련 질문으로 판단)
     return "Y"
 
+# 키워드로 PRICE/INFO 구분 (가격 키워드 우선, 둘 다 없으면 PRICE)
+def classify_price_or_info(text):
+    categories = keyword_matcher.categories(text)
+    if "price" in categories:
+        return "PRICE"
+    if "info" in categories:
+        return "INFO"
+    return "PRICE"
+
 # 대화형 응답 생성 (API 호출 실패 시 대체 함수)
 def get_conversation_response(text):
-    # 인사말 패턴 체크
-    if any(pattern in text for pattern in ["안녕", "반가", "hi", "hello", "ㅎㅇ", "하이"]):
-        return "안녕하세요! 저는 두껍이입니다. 한국의 아파트 매매가와 전세가에 대한 정보를 알려드릴 수 있어요~두껍!"
-    # 서비스 문의 체크
-    elif any(pattern in text for pattern in ["뭐하는", "어떤 일", "서비스", "무엇을", "기능"]):
-        return "저는 한국의 아파트 매매가와 전세가 정보를 알려드리는 두껍이입니다. 지역명과 함께 물어보시면 최신 부동산 가격 정보를 알려드릴게요~두껍!"
-    # 다른 주제 문의 체크
-    elif any(topic in text for topic in ["주식", "날씨", "게임", "음식", "영화"]):
-        return "죄송해요, 저는 부동산 정보만 알려드릴 수 있어요. 아파트 매매가나 전세가에 대해 물어봐주세요~두껍!"
-    # 감사 표현에 대한 응답
-    elif any(thanks in text for thanks in ["고마", "감사", "thank", "땡큐"]):
-        return "도움이 되어 기쁩니다! 또 궁금한 것이 있으시면 언제든지 물어보세요~두껍!"
-    # 부동산에 대한 일반적인 질문
-    elif any(estate_term in text for estate_term in ["부동산", "집값", "아파트", "전세", "매매"]):
-        return "부동산에 관심이 있으시군요! 특정 지역의 아파트 매매가나 전세가에 대해 물어보시면 자세히 알려드릴게요~두껍!"
-    # 봇의 능력에 관한 질문
-    elif any(ability in text for ability in ["할 수 있", "알려줄 수 있", "뭘 알고", "뭘 알려"]):
-        return "저는 한국의 아파트 매매가와 전세가 정보를 알려드릴 수 있어요. KB 부동산 데이터 허브의 데이터를 기반으로 정보를 제공하고 있습니다~두껍!"
+    categories = keyword_matcher.categories(text)
+    for category, response in CONVERSATION_RESPONSES:
+        if category in categories:
+            return response
     # 기타 일상 대화
-    else:
-        return "안녕하세요! 한국의 아파트 매매가나 전세가에 대해 궁금한 점이 있으신가요? 지역명을 말씀해주시면 도와드릴게요~두껍!"
+    return DEFAULT_CONVERSATION_RESPONSE
 
 # 모의 응답 생성 함수 (테스트용)
 def get_mock_response(messages, model="gpt-3.5-turbo"):
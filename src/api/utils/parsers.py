@@ -1,58 +1,115 @@
+import logging
 import re
-from datetime import datetime, timedelta
+
+import numpy as np
+
+from src.api.utils.analytics import summarize
+from src.api.utils.query_parser import CURRENT, parse_query, parse_time_info
+
+logger = logging.getLogger(__name__)
+
+# LLM 파싱 응답 패턴 (요청마다 다시 컴파일하지 않도록 모듈 로드 시 한 번만)
+_WHITESPACE = re.compile(r"\s+")
+# 지역명은 쉼표/다음 필드 이름/한글이 아닌 문자 앞까지
+_REGION_FIELD = re.compile(r"지역:\s*([가-힣\s]+?)(?=\s*(?:매매/전세 여부:|시간 정보:|[^가-힣\s]|$))")
+_DEAL_TYPE_FIELD = re.compile(r"매매/전세 여부:\s*(매매|전세)")
+# 시간 정보는 다음 필드(또는 끝)까지 읽고 parse_time_info 로 정규화 ('현재', '작년' 등도 그대로 인식)
+_TIME_INFO_FIELD = re.compile(r"시간 정보:\s*(.*?)\s*(?:,|지역:|매매/전세 여부:|$)")
+
+DEFAULT_PARSED_RESULT = {
+    "지역": "전국",
+    "매매/전세 여부": "sale",
+    "시간 정보": CURRENT,
+}
+
 
 # 파싱된 결과에 기본값을 추가하는 함수
 def fill_parsing_defaults(parsed_text):
     try:
         # 불필요한 공백 및 개행 제거
-        parsed_text = re.sub(r"\s+", " ", parsed_text)
-        print(parsed_text)
+        parsed_text = _WHITESPACE.sub(" ", parsed_text)
 
         # 각 필드 추출
-        region_match = re.search(r"지역:\s*([가-힣\s]+)", parsed_text)
-        deal_type_match = re.search(r"매매/전세 여부:\s*(매매|전세)", parsed_text)
-        time_info_match = re.search(r"시간 정보:\s*([0-9년월일\s]+)", parsed_text)
+        region_match = _REGION_FIELD.search(parsed_text)
+        deal_type_match = _DEAL_TYPE_FIELD.search(parsed_text)
+        time_info_match = _TIME_INFO_FIELD.search(parsed_text)
 
         # 추출된 값이 없으면 기본값으로 대체
         region = region_match.group(1).strip() if region_match else "전국"
         deal_type = deal_type_match.group(1) if deal_type_match else "매매"
-        time_info = time_info_match.group(1).strip() if time_info_match else "현재"
+        time_info = parse_time_info(time_info_match.group(1)) if time_info_match else CURRENT
 
-        print("================파싱결과====================")
-        print(region, deal_type, time_info)
+        logger.debug("파싱 결과: 지역=%s, 매매/전세=%s, 시간=%s (원문: %s)",
+                     region, deal_type, time_info, parsed_text)
 
         return {
-            "지역": region,
+            "지역": region or "전국",
             "매매/전세 여부": 'sale' if deal_type == '매매' else 'rent',
             "시간 정보": time_info
         }
-    except Exception as e:
-        print(f"파싱 오류: {e}")
+    except Exception:
+        logger.exception("파싱 오류: %r", parsed_text)
         # 오류 발생 시 기본값 반환
-        return {
-            "지역": "전국",
-            "매매/전세 여부": "sale",
-            "시간 정보": "현재"
-        }
+        return dict(DEFAULT_PARSED_RESULT)
+
+# 가격 질문 여부를 판단하는 키워드 (응답 캐시 대상 선별용)
+PRICE_QUESTION_KEYWORDS = ["매매", "전세", "가격", "시세", "얼마", "집값", "값"]
+
+
+# 유저 메시지에서 직접 의도(지역, 매매/전세, 시간 정보)를 추출하는 함수
+def extract_intent(message):
+    """
+    지역명과 가격 관련 키워드가 모두 있는 메시지만 의도를 추출해
+    fill_parsing_defaults 형식의 dict 로 반환합니다. 추출할 수 없으면 None.
+    (region_resolver 가 적재되어 있어야 합니다.)
+    """
+    if not any(keyword in message for keyword in PRICE_QUESTION_KEYWORDS):
+        return None
+    return parse_query(message)
+
+_PRICE_LINE = "- 날짜: {}, 거래 유형: {}, 평균 가격: {:,}원{}"
+
 
 # 데이터 포맷팅 함수
 def format_price_data(region_name, price_data):
     """
-    부동산 가격 데이터를 포맷하는 함수.
+    부동산 가격 데이터를 포맷하는 함수. (dict 목록 또는 PriceSeries, 가격이 없는 날짜는 제외)
     """
-    formatted_price_data = []
-    for item in price_data:
-        prediction_mark = " (예측치)" if item.get('is_prediction', False) else ""
-        formatted_price_data.append(
-            f"- 날짜: {item['date']}, 거래 유형: {item['deal_type']}, 평균 가격: {item['price'] * 10000:,}원{prediction_mark}"
-        )
-    return "\n".join(formatted_price_data)
+    if hasattr(price_data, "dates"):
+        valid = ~np.isnan(price_data.prices)
+        dates = np.datetime_as_string(price_data.dates[valid], unit="D").tolist()
+        won = (price_data.prices[valid] * 10000).tolist()
+        marks = np.where(price_data.is_prediction[valid], " (예측치)", "").tolist()
+        line = _PRICE_LINE.format
+        deal_type = price_data.price_type
+        return "\n".join(line(date, deal_type, price, mark) for date, price, mark in zip(dates, won, marks))
+
+    line = _PRICE_LINE.format
+    return "\n".join(
+        line(item['date'], item['deal_type'], item['price'] * 10000,
+             " (예측치)" if item.get('is_prediction', False) else "")
+        for item in price_data if item['price'] is not None
+    )
 
 # 분석 요약 생성 함수
 def generate_analysis_summary(price_data):
     """
-    가격 데이터를 분석하고 요약 생성.
+    가격 데이터를 분석하고 요약 생성. (dict 목록 또는 PriceSeries)
     """
-    avg_price = sum(item['price'] for item in price_data) / len(price_data)
-    trend = "상승" if price_data[-1]['price'] > price_data[0]['price'] else "하락"
-    return f"최근 평균 가격은 {avg_price * 10000:,.0f}원이며, 가격 추이는 {trend}세입니다." 
\ No newline at end of file
+    stats = summarize(price_data)
+    if not stats:
+        return "분석할 가격 데이터가 없습니다."
+
+    summary = (f"최근 평균 가격은 {stats['mean'] * 10000:,.0f}원(중앙값 {stats['median'] * 10000:,.0f}원)이며, "
+               f"가격 추이는 {stats['trend']}세입니다.")
+
+    changes = []
+    if stats['mom'] is not None:
+        changes.append(f"전월 대비 {stats['mom'] * 100:+.2f}%")
+    if stats['yoy'] is not None:
+        changes.append(f"전년 대비 {stats['yoy'] * 100:+.2f}%")
+    if changes:
+        summary += f" {', '.join(changes)} 변동했습니다."
+    if stats['max_drawdown'] < 0:
+        summary += f" 기간 내 최대 낙폭은 {stats['max_drawdown'] * 100:.2f}%입니다."
+    return summary 
\ No newline at end of file
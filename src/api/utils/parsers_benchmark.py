@@ -0,0 +1,89 @@
+import argparse
+import contextlib
+import os
+import re
+import timeit
+from datetime import date, timedelta
+
+from src.api.utils.parsers import fill_parsing_defaults, format_price_data, generate_analysis_summary
+
+# parsers 핫패스 마이크로벤치마크
+# 실행: python -m src.api.utils.parsers_benchmark [--number 20000]
+# 이전 구현(호출마다 re.* 호출 + print)과 현재 구현의 호출당 비용을 비교합니다.
+
+PARSED_TEXTS = [
+    "지역: 서울,\n매매/전세 여부: 매매,\n시간 정보: 2024년 3월",
+    "지역: 부산, 매매/전세 여부: 전세, 시간 정보: 현재",
+    "파싱 결과:\n지역: 경기,\n매매/전세 여부: 매매,\n시간 정보: 작년",
+]
+
+
+def build_price_items(count: int = 60):
+    start = date(2020, 1, 1)
+    return [
+        {
+            "date": (start + timedelta(days=30 * i)).isoformat(),
+            "deal_type": "sale",
+            "price": 50000 + i * 37,
+            "is_prediction": i >= count - 6,
+        }
+        for i in range(count)
+    ]
+
+
+# 비교용 이전 구현 (출력은 devnull 로 보내므로 실제 stdout/로그 수집기 비용보다 작게 측정됨)
+def legacy_fill_parsing_defaults(parsed_text):
+    parsed_text = re.sub(r"\s+", " ", parsed_text)
+    print(parsed_text)
+    region_match = re.search(r"지역:\s*([가-힣\s]+)", parsed_text)
+    deal_type_match = re.search(r"매매/전세 여부:\s*(매매|전세)", parsed_text)
+    time_info_match = re.search(r"시간 정보:\s*([0-9년월일\s]+)", parsed_text)
+    region = region_match.group(1).strip() if region_match else "전국"
+    deal_type = deal_type_match.group(1) if deal_type_match else "매매"
+    time_info = time_info_match.group(1).strip() if time_info_match else "현재"
+    print("================파싱결과====================")
+    print(region, deal_type, time_info)
+    return {"지역": region, "매매/전세 여부": 'sale' if deal_type == '매매' else 'rent', "시간 정보": time_info}
+
+
+def legacy_format_price_data(region_name, price_data):
+    formatted_price_data = []
+    for item in price_data:
+        prediction_mark = " (예측치)" if item.get('is_prediction', False) else ""
+        formatted_price_data.append(
+            f"- 날짜: {item['date']}, 거래 유형: {item['deal_type']}, 평균 가격: {item['price'] * 10000:,}원{prediction_mark}"
+        )
+    print(f"쿼리결과: {price_data}")
+    return "\n".join(formatted_price_data)
+
+
+def per_call_us(func, number: int):
+    """
+    func 를 number 번 호출(5회 반복)한 결과 중 가장 빠른 회차의 호출당 시간(µs).
+    """
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+
+def run(number: int = 20000):
+    items = build_price_items()
+    texts = PARSED_TEXTS
+
+    cases = [
+        ("fill_parsing_defaults", lambda: [fill_parsing_defaults(t) for t in texts], len(texts)),
+        ("fill_parsing_defaults (이전)", lambda: [legacy_fill_parsing_defaults(t) for t in texts], len(texts)),
+        ("format_price_data x60", lambda: format_price_data("서울", items), 1),
+        ("format_price_data x60 (이전)", lambda: legacy_format_price_data("서울", items), 1),
+        ("generate_analysis_summary x60", lambda: generate_analysis_summary(items), 1),
+    ]
+
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        results = [(name, per_call_us(func, max(number // calls // 10, 1)) / calls) for name, func, calls in cases]
+
+    for name, micros in results:
+        print(f"{name:<34} {micros:10.2f} µs/call")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="parsers 핫패스 마이크로벤치마크")
+    parser.add_argument("--number", type=int, default=20000, help="케이스별 호출 횟수")
+    run(parser.parse_args().number)
@@ -0,0 +1,75 @@
+import os
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+
+# 요청 단위 샘플링 프로파일러 (flamegraph.pl / speedscope 에서 읽는 folded stack 형식으로 저장)
+# PROFILER_ENABLED=true 일 때만 동작하며, 요청에 PROFILE_HEADER 헤더가 있으면 해당 요청을 프로파일링합니다.
+PROFILER_ENABLED = os.getenv("PROFILER_ENABLED", "false").lower() == "true"
+PROFILE_HEADER = os.getenv("PROFILE_HEADER", "x-profile").lower().encode("latin-1")
+PROFILE_OUTPUT_DIR = os.getenv("PROFILE_OUTPUT_DIR", os.path.join("datasets", "profiles"))
+# 샘플링 간격(초)
+PROFILE_INTERVAL = float(os.getenv("PROFILE_INTERVAL", "0.005"))
+# 스택 깊이 상한 (재귀가 깊은 경우 잘라서 기록)
+PROFILE_MAX_DEPTH = int(os.getenv("PROFILE_MAX_DEPTH", "128"))
+
+_UNSAFE_FILENAME = re.compile(r"[^0-9A-Za-z_.-]+")
+
+
+def _frame_label(frame):
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def folded_stack(frame, max_depth: int = PROFILE_MAX_DEPTH):
+    """
+    프레임을 'root;...;leaf' 형식의 문자열로 변환합니다.
+    """
+    labels = []
+    while frame is not None and len(labels) < max_depth:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    return ";".join(reversed(labels))
+
+
+# 요청 처리 중 이벤트 루프 스레드의 스택을 주기적으로 수집
+# (같은 워커에서 동시에 처리 중인 다른 요청의 스택도 함께 잡히므로 저부하 환경에서 사용)
+class RequestProfiler:
+    def __init__(self, method: str, path: str, interval: float = PROFILE_INTERVAL,
+                 output_dir: str = PROFILE_OUTPUT_DIR):
+        self.interval = interval
+        self.output_dir = output_dir
+        self.samples = Counter()
+        slug = _UNSAFE_FILENAME.sub("_", path.strip("/")) or "root"
+        self.output_name = f"{time.strftime('%Y%m%d-%H%M%S')}-{method}-{slug}-{uuid.uuid4().hex[:8]}.folded"
+        self._target_thread_id = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._target_thread_id = threading.get_ident()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._target_thread_id)
+            if frame is not None:
+                self.samples[folded_stack(frame)] += 1
+
+    def stop(self):
+        """
+        샘플링을 멈추고 결과 파일을 저장합니다. 저장한 경로를 반환합니다.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        os.makedirs(self.output_dir, exist_ok=True)
+        path = os.path.join(self.output_dir, self.output_name)
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in self.samples.most_common():
+                f.write(f"{stack} {count}\n")
+        return path
@@ -0,0 +1,161 @@
+import calendar
+import re
+from datetime import date
+
+from src.api.services.region_resolver import region_resolver
+
+# 시간 표현 패턴
+_NORMALIZED = re.compile(r"\d{4}(?:-\d{2}(?:-\d{2})?)?")
+# '2년 전세' 의 '전' 은 '전세' 이므로 제외
+_RELATIVE_AMOUNT = re.compile(r"(?<!\d)(\d+)\s*(년|개월|달)\s*(전(?!세)|후|뒤)")
+# 2자리 연도는 월이 함께 있을 때만 ('24년 3월') - '20년 된 아파트' 같은 기간 표현 제외
+_ABSOLUTE_DATE = re.compile(
+    r"(?<!\d)(?P<year>\d{4}(?=\s*년)|\d{2}(?=\s*년\s*\d{1,2}\s*월))\s*년"
+    r"(?:\s*(?P<month>\d{1,2})\s*월)?(?:\s*(?P<day>\d{1,2})\s*일)?"
+)
+_NUMERIC_DATE = re.compile(r"(?<!\d)(?P<year>\d{4})[-./](?P<month>\d{1,2})(?:[-./](?P<day>\d{1,2}))?(?!\d)")
+_MONTH_DAY = re.compile(r"(?<!\d)(?P<month>\d{1,2})\s*월(?:\s*(?P<day>\d{1,2})\s*일)?")
+_RELATIVE_YEAR = re.compile(r"재작년|내후년|작년|지난해|올해|금년|내년|다음\s*해|후년")
+_RELATIVE_MONTH = re.compile(r"(지난|저번|이번|다음)\s*달")
+
+RELATIVE_YEAR_OFFSETS = {
+    "재작년": -2, "작년": -1, "지난해": -1, "올해": 0, "금년": 0,
+    "내년": 1, "다음해": 1, "후년": 2, "내후년": 2,
+}
+RELATIVE_MONTH_OFFSETS = {"지난": -1, "저번": -1, "이번": 0, "다음": 1}
+# 현재 시점 표현 / qna_dataset_maker.parse_time_reference 와 같은 1년 전후 표현
+NOW_WORDS = ("요즘", "요새", "최근", "지금", "현재", "오늘", "근래")
+PAST_WORDS = ("옛날", "과거")
+FUTURE_WORDS = ("나중에", "미래", "언젠가")
+
+CURRENT = "현재"
+
+
+def _shift_month(year: int, month: int, months: int):
+    index = year * 12 + (month - 1) + months
+    return index // 12, index % 12 + 1
+
+
+def _format_date(year: int, month: int = None, day: int = None):
+    """
+    'YYYY' / 'YYYY-MM' / 'YYYY-MM-DD' 로 변환합니다. 유효하지 않은 날짜면 None.
+    """
+    if year < 100:
+        year += 2000
+    try:
+        if day is not None and month is not None:
+            return date(year, month, day).isoformat()
+        if month is not None:
+            date(year, month, 1)
+            return f"{year:04d}-{month:02d}"
+        date(year, 1, 1)
+        return f"{year:04d}"
+    except ValueError:
+        return None
+
+
+def _int_or_none(value):
+    return int(value) if value else None
+
+
+# 한국어 시간 표현 -> 조회 기간 문자열
+def parse_time_info(text: str, today: date = None):
+    """
+    '2024년 3월', '작년', '지난달', '3개월 전', '요즘' 같은 표현을 정규화합니다.
+
+    Returns:
+        '현재', 'YYYY', 'YYYY-MM', 'YYYY-MM-DD' 중 하나 (시간 표현이 없으면 '현재')
+    """
+    today = today or date.today()
+    text = (text or "").strip()
+    if text == CURRENT or _NORMALIZED.fullmatch(text):
+        return text or CURRENT
+
+    match = _RELATIVE_AMOUNT.search(text)
+    if match:
+        amount, unit, direction = int(match.group(1)), match.group(2), match.group(3)
+        sign = -1 if direction == "전" else 1
+        if unit == "년":
+            return _format_date(today.year + sign * amount)
+        return _format_date(*_shift_month(today.year, today.month, sign * amount))
+
+    for pattern in (_ABSOLUTE_DATE, _NUMERIC_DATE):
+        match = pattern.search(text)
+        if match:
+            formatted = _format_date(int(match.group("year")),
+                                     _int_or_none(match.group("month")),
+                                     _int_or_none(match.group("day")))
+            if formatted:
+                return formatted
+
+    match = _RELATIVE_YEAR.search(text)
+    if match:
+        year = today.year + RELATIVE_YEAR_OFFSETS[re.sub(r"\s+", "", match.group(0))]
+        # '작년 3월' 처럼 월이 함께 있으면 월 단위로
+        month_match = _MONTH_DAY.search(text, match.end())
+        if month_match:
+            formatted = _format_date(year, int(month_match.group("month")), _int_or_none(month_match.group("day")))
+            if formatted:
+                return formatted
+        return _format_date(year)
+
+    match = _RELATIVE_MONTH.search(text)
+    if match:
+        return _format_date(*_shift_month(today.year, today.month, RELATIVE_MONTH_OFFSETS[match.group(1)]))
+
+    match = _MONTH_DAY.search(text)
+    if match:
+        formatted = _format_date(today.year, int(match.group("month")), _int_or_none(match.group("day")))
+        if formatted:
+            return formatted
+
+    if any(word in text for word in PAST_WORDS):
+        return _format_date(today.year - 1)
+    if any(word in text for word in FUTURE_WORDS):
+        return _format_date(today.year + 1)
+    return CURRENT
+
+
+# 정규화된 시간 정보 -> (시작일, 종료일). 연/월 단위가 아니면 None
+def period_of(time_info: str):
+    parts = (time_info or "").split("-")
+    if not all(part.isdigit() for part in parts):
+        return None
+    if len(parts) == 1:
+        year = int(parts[0])
+        return date(year, 1, 1), date(year, 12, 31)
+    if len(parts) == 2:
+        year, month = int(parts[0]), int(parts[1])
+        return date(year, month, 1), date(year, month, calendar.monthrange(year, month)[1])
+    return None
+
+
+def parse_deal_type(text: str):
+    """
+    '매매' / '전세' 중 먼저 나오는 표현을 반환합니다. 없으면 None.
+    """
+    rent, sale = (text or "").find("전세"), (text or "").find("매매")
+    if rent < 0 and sale < 0:
+        return None
+    if sale < 0 or (0 <= rent < sale):
+        return "전세"
+    return "매매"
+
+
+# 유저 메시지를 LLM 없이 파싱 (fill_parsing_defaults 결과와 같은 형식)
+def parse_query(message: str, today: date = None):
+    """
+    지역(kb_region + 법정동 이름), 매매/전세, 시간 정보를 규칙 기반으로 추출합니다.
+    지역을 찾지 못하면 None 을 반환하며, 이때만 LLM 파싱을 사용합니다.
+    (region_resolver 가 적재되어 있어야 합니다.)
+    """
+    region_code, _ = region_resolver.find_in_text(message)
+    if not region_code:
+        return None
+
+    deal_type = parse_deal_type(message) or "매매"
+    return {
+        "지역": region_resolver.name_of(region_code),
+        "매매/전세 여부": 'sale' if deal_type == '매매' else 'rent',
+        "시간 정보": parse_time_info(message, today),
+    }
@@ -0,0 +1,19 @@
+import json
+
+# 스트리밍 응답 헤더 (프록시 버퍼링 방지)
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",
+}
+SSE_MEDIA_TYPE = "text/event-stream"
+
+
+# Server-Sent Events 한 건을 문자열로 직렬화
+def sse_event(event: str, data):
+    """
+    event: 이벤트 이름 (token, price, done, error 등)
+    data: JSON 으로 직렬화할 데이터 (날짜 등은 문자열로 변환)
+    """
+    payload = json.dumps(data, ensure_ascii=False, default=str)
+    return f"event: {event}\ndata: {payload}\n\n"
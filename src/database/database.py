@@ -1,21 +1,40 @@
 from dotenv import load_dotenv
-import logging
 import os
 
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
-load_dotenv()
+from src.database.pool import TimedAsyncAdaptedQueuePool, TimedQueuePool, pool_options
 
-logging.basicConfig()
-logging.getLogger('sqlalchemy.engine').setLevel(logging.INFO)
-logging.getLogger('sqlalchemy.dialects.postgresql').setLevel(logging.INFO)
+load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL")
 
-engine = create_engine(DATABASE_URL)
+
+# 동기 URL(postgresql://)을 asyncpg 드라이버 URL(postgresql+asyncpg://)로 변환
+def to_async_url(url: str):
+    if not url:
+        return url
+    scheme, sep, rest = url.partition("://")
+    return f"{scheme.split('+')[0]}+asyncpg{sep}{rest}"
+
+
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or to_async_url(DATABASE_URL)
+
+# 동기 엔진 (파이프라인, alembic, 배치 스크립트용)
+engine = create_engine(DATABASE_URL, poolclass=TimedQueuePool, **pool_options())
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# 비동기 엔진 (FastAPI 요청 처리용 - 이벤트 루프를 블로킹하지 않음)
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL, poolclass=TimedAsyncAdaptedQueuePool, **pool_options()
+)
+AsyncSessionLocal = sessionmaker(
+    bind=async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
+
 Base = declarative_base()
 
 # 데이터베이스 세션을 반환하는 함수
@@ -24,4 +43,10 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+# 비동기 데이터베이스 세션을 반환하는 함수 (async 라우트의 Depends 용)
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
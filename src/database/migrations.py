@@ -0,0 +1,51 @@
+import logging
+import os
+
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+# 서버 기동 시 스키마 처리 방식
+# - alembic: alembic_version 을 한 번 조회하여 head 리비전과 일치하는지만 확인 (기본값)
+# - create_all: 기존 방식대로 Base.metadata.create_all 실행 (로컬 개발용)
+# - skip: 아무것도 확인하지 않음
+DB_STARTUP_MODE = os.getenv("DB_STARTUP_MODE", "alembic").lower()
+
+
+# alembic/versions 의 head 리비전 조회 (DB 접속 없이 스크립트 파일만 읽음)
+def get_alembic_heads():
+    config = Config(os.path.join(PROJECT_ROOT, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(PROJECT_ROOT, "alembic"))
+    return set(ScriptDirectory.from_config(config).get_heads())
+
+
+# DB 에 적용된 리비전이 head 와 일치하는지 단일 쿼리로 확인
+async def check_schema_revision(async_engine):
+    """
+    alembic_version 테이블을 한 번 조회하여 현재 리비전이 head 인지 확인합니다.
+
+    Returns:
+        head 와 일치하면 True, 그렇지 않으면 False
+    """
+    heads = get_alembic_heads()
+    try:
+        async with async_engine.connect() as conn:
+            result = await conn.execute(text("SELECT version_num FROM alembic_version"))
+            current = {row[0] for row in result}
+    except Exception as e:
+        logger.warning("alembic_version 조회 실패 (alembic upgrade head 필요): %s", e)
+        return False
+
+    if current != heads:
+        logger.warning(
+            "DB 스키마 리비전 불일치: 현재=%s, head=%s (alembic upgrade head 필요)",
+            sorted(current), sorted(heads),
+        )
+        return False
+
+    logger.info("DB 스키마 리비전 확인 완료: %s", sorted(current))
+    return True
@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Integer, String, Float, Date, DateTime, ForeignKey, Boolean, Index, Text
+from sqlalchemy import Column, Integer, String, Float, Date, DateTime, ForeignKey, Boolean, Index, Text, JSON, \
+    UniqueConstraint
 from sqlalchemy.orm import relationship
 from src.database.database import Base
 
@@ -63,6 +64,63 @@ class LegalDongCode(Base):
     is_active = Column(Boolean, default=True)  # 법정동 폐지 여부 (존재: True, 폐지: False)
 
 
+# 국토교통부 아파트 매매 실거래 테이블
+class ApartmentTrade(Base):
+    __tablename__ = "apartment_trade"
+
+    id = Column(Integer, primary_key=True, index=True)
+    trade_key = Column(String(40), unique=True, nullable=False)  # 거래 식별 해시 (ministry_trade_parser.trade_key)
+
+    lawd_cd = Column(String(5), nullable=False)  # 시군구 코드 (LAWD_CD)
+    legal_dong_code = Column(String(10), index=True, nullable=True)  # 법정동 코드 (10자리)
+    legal_dong_name = Column(String, nullable=True)  # 법정동 이름
+    jibun = Column(String, nullable=True)  # 지번
+    apt_name = Column(String, index=True, nullable=True)  # 아파트 이름
+    apt_dong = Column(String, nullable=True)  # 아파트 동
+    apt_seq = Column(String, nullable=True)  # 단지 일련번호
+
+    deal_amount = Column(Integer, nullable=True)  # 거래 금액 (만원)
+    exclusive_area = Column(Float, nullable=True)  # 전용면적 (㎡)
+    floor = Column(Integer, nullable=True)  # 층
+    build_year = Column(Integer, nullable=True)  # 건축년도
+    deal_date = Column(Date, nullable=True)  # 계약일
+    deal_type = Column(String, nullable=True)  # 거래 유형 (중개거래, 직거래)
+    is_canceled = Column(Boolean, default=False)  # 계약 해제 여부
+    canceled_date = Column(Date, nullable=True)  # 해제 사유 발생일
+
+    __table_args__ = (
+        Index('ix_apartment_trade_lawd_cd_deal_date', 'lawd_cd', 'deal_date'),
+    )
+
+
+# 한국부동산원 통계 데이터셋 행 테이블 (odcloud 응답 행을 그대로 저장)
+class KoreaLandRecord(Base):
+    __tablename__ = "korea_land_record"
+
+    id = Column(Integer, primary_key=True, index=True)
+    dataset = Column(String, nullable=False)  # 데이터셋 이름 (sale_index, sale_cost, rent_index, rent_cost)
+    row_no = Column(Integer, nullable=False)  # 데이터셋 안의 행 번호 (1부터, 업스트림 정렬 순서)
+    region = Column(String, nullable=True)  # 지역 (행에서 추출, 필터용)
+    month = Column(String(6), nullable=True)  # 기준 년월 YYYYMM (행에서 추출, 필터용)
+    data = Column(JSON, nullable=False)  # 원본 행
+
+    __table_args__ = (
+        UniqueConstraint('dataset', 'row_no', name='uq_korea_land_record_dataset_row_no'),
+        Index('ix_korea_land_record_dataset_region_month', 'dataset', 'region', 'month'),
+        Index('ix_korea_land_record_dataset_month', 'dataset', 'month'),
+    )
+
+
+# 한국부동산원 데이터셋 동기화 상태 테이블 (high-water mark)
+class KoreaLandSyncState(Base):
+    __tablename__ = "korea_land_sync_state"
+
+    dataset = Column(String, primary_key=True)  # 데이터셋 이름
+    synced_rows = Column(Integer, default=0)  # 앞에서부터 빠짐없이 저장된 행 수
+    total_count = Column(Integer, default=0)  # 마지막 동기화 때 업스트림 전체 행 수
+    synced_at = Column(DateTime, nullable=True)  # 마지막 동기화 시각
+
+
 # 카테고리 테이블
 class NewsCategory(Base):
     __tablename__ = "news_categories"
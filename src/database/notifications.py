@@ -0,0 +1,59 @@
+import logging
+
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+
+from src.database.database import DATABASE_URL
+
+logger = logging.getLogger(__name__)
+
+# KB 데이터(지역/시세/예측) 적재 완료 알림 채널
+KB_DATA_CHANNEL = "kb_data_updated"
+
+
+# 파이프라인(동기 세션)에서 데이터 적재 완료를 알림
+def notify_kb_data_updated(session, table: str):
+    """
+    pg_notify 로 KB_DATA_CHANNEL 에 변경된 테이블명을 전송합니다.
+    API 서버는 이 알림을 받아 인메모리 캐시를 갱신합니다.
+    """
+    session.execute(text("SELECT pg_notify(:channel, :payload)"),
+                    {"channel": KB_DATA_CHANNEL, "payload": table})
+    session.commit()
+
+
+# Postgres LISTEN 으로 알림을 받아 등록된 콜백을 호출하는 리스너
+class NotificationListener:
+    def __init__(self, channel: str):
+        self.channel = channel
+        self._callbacks = []
+        self._conn = None
+
+    def subscribe(self, callback):
+        """
+        알림 수신 시 호출할 콜백을 등록합니다. 콜백은 payload(str) 하나를 인자로 받습니다.
+        """
+        self._callbacks.append(callback)
+
+    def _dispatch(self, connection, pid, channel, payload):
+        for callback in self._callbacks:
+            try:
+                callback(payload)
+            except Exception as e:
+                logger.warning("%s 알림 처리 중 오류 발생: %s", channel, e)
+
+    async def start(self):
+        import asyncpg
+
+        dsn = make_url(DATABASE_URL).set(drivername="postgresql")
+        self._conn = await asyncpg.connect(dsn.render_as_string(hide_password=False))
+        await self._conn.add_listener(self.channel, self._dispatch)
+        logger.info("%s 채널 LISTEN 시작", self.channel)
+
+    async def stop(self):
+        if self._conn is not None:
+            await self._conn.close()
+            self._conn = None
+
+
+kb_data_listener = NotificationListener(KB_DATA_CHANNEL)
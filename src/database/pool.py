@@ -0,0 +1,116 @@
+import os
+import threading
+import time
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+# 커넥션 대기 시간 히스토그램 버킷 (초)
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, float("inf"))
+
+
+def _env_bool(name, default):
+    return os.getenv(name, str(default)).lower() in ("1", "true", "yes")
+
+
+# 환경 변수 기반 커넥션 풀 설정
+def pool_options():
+    """
+    create_engine / create_async_engine 에 전달할 풀 설정을 환경 변수에서 읽어옵니다.
+
+    DB_POOL_SIZE: 상시 유지할 커넥션 수 (기본값: 5)
+    DB_MAX_OVERFLOW: pool_size 를 초과해 추가로 열 수 있는 커넥션 수 (기본값: 10)
+    DB_POOL_TIMEOUT: 커넥션을 얻기 위해 대기할 최대 시간(초) (기본값: 30)
+    DB_POOL_RECYCLE: 커넥션 재생성 주기(초), -1 이면 비활성화 (기본값: 1800)
+    DB_POOL_PRE_PING: 체크아웃 시 커넥션 유효성 검사 여부 (기본값: true)
+    """
+    return {
+        "pool_size": int(os.getenv("DB_POOL_SIZE", "5")),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "10")),
+        "pool_timeout": float(os.getenv("DB_POOL_TIMEOUT", "30")),
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "1800")),
+        "pool_pre_ping": _env_bool("DB_POOL_PRE_PING", True),
+    }
+
+
+# 커넥션 획득 대기 시간 및 타임아웃 집계
+class PoolMetrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.bucket_counts = [0] * len(WAIT_BUCKETS)
+        self.wait_count = 0
+        self.wait_sum = 0.0
+        self.wait_max = 0.0
+        self.timeouts = 0
+
+    def observe_wait(self, seconds):
+        with self._lock:
+            self.wait_count += 1
+            self.wait_sum += seconds
+            self.wait_max = max(self.wait_max, seconds)
+            for i, upper in enumerate(WAIT_BUCKETS):
+                if seconds <= upper:
+                    self.bucket_counts[i] += 1
+                    break
+
+    def observe_timeout(self):
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self, pool):
+        """
+        풀의 현재 상태와 누적 대기 시간 히스토그램을 반환합니다.
+        """
+        with self._lock:
+            cumulative, histogram = 0, {}
+            for upper, count in zip(WAIT_BUCKETS, self.bucket_counts):
+                cumulative += count
+                histogram["+Inf" if upper == float("inf") else str(upper)] = cumulative
+            wait = {
+                "count": self.wait_count,
+                "sum_seconds": round(self.wait_sum, 6),
+                "max_seconds": round(self.wait_max, 6),
+                "buckets": histogram,
+            }
+            timeouts = self.timeouts
+
+        return {
+            "pool_size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "idle": pool.checkedin(),
+            # QueuePool.overflow() 는 풀이 다 차기 전까지 음수를 반환
+            "overflow": max(pool.overflow(), 0),
+            "max_overflow": pool._max_overflow,
+            "timeouts": timeouts,
+            "wait_time": wait,
+        }
+
+
+# 커넥션 획득 시간을 측정하는 QueuePool
+# (풀 재생성 시 생성자 인자가 복사되지 않으므로 metrics 는 클래스 속성으로 둔다)
+class TimedQueuePool(QueuePool):
+    metrics = PoolMetrics()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.observe_timeout()
+            raise
+        finally:
+            self.metrics.observe_wait(time.perf_counter() - start)
+
+
+class TimedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    metrics = PoolMetrics()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.observe_timeout()
+            raise
+        finally:
+            self.metrics.observe_wait(time.perf_counter() - start)
@@ -0,0 +1,235 @@
+import logging
+import os
+import random
+import threading
+import time
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+from sklearn.model_selection import train_test_split
+from sklearn.pipeline import make_pipeline
+
+from src.api.utils.mock_responses import (
+    GREETING_PATTERNS, SERVICE_INQUIRY_PATTERNS, OTHER_TOPICS, DAILY_CONVERSATION,
+    PRICE_KEYWORDS, INFO_KEYWORDS,
+)
+from src.preprocessing.kb_data_hub.qna_dataset_maker import QUERY_TEMPLATES, TIME_REFERENCES
+from src.preprocessing.ministry_of_land.ministry_legal_dong_pipeline import load_legal_dong_codes
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+# 학습된 모델 저장 경로 (없으면 최초 사용 시 프로세스 내에서 학습)
+INTENT_MODEL_PATH = os.getenv("INTENT_MODEL_PATH",
+                              os.path.join(PROJECT_ROOT, "datasets", "models", "intent_classifier.joblib"))
+# 이 값 미만의 확신도는 LLM 으로 분류를 넘김
+INTENT_CONFIDENCE_THRESHOLD = float(os.getenv("INTENT_CONFIDENCE_THRESHOLD", "0.7"))
+
+KB_REGION_PATH = os.path.join(PROJECT_ROOT, "datasets", "kb_real_estate_data", "kb_region.csv")
+LEGAL_DONG_PATH = os.path.join(PROJECT_ROOT, "datasets", "ministry_of_land", "legal_dong_list.txt")
+QNA_DATASET_PATH = os.path.join(PROJECT_ROOT, "datasets", "qna_dataset", "nlp_parsing_qna_dataset_ver0.5.csv")
+QNA_INPUT_PREFIX = "다음 유저의 질문을 파싱하시오:"
+
+# 학습 문장 템플릿
+PRICE_EXTRA_TEMPLATES = [
+    "{region} {keyword} 알려줘",
+    "{region} 아파트 {keyword} 얼마야?",
+    "{region} {keyword} 궁금해",
+    "{time_reference} {region} {keyword} 어느 정도야?",
+]
+INFO_TEMPLATES = [
+    "{region} 부동산 {keyword} 알려줘",
+    "{region} 아파트 {keyword} 어때?",
+    "{time_reference} {region} 부동산 {keyword} 궁금해",
+    "{region} 집값 {keyword} 어떻게 될까?",
+    "{keyword} 관련 부동산 뉴스 있어?",
+    "{region} 재건축 {keyword} 알려줄래?",
+    "부동산 {keyword} 어떻게 보고 있어?",
+]
+CONVERSATION_TEMPLATES = [
+    "{pattern}",
+    "{pattern}!",
+    "{pattern} 두껍아",
+    "{pattern}요",
+    "음 {pattern}",
+]
+TOPIC_TEMPLATES = [
+    "오늘 {pattern} 어때?",
+    "{pattern} 추천해줘",
+    "{pattern} 얘기 좀 하자",
+    "요즘 {pattern} 뭐가 재밌어?",
+]
+SERVICE_TEMPLATES = [
+    "너 {pattern}?",
+    "{pattern} 알려줘",
+    "두껍이는 {pattern} 거야?",
+]
+
+
+def load_region_names(sample_size: int = 400, seed: int = 42):
+    """
+    KB 지역명 + 법정동 시군구/읍면동 이름 일부를 학습용 지역명으로 사용합니다.
+    """
+    names = pd.read_csv(KB_REGION_PATH, dtype=str)["region_name_kor"].dropna().tolist()
+    if os.path.exists(LEGAL_DONG_PATH):
+        df = load_legal_dong_codes(LEGAL_DONG_PATH)
+        df = df[df["is_active"]]
+        legal_names = sorted({name.split()[-1] for name in df["name"] if " " in name})
+        names += random.Random(seed).sample(legal_names, min(sample_size, len(legal_names)))
+    return names
+
+
+def _natural_date(rng: random.Random):
+    # qna_dataset_maker.format_date_natural 과 같은 형식 (재현 가능하도록 rng 사용)
+    year, month, day = rng.randint(2010, 2026), rng.randint(1, 12), rng.randint(1, 28)
+    return rng.choice([
+        f"{year}년", f"{month}월", f"{day}일",
+        f"{year}년 {month}월", f"{year}년 {month}월 {day}일", f"{month}월 {day}일",
+    ])
+
+
+def build_training_data(samples_per_label: int = 1500, seed: int = 42):
+    """
+    qna_dataset_maker 템플릿, mock_responses 패턴, 키워드 목록으로 (문장, 라벨) 학습 데이터를 생성합니다.
+    qna_dataset_maker 가 만든 CSV 가 있으면 PRICE 문장으로 함께 사용합니다.
+    """
+    rng = random.Random(seed)
+    regions = load_region_names(seed=seed)
+    texts, labels = [], []
+
+    def fill(template, **kwargs):
+        return " ".join(template.format(
+            region=rng.choice(regions),
+            date=_natural_date(rng),
+            time_reference=rng.choice(TIME_REFERENCES),
+            **kwargs
+        ).split())
+
+    price_templates = QUERY_TEMPLATES["sale"] + QUERY_TEMPLATES["rent"]
+    for _ in range(samples_per_label):
+        if rng.random() < 0.7:
+            texts.append(fill(rng.choice(price_templates)))
+        else:
+            texts.append(fill(rng.choice(PRICE_EXTRA_TEMPLATES), keyword=rng.choice(PRICE_KEYWORDS)))
+        labels.append("PRICE")
+
+    if os.path.exists(QNA_DATASET_PATH):
+        qna = pd.read_csv(QNA_DATASET_PATH, encoding="utf-8-sig")
+        for text in qna["input"].dropna().sample(frac=1, random_state=seed).head(samples_per_label):
+            texts.append(text.replace(QNA_INPUT_PREFIX, "").strip())
+            labels.append("PRICE")
+
+    for _ in range(samples_per_label):
+        texts.append(fill(rng.choice(INFO_TEMPLATES), keyword=rng.choice(INFO_KEYWORDS)))
+        labels.append("INFO")
+
+    conversation_groups = [
+        (GREETING_PATTERNS + DAILY_CONVERSATION, CONVERSATION_TEMPLATES),
+        (OTHER_TOPICS, TOPIC_TEMPLATES),
+        (SERVICE_INQUIRY_PATTERNS, SERVICE_TEMPLATES),
+    ]
+    for _ in range(samples_per_label):
+        patterns, templates = rng.choice(conversation_groups)
+        texts.append(fill(rng.choice(templates), pattern=rng.choice(patterns)))
+        labels.append("N")
+
+    return texts, labels
+
+
+# 문자 n-gram TF-IDF + 로지스틱 회귀 질문 의도 분류기
+# 라벨: N(부동산 무관), PRICE(정형적 가격 질문), INFO(뉴스/전망 등 비정형 질문)
+class IntentClassifier:
+    def __init__(self, model_path: str = INTENT_MODEL_PATH, threshold: float = INTENT_CONFIDENCE_THRESHOLD):
+        self.model_path = model_path
+        self.threshold = threshold
+        self.pipeline = None
+        self._lock = threading.Lock()
+        # 추론용으로 분리한 벡터라이저/가중치 (파이프라인 검증 오버헤드 없이 바로 계산)
+        self._vectorizer = None
+        self._coef = None
+        self._intercept = None
+        self._classes = None
+
+    @staticmethod
+    def build_pipeline():
+        return make_pipeline(
+            TfidfVectorizer(analyzer="char_wb", ngram_range=(1, 3), sublinear_tf=True, lowercase=True),
+            LogisticRegression(max_iter=1000, C=5.0, class_weight="balanced"),
+        )
+
+    def train(self, texts=None, labels=None):
+        if texts is None:
+            texts, labels = build_training_data()
+        pipeline = self.build_pipeline()
+        pipeline.fit(texts, labels)
+        self._bind(pipeline)
+        return self
+
+    def _bind(self, pipeline):
+        vectorizer, model = pipeline.steps[0][1], pipeline.steps[-1][1]
+        self._vectorizer = vectorizer
+        self._coef = np.ascontiguousarray(model.coef_.T)
+        self._intercept = model.intercept_
+        self._classes = [str(label) for label in model.classes_]
+        self.pipeline = pipeline
+
+    def save(self, path: str = None):
+        path = path or self.model_path
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        joblib.dump(self.pipeline, path)
+        return path
+
+    def ensure_ready(self):
+        """
+        저장된 모델이 있으면 불러오고, 없으면 프로세스 내에서 학습합니다. (최초 1회)
+        """
+        if self.pipeline is not None:
+            return
+        with self._lock:
+            if self.pipeline is not None:
+                return
+            if os.path.exists(self.model_path):
+                self._bind(joblib.load(self.model_path))
+            else:
+                started = time.perf_counter()
+                self.train()
+                logger.info("질문 의도 분류기 학습 완료: %.2f초", time.perf_counter() - started)
+
+    def classify(self, text: str):
+        """
+        Returns:
+            (라벨, 확신도) - 라벨은 'N', 'PRICE', 'INFO' 중 하나
+        """
+        self.ensure_ready()
+        # 다항 로지스틱 회귀: softmax(x·W + b)
+        scores = (self._vectorizer.transform([text]) @ self._coef).ravel() + self._intercept
+        scores = np.exp(scores - scores.max())
+        probabilities = scores / scores.sum()
+        best = int(probabilities.argmax())
+        return self._classes[best], float(probabilities[best])
+
+    def predict(self, text: str):
+        """
+        확신도가 임계값 이상이면 라벨을, 아니면 None 을 반환합니다. (None 이면 LLM 으로 분류)
+        """
+        label, confidence = self.classify(text)
+        return label if confidence >= self.threshold else None
+
+
+intent_classifier = IntentClassifier()
+
+
+if __name__ == "__main__":
+    texts, labels = build_training_data()
+    train_texts, test_texts, train_labels, test_labels = train_test_split(
+        texts, labels, test_size=0.2, random_state=42, stratify=labels
+    )
+    classifier = IntentClassifier().train(train_texts, train_labels)
+    print(f"검증 정확도: {classifier.pipeline.score(test_texts, test_labels):.4f}")
+
+    classifier.train(texts, labels)
+    print(f"모델 저장 완료: {classifier.save()}")
@@ -5,6 +5,7 @@ from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
 from src.database.models.database_model import PropertyPriceData, Prediction
 from src.database.database import SessionLocal
+from src.database.notifications import notify_kb_data_updated
 
 
 # 기준 시점의 가격을 DB에서 가져오는 함수 (2022-01-10 기준)
@@ -138,6 +139,9 @@ def run_prediction_pipeline():
     # 2. rent 예측
     predict_future_property_prices(session, "rent")
 
+    # 3. API 서버에 예측 데이터 갱신 알림
+    notify_kb_data_updated(session, "kb_prediction")
+
     print("All predictions have been processed.")
 
 
@@ -1,6 +1,7 @@
 from src.preprocessing.kb_data_hub.api_integration import process_and_insert_data_with_interpolation
 from src.preprocessing.kb_data_hub.data_filling import fill_avg_price_with_index_based_calculation
 from src.database.database import SessionLocal
+from src.database.notifications import notify_kb_data_updated
 
 
 def run_pipeline():
@@ -13,6 +14,9 @@ def run_pipeline():
         # 2. NaN avg_price 값 보강
         fill_avg_price_with_index_based_calculation(session)
         print("NaN avg_price 데이터를 지수 기반으로 보강 완료했습니다.")
+
+        # 3. API 서버에 데이터 갱신 알림
+        notify_kb_data_updated(session, "kb_property_price_data")
     except Exception as e:
         print(f"데이터 처리 중 오류 발생: {e}")
     finally:
@@ -35,33 +35,37 @@ def parse_time_reference(natural_reference, current_date):
     return current_date
 
 
-def generate_real_estate_queries():
-    # 문장 템플릿
-    templates = {
-        "sale": [
-            "{date}에 {region}의 아파트 매매가격이 어느정도 되죠?",
-            "{date}에는 매매가 얼마지? {region}의 기록을 알려줘",
-            "{region}지역 {date} 시점의 매매가는 얼마니",
-            "{region}의 매매가가 궁금해. {date} 시점에 대해 알려줄래?",
-            "매매가격을 알고 싶어. {date}의 {region}을 알려줘",
-            "매매가를 알려줘. {region}지역의 {date} 때.",
-            "매매가격이 {date} 얼마나 되니?",
-            "{date}에 {region}의 매매가를 알려줘",
-            "{time_reference} {region}의 아파트 매매가격은 얼마인가요?"  # 자연어 표현 추가
-        ],
-        "rent": [
-            "{date}에 {region}의 아파트 전세가격이 어느정도 되죠?",
-            "{date}에는 전세가 얼마지? {region}의 기록을 알려줘",
-            "{region}지역 {date} 시점의 전세가는 얼마니",
-            "{region}의 전세가가 궁금해. {date} 시점에 대해 알려줄래?",
-            "전세가격을 알고 싶어. {date}의 {region}을 알려줘",
-            "전세가를 알려줘. {region}지역의 {date} 때.",
-            "전세가격이 {date} 얼마나 되니?",
-            "{date}에 {region}의 전세가를 알려줘",
-            "{time_reference} {region}의 아파트 전세가격은 얼마인가요?"  # 자연어 표현 추가
-        ]
-    }
+# 문장 템플릿 (질문 의도 분류기 학습 데이터로도 사용)
+QUERY_TEMPLATES = {
+    "sale": [
+        "{date}에 {region}의 아파트 매매가격이 어느정도 되죠?",
+        "{date}에는 매매가 얼마지? {region}의 기록을 알려줘",
+        "{region}지역 {date} 시점의 매매가는 얼마니",
+        "{region}의 매매가가 궁금해. {date} 시점에 대해 알려줄래?",
+        "매매가격을 알고 싶어. {date}의 {region}을 알려줘",
+        "매매가를 알려줘. {region}지역의 {date} 때.",
+        "매매가격이 {date} 얼마나 되니?",
+        "{date}에 {region}의 매매가를 알려줘",
+        "{time_reference} {region}의 아파트 매매가격은 얼마인가요?"  # 자연어 표현 추가
+    ],
+    "rent": [
+        "{date}에 {region}의 아파트 전세가격이 어느정도 되죠?",
+        "{date}에는 전세가 얼마지? {region}의 기록을 알려줘",
+        "{region}지역 {date} 시점의 전세가는 얼마니",
+        "{region}의 전세가가 궁금해. {date} 시점에 대해 알려줄래?",
+        "전세가격을 알고 싶어. {date}의 {region}을 알려줘",
+        "전세가를 알려줘. {region}지역의 {date} 때.",
+        "전세가격이 {date} 얼마나 되니?",
+        "{date}에 {region}의 전세가를 알려줘",
+        "{time_reference} {region}의 아파트 전세가격은 얼마인가요?"  # 자연어 표현 추가
+    ]
+}
+
+# 자연어 시간 표현
+TIME_REFERENCES = ["옛날", "과거", "지금", "요즘", "요새", "나중에", "미래에", "언젠가", ""]
 
+
+def generate_real_estate_queries():
     # 현재 날짜
     current_date = datetime.now().date()
 
@@ -91,12 +95,12 @@ def generate_real_estate_queries():
 
             if region_name:  # 지역 이름이 유효한 경우
                 # 랜덤으로 자연어 표현 선택
-                natural_reference = random.choice(["옛날", "과거", "지금", "요즘", "요새", "나중에", "미래에", "언젠가", ""])
+                natural_reference = random.choice(TIME_REFERENCES)
                 parsed_date = parse_time_reference(natural_reference, current_date)
                 natural_date = format_date_natural(parsed_date)
 
                 # 무작위 선택
-                template = random.choice(templates[price_type])  # 가격 타입에 맞는 템플릿 선택
+                template = random.choice(QUERY_TEMPLATES[price_type])  # 가격 타입에 맞는 템플릿 선택
 
                 # 결과 추가
                 input_sentence = "다음 유저의 질문을 파싱하시오:" + template.format(date=natural_date, region=region_name, time_reference=natural_reference)
@@ -0,0 +1,29 @@
+import argparse
+import asyncio
+import json
+
+from src.api.services.korea_land_sync import KOREA_LAND_DATASETS, KOREA_LAND_SYNC_CONCURRENCY, \
+    KOREA_LAND_SYNC_PER_PAGE, sync_all
+from src.api.services.public_data_client import public_data_client
+from src.api.utils.logging_config import configure_logging
+
+
+# 한국부동산원 데이터셋을 로컬 테이블로 동기화 (이전 실행 이후 추가된 페이지만 조회)
+async def run(datasets, per_page: int, concurrency: int, full: bool):
+    try:
+        return await sync_all(datasets, per_page=per_page, concurrency=concurrency, full=full)
+    finally:
+        await public_data_client.close()
+
+
+if __name__ == "__main__":
+    configure_logging()
+    parser = argparse.ArgumentParser(description="한국부동산원 매매/전세 가격지수 데이터셋 동기화")
+    parser.add_argument("--dataset", nargs="*", choices=list(KOREA_LAND_DATASETS), help="동기화할 데이터셋 (없으면 전체)")
+    parser.add_argument("--per-page", type=int, default=KOREA_LAND_SYNC_PER_PAGE, help="요청당 행 수")
+    parser.add_argument("--concurrency", type=int, default=KOREA_LAND_SYNC_CONCURRENCY, help="동시에 요청할 페이지 수")
+    parser.add_argument("--full", action="store_true", help="high-water mark 를 무시하고 처음부터 다시 동기화")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.dataset, args.per_page, args.concurrency, args.full))
+    print(json.dumps(results, ensure_ascii=False, indent=2))
@@ -0,0 +1,69 @@
+import argparse
+import asyncio
+import logging
+import sys
+
+from src.api.services.apartment_trade_store import APARTMENT_TRADE_UPSERT_BATCH, upsert_apartment_trades
+from src.api.services.ministry_trade_fetcher import MinistryTradeFetcher, load_lawd_codes, month_range, plan_jobs, \
+    to_ndjson
+from src.api.services.public_data_client import public_data_client
+from src.api.utils.logging_config import configure_logging
+from src.database.database import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+# 조회한 거래를 apartment_trade 테이블에 저장
+async def save_trades(records):
+    async with AsyncSessionLocal() as db:
+        saved = await upsert_apartment_trades(db, records)
+        await db.commit()
+    return saved
+
+
+# 지역 x 월 아파트 실거래가를 일괄 조회해 NDJSON 으로 저장 (save 이면 apartment_trade 테이블에도 upsert)
+async def run(start_ymd: str, end_ymd: str, prefixes, output, max_jobs: int, save: bool = False):
+    months = month_range(start_ymd, end_ymd)
+    async with AsyncSessionLocal() as db:
+        lawd_codes = await load_lawd_codes(db, prefixes)
+    jobs = plan_jobs(lawd_codes, months, max_jobs=max_jobs)
+    logger.info("실거래가 일괄 조회 시작: 지역 %d개 x %d개월 = %d건", len(lawd_codes), len(months), len(jobs))
+
+    pending, saved = [], 0
+    try:
+        async for record in MinistryTradeFetcher().fetch(jobs):
+            if "summary" in record:
+                logger.info("실거래가 일괄 조회 완료: %s", record["summary"])
+            elif save and "error" not in record:
+                pending.append(record)
+                if len(pending) >= APARTMENT_TRADE_UPSERT_BATCH:
+                    saved += await save_trades(pending)
+                    pending = []
+            if output is not None:
+                output.write(to_ndjson(record))
+        if pending:
+            saved += await save_trades(pending)
+        if save:
+            logger.info("apartment_trade 저장 완료: %d건", saved)
+    finally:
+        await public_data_client.close()
+
+
+if __name__ == "__main__":
+    configure_logging()
+    parser = argparse.ArgumentParser(description="국토교통부 아파트 실거래가 지역 x 월 일괄 조회 (NDJSON)")
+    parser.add_argument("--start", required=True, help="시작 계약년월 (YYYYMM)")
+    parser.add_argument("--end", required=True, help="종료 계약년월 (YYYYMM)")
+    parser.add_argument("--lawd-cd", nargs="*", help="LAWD_CD 또는 법정동 코드 접두어 (없으면 전국)")
+    parser.add_argument("--output", help="저장할 파일 경로 (없으면 표준 출력)")
+    parser.add_argument("--save", action="store_true", help="apartment_trade 테이블에 upsert")
+    parser.add_argument("--quiet", action="store_true", help="NDJSON 을 출력하지 않음 (--save 와 함께 사용)")
+    parser.add_argument("--max-jobs", type=int, default=0, help="(지역, 월) 조합 상한 (0 이면 제한 없음)")
+    args = parser.parse_args()
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            asyncio.run(run(args.start, args.end, args.lawd_cd, f, args.max_jobs, args.save))
+    else:
+        output = None if args.quiet else sys.stdout
+        asyncio.run(run(args.start, args.end, args.lawd_cd, output, args.max_jobs, args.save))
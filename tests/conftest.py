@@ -0,0 +1,8 @@
+import os
+import sys
+
+# src 패키지 import 시 엔진을 만들 수 있도록 DB 접속 정보가 없으면 sqlite 로 대체 (테스트는 DB 에 접속하지 않음)
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("ASYNC_DATABASE_URL", "sqlite+aiosqlite://")
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
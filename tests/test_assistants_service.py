@@ -0,0 +1,51 @@
+import asyncio
+from types import SimpleNamespace
+
+from openai.types.beta import Assistant
+
+from src.api.services.assistant_tools import TOOL_DEFINITIONS
+from src.api.services.assistants_service import AssistantService
+
+
+class FakeAssistants:
+    def __init__(self, tools):
+        self.tools = tools
+        self.calls = 0
+
+    async def retrieve(self, assistant_id):
+        self.calls += 1
+        return Assistant.model_validate({"id": assistant_id, "created_at": 0, "model": "gpt-4o",
+                                         "object": "assistant", "tools": self.tools})
+
+
+def build_service(tools):
+    assistants = FakeAssistants(tools)
+    async_client = SimpleNamespace(beta=SimpleNamespace(assistants=assistants))
+    return AssistantService(client=object(), assistant_id="asst_test", async_client=async_client), assistants
+
+
+def test_run_tools_keep_assistant_tools():
+    service, assistants = build_service([
+        {"type": "file_search"},
+        {"type": "function", "function": {"name": "get_price", "parameters": {}}},
+        {"type": "function", "function": {"name": "lookup_school", "parameters": {"type": "object"}}},
+    ])
+
+    tools = asyncio.run(service.get_run_tools())
+    asyncio.run(service.get_run_tools())
+
+    assert assistants.calls == 1
+    assert tools[:2] == [{"type": "file_search"},
+                         {"type": "function", "function": {"name": "lookup_school", "parameters": {"type": "object"}}}]
+    # 같은 이름의 함수는 로컬 정의로 대체
+    assert tools[2:] == TOOL_DEFINITIONS
+
+
+def test_run_tools_retrieve_failure():
+    service, assistants = build_service([])
+
+    async def fail(assistant_id):
+        raise RuntimeError("unavailable")
+
+    assistants.retrieve = fail
+    assert asyncio.run(service.get_run_tools()) is None
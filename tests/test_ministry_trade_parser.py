@@ -0,0 +1,148 @@
+import asyncio
+from datetime import date
+
+import httpx
+import pytest
+
+from src.api.services.ministry_trade_fetcher import MinistryTradeFetcher
+from src.api.services.ministry_trade_parser import TradeParseError, TradeXmlParser, iter_trade_records, \
+    parse_trade_page, parse_trade_stream
+from src.api.services.public_data_client import MINISTRY, PublicDataClient, Upstream
+
+# 구 API (한글 태그, 금액에 쉼표와 공백)
+OLD_FORMAT = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<response>
+    <header><resultCode>00</resultCode><resultMsg>NORMAL SERVICE.</resultMsg></header>
+    <body>
+        <items>
+            <item>
+                <거래금액>    82,500</거래금액><건축년도>2008</건축년도><년>2024</년><법정동> 청운동</법정동>
+                <아파트>청운현대</아파트><월>3</월><일>5</일><전용면적>129.76</전용면적><지번>108</지번>
+                <지역코드>11110</지역코드><층>2</층><법정동읍면동코드>10100</법정동읍면동코드>
+                <해제여부>O</해제여부><해제사유발생일>24.04.01</해제사유발생일>
+            </item>
+            <item>
+                <거래금액>61,000</거래금액><년>2024</년><월>3</월><일>17</일><전용면적>84.9</전용면적>
+                <아파트>경희궁의아침</아파트><층>7</층><해제여부> </해제여부>
+            </item>
+        </items>
+        <numOfRows>10</numOfRows><pageNo>1</pageNo><totalCount>2</totalCount>
+    </body>
+</response>""".encode("utf-8")
+
+# 신 API (영문 태그, 결과 코드 '000')
+NEW_FORMAT = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<response>
+    <header><resultCode>000</resultCode><resultMsg>OK</resultMsg></header>
+    <body>
+        <items>
+            <item>
+                <aptDong>101</aptDong><aptNm>청운현대</aptNm><aptSeq>11110-2203</aptSeq><buildYear>2008</buildYear>
+                <cdealDay>20240401</cdealDay><cdealType>O</cdealType><dealAmount>82,500</dealAmount>
+                <dealDay>5</dealDay><dealMonth>3</dealMonth><dealYear>2024</dealYear><dealingGbn>중개거래</dealingGbn>
+                <excluUseAr>129.76</excluUseAr><floor>2</floor><jibun>108</jibun><sggCd>11110</sggCd>
+                <umdCd>10100</umdCd><umdNm>청운동</umdNm>
+            </item>
+        </items>
+        <numOfRows>10</numOfRows><pageNo>1</pageNo><totalCount>1</totalCount>
+    </body>
+</response>""".encode("utf-8")
+
+GATEWAY_ERROR = """<OpenAPI_ServiceResponse>
+    <cmmMsgHeader>
+        <errMsg>SERVICE ERROR</errMsg>
+        <returnAuthMsg>SERVICE_KEY_IS_NOT_REGISTERED_ERROR</returnAuthMsg>
+        <returnReasonCode>30</returnReasonCode>
+    </cmmMsgHeader>
+</OpenAPI_ServiceResponse>""".encode("utf-8")
+
+RESULT_ERROR = """<?xml version="1.0" encoding="UTF-8"?>
+<response>
+    <header><resultCode>03</resultCode><resultMsg>NO_DATA</resultMsg></header>
+</response>""".encode("utf-8")
+
+
+@pytest.mark.parametrize("content, message", [
+    (GATEWAY_ERROR, "returnReasonCode=30"),
+    (b"<OpenAPI_ServiceResponse><returnReasonCode>22</returnReasonCode></OpenAPI_ServiceResponse>",
+     "root=OpenAPI_ServiceResponse"),
+    (b"<response><header><errMsg>LIMITED</errMsg></header></response>", "errMsg=LIMITED"),
+    (RESULT_ERROR, "03 NO_DATA"),
+    (b"", "XML"),
+    (b"<response><items><item>", "XML"),
+])
+def test_parse_trade_page_rejects_error_payloads(content, message):
+    with pytest.raises(TradeParseError, match=message):
+        parse_trade_page(content, "11110")
+
+
+def test_parse_trade_page_old_format():
+    records, total_count = parse_trade_page(OLD_FORMAT, "11110")
+
+    assert total_count == 2
+    first, second = records
+    assert first["deal_amount"] == 82500
+    assert first["exclusive_area"] == 129.76
+    assert first["deal_date"] == date(2024, 3, 5)
+    assert first["legal_dong_name"] == "청운동"
+    assert first["legal_dong_code"] == "1111010100"
+    assert first["is_canceled"] is True
+    assert first["canceled_date"] == date(2024, 4, 1)
+    # 응답에 지역코드가 없으면 요청한 lawd_cd, 없는 필드는 None
+    assert second["lawd_cd"] == "11110"
+    assert second["legal_dong_code"] is None
+    assert second["jibun"] is None
+    assert second["is_canceled"] is False
+
+
+def test_parse_trade_page_new_format_matches_old():
+    (new,), total_count = parse_trade_page(NEW_FORMAT, "11110")
+    old = parse_trade_page(OLD_FORMAT, "11110")[0][0]
+
+    assert total_count == 1
+    assert new["apt_dong"] == "101"
+    assert new["apt_seq"] == "11110-2203"
+    assert new["deal_type"] == "중개거래"
+    for field in ("lawd_cd", "legal_dong_code", "legal_dong_name", "jibun", "apt_name", "deal_amount",
+                  "exclusive_area", "floor", "build_year", "deal_date", "is_canceled", "canceled_date"):
+        assert new[field] == old[field], field
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+def test_parse_trade_page_chunked_input(chunk_size):
+    expected = parse_trade_page(OLD_FORMAT, "11110")
+    # 멀티바이트 문자가 조각 경계에서 잘려도 같은 결과
+    assert list(iter_trade_records(OLD_FORMAT, TradeXmlParser("11110"), chunk_size=chunk_size)) == expected[0]
+
+    async def chunks():
+        for start in range(0, len(OLD_FORMAT), chunk_size):
+            yield OLD_FORMAT[start:start + chunk_size]
+
+    assert asyncio.run(parse_trade_stream(chunks(), "11110")) == expected
+
+
+def ministry_client(handler):
+    client = PublicDataClient([Upstream(MINISTRY, "http://ministry.test", timeout=1, max_concurrency=2,
+                                        queue_timeout=1)])
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+def test_fetcher_streams_page():
+    def handler(request):
+        return httpx.Response(200, stream=httpx.ByteStream(NEW_FORMAT))
+
+    fetcher = MinistryTradeFetcher(rate_limit=1000, retries=0, client=ministry_client(handler))
+    (record,), total_count = asyncio.run(fetcher.fetch_page("11110", "202403", 1))
+
+    assert total_count == 1
+    assert record["apt_name"] == "청운현대"
+
+
+def test_fetcher_rejects_gateway_error():
+    def handler(request):
+        return httpx.Response(200, content=GATEWAY_ERROR)
+
+    fetcher = MinistryTradeFetcher(rate_limit=1000, retries=0, client=ministry_client(handler))
+    with pytest.raises(TradeParseError, match="returnReasonCode=30"):
+        asyncio.run(fetcher.fetch_page("11110", "202403", 1))
@@ -0,0 +1,71 @@
+import asyncio
+from datetime import date, timedelta
+
+import numpy as np
+
+from src.api.services import assistant_tools
+from src.api.services.assistant_tools import PRICE_TOOL_MAX_POINTS, get_price
+from src.api.services.price_series_store import PriceSeries
+from src.api.utils.analytics import summarize
+from src.api.utils.parsers import format_price_data
+
+START = date(2024, 1, 1)
+
+
+def build_series(count: int = 20):
+    rows = [(START + timedelta(days=7 * i), None if i == 3 else 50000 + i * 37, i >= count - 4)
+            for i in range(count)]
+    return PriceSeries.from_rows("1100000000", "sale", rows)
+
+
+def test_from_rows_and_to_records():
+    series = build_series()
+    records = series.to_records()
+
+    assert len(series) == 20
+    assert np.isnan(series.prices[3])
+    assert records[0] == {"region": "1100000000", "date": "2024-01-01", "deal_type": "sale",
+                          "price": 50000.0, "is_prediction": False}
+    assert records[3]["price"] is None
+    assert records[-1]["is_prediction"] is True
+
+
+def test_tail():
+    series = build_series()
+
+    assert series.tail(5).to_records() == series.to_records()[-5:]
+    assert len(series.tail(50)) == len(series)
+
+
+def test_series_matches_records():
+    series = build_series()
+    complete = series.tail(10)
+
+    assert summarize(series) == summarize(series.to_records())
+    assert format_price_data("서울", complete) == format_price_data("서울", complete.to_records())
+    # 가격이 없는 날짜(NaN / None)는 목록에서 제외
+    assert format_price_data("서울", series) == format_price_data("서울", series.to_records())
+    assert "nan" not in format_price_data("서울", series)
+    assert format_price_data("서울", series).count("\n") == len(series) - 2
+
+
+def test_missing_prices_excluded_from_mean():
+    rows = [(START, 100, False), (START + timedelta(days=7), None, True), (START + timedelta(days=14), 200, True)]
+    series = PriceSeries.from_rows("1100000000", "sale", rows)
+
+    assert series.mean_price() == 150
+    assert series.to_records()[1]["price"] is None
+    assert PriceSeries.from_rows("1100000000", "sale", [(START, None, True)]).mean_price() == 0
+
+
+def test_get_price_converts_at_json_boundary(monkeypatch):
+    series = build_series()
+
+    async def fake_get_property_price(region, price_type, date_info, db):
+        return series, series.mean_price()
+
+    monkeypatch.setattr(assistant_tools, "get_property_price", fake_get_property_price)
+    result = asyncio.run(get_price("서울"))
+
+    assert result["summary"] == summarize(series)
+    assert result["recent"] == series.to_records()[-PRICE_TOOL_MAX_POINTS:]
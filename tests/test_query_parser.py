@@ -0,0 +1,74 @@
+from datetime import date
+
+import pytest
+
+from src.api.services.region_resolver import region_resolver
+from src.api.utils.query_parser import parse_query, parse_time_info
+
+TODAY = date(2024, 6, 15)
+
+KB_REGIONS = [
+    ("1100000000", "서울", "Seoul"),
+    ("2600000000", "부산", "Busan"),
+    ("2700000000", "대구", "Daegu"),
+    ("4100000000", "경기", "Gyeonggi"),
+    ("4400000000", "충남", "Chungnam"),
+    ("4600000000", "전남", "Jeonnam"),
+]
+
+LEGAL_DONGS = [
+    ("2635000000", "부산광역시 해운대구"),
+    ("2635010500", "부산광역시 해운대구 우동"),
+    ("4150000000", "경기도 이천시"),
+    ("4481000000", "충청남도 예산군"),
+    ("4687000000", "전라남도 영광군"),
+]
+
+
+@pytest.fixture(autouse=True)
+def loaded_region_resolver():
+    region_resolver.build(KB_REGIONS)
+    region_resolver.build_legal_dong(LEGAL_DONGS)
+    yield
+    region_resolver.invalidate()
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("2024년 3월 서울 아파트 매매가", "2024-03"),
+    ("2023년 서울 전세", "2023"),
+    ("24년 3월 전세 가격", "2024-03"),
+    ("2024.3.5 매매", "2024-03-05"),
+    ("작년 서울 아파트 가격", "2023"),
+    ("작년 3월 매매가", "2023-03"),
+    ("요즘 서울 전세 어때?", "현재"),
+    ("내년 부산 집값", "2025"),
+    ("지난달 매매가", "2024-05"),
+    ("3개월 전 전세가", "2024-03"),
+    ("2년 후 매매가", "2026"),
+    ("서울 2년 전세 가격", "현재"),
+    ("20년 된 아파트 매매가", "현재"),
+    ("현재", "현재"),
+    ("2024-03", "2024-03"),
+])
+def test_parse_time_info(text, expected):
+    assert parse_time_info(text, TODAY) == expected
+
+
+@pytest.mark.parametrize("message, region, deal_type, time_info", [
+    ("2024년 3월 서울 아파트 매매가 알려줘", "서울", "sale", "2024-03"),
+    ("요즘 부산 전세 어때?", "부산", "rent", "현재"),
+    ("해운대구 아파트 작년 매매가", "부산", "sale", "2023"),
+    ("대구 전세 가격", "대구", "rent", "현재"),
+    ("이천시 아파트 전세", "경기", "rent", "현재"),
+])
+def test_parse_query(message, region, deal_type, time_info):
+    assert parse_query(message, TODAY) == {"지역": region, "매매/전세 여부": deal_type, "시간 정보": time_info}
+
+
+@pytest.mark.parametrize("message", [
+    "예산 3억인데 전세 어디가 좋아?",
+    "이천만원 가지고 전세 가능?",
+    "영광스럽게도 집값이 올랐네",
+])
+def test_parse_query_ignores_common_words(message):
+    assert parse_query(message, TODAY) is None